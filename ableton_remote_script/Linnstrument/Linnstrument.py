@@ -12,9 +12,14 @@ import Live
 
 try:
     from .config import LINNSTRUMENT_BASE_NOTE, LINNSTRUMENT_ROW_OFFSET, LINNSTRUMENT_COLUMN_OFFSET
+    from .config import LINNSTRUMENT_COLUMNS, LINNSTRUMENT_ROWS
+    from .grid_geometry import get_geometry
     from .scales import NOTE_NAMES, get_scale_notes
     from .linnstrument_ableton import LinnstrumentAbletonMIDI
-    from .led_manager import LEDManager
+    from .led_manager import LEDManager, resolve_color
+    from .change_dispatcher import ChangeDispatcher
+    from .device_index import TrackDeviceIndex
+    from .pattern_store import PatternStore
     MODULES_AVAILABLE = True
 except ImportError as e:
     MODULES_AVAILABLE = False
@@ -78,18 +83,31 @@ class Linnstrument(ControlSurface):
         self.current_root = None
         self.current_scale = None
 
+        # Each mode's grid, kept current while the other mode is shown;
+        # switching modes commits it as a diff
+        self._keyboard_frame = None
+        self._drum_frame = None  # Drawn for _drum_rack (None until there is one)
+
         # Drum mode state
         self._drum_rack = None
+        self._pad_occupancy = None  # Loaded pads of the drum rack (chains listeners keep it current)
         self._selected_pad = 0  # 0-15
-        self._sequences = [[0 for _ in range(16)] for _ in range(16)]  # 16 pads x 16 steps
+        self._patterns = PatternStore(pads=16, max_patterns=1, length=16)  # 16 pads x 16 steps (display only)
         self._is_playing = False
         self._current_step = 0
         self._needs_led_update = False
 
         # Add listeners
-        self.song().add_root_note_listener(self._on_scale_changed)
-        self.song().add_scale_name_listener(self._on_scale_changed)
-        self.song().view.add_selected_track_listener(self._on_track_changed)
+        # Listeners only mark what changed; update_display handles each burst once
+        self._dispatcher = ChangeDispatcher()
+
+        # Each track's drum rack, so arrowing through tracks doesn't rescan devices
+        self._device_index = TrackDeviceIndex(on_change=self._on_devices_changed,
+                                              on_pads_change=self._on_pads_changed)
+        self.song().add_root_note_listener(self._dispatcher.listener(self._on_changed, 'root_note'))
+        self.song().add_scale_name_listener(self._dispatcher.listener(self._on_changed, 'scale_name'))
+        self.song().view.add_selected_track_listener(
+            self._dispatcher.listener(self._on_changed, 'selected_track'))
         self.log_message("Track change listener registered successfully")
 
         # DON'T enable User Firmware Mode - it changes note behavior!
@@ -115,11 +133,14 @@ class Linnstrument(ControlSurface):
 
         # Remove listeners
         try:
-            self.song().remove_root_note_listener(self._on_scale_changed)
-            self.song().remove_scale_name_listener(self._on_scale_changed)
-            self.song().view.remove_selected_track_listener(self._on_track_changed)
+            self.song().remove_root_note_listener(self._dispatcher.listener(self._on_changed, 'root_note'))
+            self.song().remove_scale_name_listener(
+                self._dispatcher.listener(self._on_changed, 'scale_name'))
+            self.song().view.remove_selected_track_listener(
+                self._dispatcher.listener(self._on_changed, 'selected_track'))
         except:
             pass
+        self._device_index.clear()
 
         ControlSurface.disconnect(self)
 
@@ -138,29 +159,40 @@ class Linnstrument(ControlSurface):
         self._c_instance.send_midi((status, 101, 127))
         self._c_instance.send_midi((status, 100, 127))
 
-    def _on_scale_changed(self):
-        """Scale changed - update if in keyboard mode"""
-        if self._mode == 'keyboard':
+    def _on_changed(self, changes):
+        """Scale, selected track and/or its devices changed since the last tick"""
+        if 'selected_track' in changes or 'devices' in changes:
+            self.log_message("=== TRACK CHANGED - checking mode ===")
+            self._auto_switch_mode()
+        if 'root_note' in changes or 'scale_name' in changes:
+            # Re-render the keyboard frame (shown if in keyboard mode)
             self._update_keyboard_leds()
 
-    def _on_track_changed(self):
-        """Track changed - check if we should switch modes"""
-        self.log_message("=== TRACK CHANGED - checking mode ===")
-        self._auto_switch_mode()
+    def _on_devices_changed(self, track):
+        """A track's device chain changed - recheck the mode if it's the selected one"""
+        if track == self.song().view.selected_track:
+            self._dispatcher.mark(self._on_changed, 'devices')
+
+    def _on_pads_changed(self, drum_rack, note):
+        """A drum pad was loaded or cleared - update its cell, shown on the next tick"""
+        if drum_rack == self._drum_rack:
+            self._draw_drum_pad(note - 36)
+            if self._mode == 'drum':
+                self._needs_led_update = True
 
     def _auto_switch_mode(self):
         """Auto-switch to drum mode if drum rack detected"""
         track = self.song().view.selected_track
         self.log_message(f"Auto-switch mode check: track={track.name}, current_mode={self._mode}")
 
-        # Check for drum rack
-        has_drum_rack = False
-        if hasattr(track, 'devices'):
-            for device in track.devices:
-                if device.class_name == 'DrumGroupDevice':
-                    has_drum_rack = True
-                    self._drum_rack = device
-                    break
+        # Check for drum rack (cached per track, kept current by devices listeners)
+        drum_rack = self._device_index.drum_rack(track)
+        has_drum_rack = drum_rack is not None
+        if has_drum_rack and drum_rack != self._drum_rack:
+            # Another rack: its pads are drawn from scratch
+            self._drum_rack = drum_rack
+            self._pad_occupancy = self._device_index.pad_occupancy(drum_rack)
+            self._drum_frame = None
 
         self.log_message(f"Has drum rack: {has_drum_rack}")
 
@@ -180,7 +212,8 @@ class Linnstrument(ControlSurface):
         elif not has_drum_rack and self._mode != 'keyboard':
             self.log_message("No drum rack - switching to Keyboard Mode")
             self._mode = 'keyboard'
-            self._drum_rack = None
+            # The drum rack and its frame are kept (and kept current by the pad
+            # listener), so coming back to the same rack only sends the diff
             # Restore row offset to 5 (fifths) for keyboard mode
             self._send_nrpn(227, 5)
             self.linnstrument.row_offset = 5
@@ -198,112 +231,128 @@ class Linnstrument(ControlSurface):
     def _update_keyboard_leds(self):
         """Update LEDs for keyboard mode"""
         try:
-            # ALWAYS clear ALL LEDs first when switching to keyboard mode
-            self.led_manager.clear_all(force=True)
-
             # Get scale settings
             root = self.song().root_note
             scale_name = self.song().scale_name
 
-            # ALWAYS update when switching modes (don't skip if scale unchanged)
-            # if root == self.current_root and scale_name == self.current_scale:
-            #     return
+            # Re-render only when the scale changed; the stored frame is
+            # committed either way, so switching modes still redraws the grid
+            if (self._keyboard_frame is None or
+                    root != self.current_root or scale_name != self.current_scale):
+                self._keyboard_frame = self._render_keyboard_frame(root, scale_name)
+
+            if self._mode == 'keyboard':
+                self._keyboard_frame.commit()
+
+        except Exception as e:
+            self.log_message(f"Error updating keyboard LEDs: {e}")
 
-            self.current_root = root
-            self.current_scale = scale_name
+    def _render_keyboard_frame(self, root, scale_name):
+        """Build the keyboard frame for a scale (not displayed)"""
+        self.current_root = root
+        self.current_scale = scale_name
 
-            # Map scale name
-            our_scale_name = ABLETON_SCALE_MAP.get(
-                scale_name,
-                scale_name.lower().replace(' ', '_')
-            )
+        # Map scale name
+        our_scale_name = ABLETON_SCALE_MAP.get(
+            scale_name,
+            scale_name.lower().replace(' ', '_')
+        )
 
-            root_name = NOTE_NAMES[root]
-            self.log_message(f"Displaying scale: {root_name} {scale_name}")
+        root_name = NOTE_NAMES[root]
+        self.log_message(f"Displaying scale: {root_name} {scale_name}")
 
-            # Get scale notes
-            scale_notes = get_scale_notes(root, our_scale_name)
+        # Get scale notes
+        scale_notes = get_scale_notes(root, our_scale_name)
 
-            # Light scale notes (already cleared above)
-            # self.led_manager.clear_all()
+        # Light the scale as one frame: every cell not in the scale is
+        # turned off, and only cells that change are sent
+        frame = self.led_manager.begin_frame()
+        geometry = self._keyboard_geometry()
+        root_color, scale_color = resolve_color('red'), resolve_color('blue')
 
-            for note in scale_notes:
-                positions = self.linnstrument.get_position_for_note(note)
-                is_root = (note % 12) == root
-                color = 'red' if is_root else 'blue'
+        for note in scale_notes:
+            positions = geometry.positions_for_note(note)
+            is_root = (note % 12) == root
+            color = root_color if is_root else scale_color
 
-                for column, row in positions:
-                    self.led_manager.set_led(column, row, color)
+            for column, row in positions:
+                frame.set(column, row, color)
 
-        except Exception as e:
-            self.log_message(f"Error updating keyboard LEDs: {e}")
+        return frame
+
+    def _keyboard_geometry(self):
+        """Keyboard layout, which differs from the hardware's while in drum mode"""
+        return get_geometry(LINNSTRUMENT_BASE_NOTE, LINNSTRUMENT_ROW_OFFSET,
+                            LINNSTRUMENT_COLUMN_OFFSET, LINNSTRUMENT_COLUMNS, LINNSTRUMENT_ROWS)
 
     def _update_drum_leds(self):
         """Update LEDs for drum mode"""
         try:
-            # Clear all
-            self.led_manager.clear_all()
-
-            # Log which pads have samples (first time only)
-            if self._drum_rack and not hasattr(self, '_logged_drum_pads'):
-                self._logged_drum_pads = True
-                loaded_pads = []
-                for i in range(16):
-                    drum_note = 36 + i  # C2 = 36 (standard drum rack)
-                    if drum_note < len(self._drum_rack.drum_pads):
-                        drum_pad = self._drum_rack.drum_pads[drum_note]
-                        if hasattr(drum_pad, 'chains') and len(drum_pad.chains) > 0:
-                            loaded_pads.append(f"{i}(note{drum_note})")
-                self.log_message(f"Drum pads with samples: {loaded_pads}")
-
-            # Bottom 4 rows: 4x4 drum grid (pads 0-15, notes 36-51 = C2-D#3)
-            for row in range(4):
-                for col in range(4):
-                    pad_index = row * 4 + col
-                    color = self._get_drum_pad_color(pad_index)
-                    self.led_manager.set_led(col, row, color)
-
-            # Top 4 rows: 16-step sequencer (all rows show selected pad's sequence)
-            sequence = self._sequences[self._selected_pad]
-            for step in range(16):
-                is_active = sequence[step] > 0
-                is_current = (step == self._current_step and self._is_playing)
-
-                if is_current and is_active:
-                    color = 'white'  # Playing step
-                elif is_current:
-                    color = 'yellow'  # Playhead on empty
-                elif is_active:
-                    color = 'green'  # Active step
-                else:
-                    color = 'off'  # Empty
-
-                # Show same sequence on all 4 rows (like Push)
-                for seq_row in range(4, 8):
-                    self.led_manager.set_led(step, seq_row, color)
+            # Render only for a new drum rack; pad changes update the stored
+            # frame in place, so showing it is a diff against the grid
+            if self._drum_frame is None:
+                self._render_drum_frame()
+
+            if self._mode == 'drum':
+                self._drum_frame.commit()
 
         except Exception as e:
             self.log_message(f"Error updating drum LEDs: {e}")
 
+    def _render_drum_frame(self):
+        """Build the drum frame for the current rack (not displayed)"""
+        # Log which pads have samples (first time only)
+        if self._drum_rack and not hasattr(self, '_logged_drum_pads'):
+            self._logged_drum_pads = True
+            loaded_pads = [f"{i}(note{36 + i})" for i in range(16)
+                           if self._pad_occupancy.is_loaded(36 + i)]
+            self.log_message(f"Drum pads with samples: {loaded_pads}")
+
+        self._drum_frame = self.led_manager.begin_frame()
+
+        # Bottom 4 rows: 4x4 drum grid (pads 0-15, notes 36-51 = C2-D#3)
+        for pad_index in range(16):
+            self._draw_drum_pad(pad_index)
+
+        # Top 4 rows: 16-step sequencer (all rows show selected pad's sequence)
+        for step in range(16):
+            self._draw_drum_step(step)
+
+    def _draw_drum_pad(self, pad_index):
+        """Set a pad's cell in the drum frame (if there is one)"""
+        if self._drum_frame is None or not 0 <= pad_index < 16:
+            return
+        self._drum_frame.set(pad_index % 4, pad_index // 4, self._get_drum_pad_color(pad_index))
+
+    def _draw_drum_step(self, step):
+        """Set a step's column (rows 4-7) in the drum frame (if there is one)"""
+        if self._drum_frame is None:
+            return
+        is_active = self._patterns.pattern.velocity(self._selected_pad, step) > 0
+        is_current = (step == self._current_step and self._is_playing)
+
+        if is_current and is_active:
+            color = 'white'  # Playing step
+        elif is_current:
+            color = 'yellow'  # Playhead on empty
+        elif is_active:
+            color = 'green'  # Active step
+        else:
+            color = 'off'  # Empty
+
+        # Show same sequence on all 4 rows (like Push)
+        self._drum_frame.fill_region(step, step, 4, 7, color)
+
     def _get_drum_pad_color(self, pad_index):
         """Get color for drum pad (0-15)"""
         # Highlight selected pad
         if pad_index == self._selected_pad:
             return 'white'
 
-        # Check if pad has sample
-        if self._drum_rack:
-            try:
-                drum_note = 36 + pad_index  # C2 = 36 (standard drum rack)
-                if drum_note < len(self._drum_rack.drum_pads):
-                    drum_pad = self._drum_rack.drum_pads[drum_note]
-                    has_chains = hasattr(drum_pad, 'chains') and len(drum_pad.chains) > 0
-                    if has_chains:
-                        return 'green'  # Has sample
-                    else:
-                        return 'off'  # No sample
-            except Exception as e:
-                self.log_message(f"Error checking pad {pad_index} (note {drum_note}): {e}")
+        # Check if pad has sample (from the occupancy bitmap, not the rack)
+        drum_note = 36 + pad_index  # C2 = 36 (standard drum rack)
+        if self._pad_occupancy is not None and self._pad_occupancy.is_loaded(drum_note):
+            return 'green'  # Has sample
 
         return 'off'  # No drum rack or no sample
 
@@ -363,7 +412,16 @@ class Linnstrument(ControlSurface):
 
     def update_display(self):
         """Called periodically - update LEDs if needed"""
+        # One update for all scale/track changes since the last tick
+        self._dispatcher.dispatch()
+
         if self._needs_led_update:
             self._needs_led_update = False
             if self._mode == 'drum':
                 self._update_drum_leds()
+
+        # Advance LED animations (frame rate capped by the timeline)
+        self.led_manager.update_animations()
+
+        # Send queued LED writes, within the per-tick message budget
+        self.linnstrument.flush_leds()
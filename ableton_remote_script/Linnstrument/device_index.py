@@ -0,0 +1,201 @@
+"""
+Per-track device index for Linnstrument
+Answers "which drum rack does this track have" and "which of its pads are
+loaded" without walking devices or drum pads
+"""
+
+# Live class name of a drum rack
+DRUM_RACK_CLASS_NAME = 'DrumGroupDevice'
+
+
+class DrumPadOccupancy:
+    """
+    128-bit bitmap of a drum rack's loaded pads (pads with chains)
+
+    Built once from the rack's drum pads; a chains listener on each pad keeps
+    its bit current, so lookups never touch the Live object model.
+    """
+
+    def __init__(self, drum_rack, on_change=None):
+        """
+        Build the bitmap and listen to every pad
+
+        Args:
+            drum_rack: DrumGroupDevice
+            on_change: Optional function called with (drum_rack, note) when a
+                       pad is loaded or cleared (its bit is already updated)
+        """
+        self.drum_rack = drum_rack
+        self.on_change = on_change
+
+        # Bit n set = pad for MIDI note n has chains
+        self.bits = 0
+
+        # (pad, chains listener) pairs, kept for removal
+        self._listeners = []
+
+        for note, pad in enumerate(getattr(drum_rack, 'drum_pads', ())):
+            if len(pad.chains) > 0:
+                self.bits |= 1 << note
+            callback = self._pad_listener(pad, note)
+            pad.add_chains_listener(callback)
+            self._listeners.append((pad, callback))
+
+    def is_loaded(self, note):
+        """Check if the pad for a MIDI note has chains"""
+        return (self.bits >> note) & 1 == 1
+
+    def loaded_notes(self):
+        """MIDI notes of the loaded pads, lowest first"""
+        return [note for note in range(128) if (self.bits >> note) & 1]
+
+    def disconnect(self):
+        """Remove the pad listeners"""
+        for pad, callback in self._listeners:
+            try:
+                pad.remove_chains_listener(callback)
+            except Exception:
+                pass  # Rack was deleted
+        self._listeners = []
+
+    def _pad_listener(self, pad, note):
+        """chains listener for one pad"""
+        bit = 1 << note
+
+        def on_chains_changed():
+            if len(pad.chains) > 0:
+                self.bits |= bit
+            else:
+                self.bits &= ~bit
+            if self.on_change:
+                self.on_change(self.drum_rack, note)
+
+        return on_chains_changed
+
+
+class TrackDeviceIndex:
+    """
+    Cache of each track's drum rack, kept current by devices listeners
+
+    A track's device chain is scanned the first time it is looked up; after
+    that a devices listener drops the entry whenever the chain changes, so
+    the next lookup rescans. Moving through a large set therefore scans each
+    track once instead of on every selection change. Pad occupancy is kept
+    the same way, per drum rack.
+    """
+
+    def __init__(self, on_change=None, on_pads_change=None):
+        """
+        Initialize index
+
+        Args:
+            on_change: Optional function called with a track whose device
+                       chain changed (its entry is already dropped)
+            on_pads_change: Optional function called with (drum_rack, note)
+                            when a pad of an indexed rack is loaded or cleared
+        """
+        self.on_change = on_change
+        self.on_pads_change = on_pads_change
+
+        # track -> its first DrumGroupDevice, or None
+        self._drum_racks = {}
+
+        # track -> devices listener callback (kept for removal)
+        self._listeners = {}
+
+        # drum rack -> DrumPadOccupancy
+        self._occupancy = {}
+
+        # Counters
+        self.scans = 0
+
+    def drum_rack(self, track):
+        """
+        Get a track's drum rack
+
+        Args:
+            track: Live track (tracks without devices, e.g. return tracks, have none)
+
+        Returns:
+            The first DrumGroupDevice on the track, or None
+        """
+        try:
+            return self._drum_racks[track]
+        except KeyError:
+            pass
+
+        self._watch(track)
+        rack = self._scan(track)
+        self._drum_racks[track] = rack
+        return rack
+
+    def has_drum_rack(self, track):
+        """Check if a track has a drum rack"""
+        return self.drum_rack(track) is not None
+
+    def pad_occupancy(self, drum_rack):
+        """
+        Get the loaded-pad bitmap of a drum rack (built on first use)
+
+        Args:
+            drum_rack: DrumGroupDevice
+
+        Returns:
+            DrumPadOccupancy
+        """
+        occupancy = self._occupancy.get(drum_rack)
+        if occupancy is None:
+            occupancy = DrumPadOccupancy(drum_rack, self._on_pads_changed)
+            self._occupancy[drum_rack] = occupancy
+        return occupancy
+
+    def forget(self, track):
+        """Drop a track's entry and stop listening to it"""
+        self._drop_occupancy(self._drum_racks.pop(track, None))
+        callback = self._listeners.pop(track, None)
+        if callback is not None:
+            try:
+                track.remove_devices_listener(callback)
+            except Exception:
+                pass  # Track was deleted
+
+    def clear(self):
+        """Drop every entry and remove all listeners (e.g. on disconnect)"""
+        for track in list(self._listeners):
+            self.forget(track)
+        self._drum_racks.clear()
+        for occupancy in self._occupancy.values():
+            occupancy.disconnect()
+        self._occupancy.clear()
+
+    def _scan(self, track):
+        """Walk a track's devices for the first drum rack"""
+        self.scans += 1
+        for device in getattr(track, 'devices', ()):
+            if device.class_name == DRUM_RACK_CLASS_NAME:
+                return device
+        return None
+
+    def _watch(self, track):
+        """Add a devices listener to a track (once)"""
+        if track in self._listeners or not hasattr(track, 'add_devices_listener'):
+            return
+
+        def on_devices_changed():
+            self._drop_occupancy(self._drum_racks.pop(track, None))
+            if self.on_change:
+                self.on_change(track)
+
+        track.add_devices_listener(on_devices_changed)
+        self._listeners[track] = on_devices_changed
+
+    def _drop_occupancy(self, drum_rack):
+        """Stop tracking a rack's pads (it may have been removed from its track)"""
+        occupancy = self._occupancy.pop(drum_rack, None)
+        if occupancy is not None:
+            occupancy.disconnect()
+
+    def _on_pads_changed(self, drum_rack, note):
+        """Forward a pad change from one of the racks' bitmaps"""
+        if self.on_pads_change:
+            self.on_pads_change(drum_rack, note)
@@ -0,0 +1,262 @@
+"""
+LED animation timeline for Linnstrument
+Runs keyframed cell effects (pulses, blinks, decaying flashes) at a capped
+frame rate and within a per-frame MIDI message budget
+"""
+
+import time
+
+# Frames per second the timeline produces at most
+DEFAULT_FPS = 10
+
+# MIDI messages one animation frame may cost (a cell write is at most 3)
+DEFAULT_MAX_MESSAGES = 48
+
+# Worst-case messages per cell write (CC20 column, CC21 row, CC22 color)
+MESSAGES_PER_CELL = 3
+
+
+class Animation:
+    """
+    Keyframed effect on a set of cells
+
+    Keyframes are (frame, color) pairs sorted by frame; a cell shows the color
+    of the last keyframe at or before the current frame. None means the
+    animation doesn't light the cell (whatever is underneath shows). The last
+    keyframe marks the end; a looping animation starts over there.
+    """
+
+    __slots__ = ('cells', 'keyframes', 'loop', 'length', 'start')
+
+    def __init__(self, cells, keyframes, loop=False):
+        """
+        Initialize animation
+
+        Args:
+            cells: List of (column, row) cells the effect covers
+            keyframes: List of (frame, color) pairs, frame 0 first
+            loop: If True, repeat until stopped
+        """
+        self.cells = list(cells)
+        self.keyframes = sorted(keyframes, key=lambda keyframe: keyframe[0])
+        self.loop = loop
+        self.length = max(self.keyframes[-1][0], 1)
+
+        # Timeline frame the animation started on (set by AnimationTimeline.play)
+        self.start = 0
+
+    def color_at(self, frame):
+        """
+        Color at a timeline frame
+
+        Returns:
+            (color, finished) - color is None where the animation shows nothing
+        """
+        elapsed = frame - self.start
+        if elapsed >= self.length:
+            if not self.loop:
+                return None, True
+            elapsed %= self.length
+
+        color = None
+        for keyframe, keyframe_color in self.keyframes:
+            if keyframe > elapsed:
+                break
+            color = keyframe_color
+        return color, False
+
+
+def pulse(cells, color, duration_frames=10, period=4, alt=None):
+    """
+    Alternate cells between a color and alt for a number of frames
+
+    Args:
+        cells: List of (column, row) cells
+        color: Pulse color
+        duration_frames: Frames the pulse lasts
+        period: Frames per on/off cycle
+        alt: Color for the off half of each cycle (None shows what's underneath)
+    """
+    half = max(period // 2, 1)
+    keyframes = [(frame, color if (frame // half) % 2 == 0 else alt)
+                 for frame in range(0, duration_frames, half)]
+    keyframes.append((duration_frames, None))
+    return Animation(cells, keyframes)
+
+
+def blink(cells, color, period=4, alt='off'):
+    """
+    Blink cells until stopped (e.g. a triggered clip waiting to launch)
+
+    Args:
+        cells: List of (column, row) cells
+        color: Blink color
+        period: Frames per on/off cycle
+        alt: Color for the off half of each cycle
+    """
+    half = max(period // 2, 1)
+    return Animation(cells, [(0, color), (half, alt), (half * 2, color)], loop=True)
+
+
+def flash(cells, colors=('white', 'yellow', 'orange'), frames_per_step=1):
+    """
+    Decaying hit flash: step through colors, then show what's underneath again
+
+    Args:
+        cells: List of (column, row) cells
+        colors: Colors from the hit to the end of the decay
+        frames_per_step: Frames each color is shown
+    """
+    keyframes = [(step * frames_per_step, color) for step, color in enumerate(colors)]
+    keyframes.append((len(colors) * frames_per_step, None))
+    return Animation(cells, keyframes)
+
+
+class AnimationTimeline:
+    """
+    Plays animations and works out which cells change each frame
+
+    advance() is called from whatever drives the display (update_display in
+    a Remote Script, a timer thread in the standalone tools). It produces at
+    most `fps` frames per second. Animations that touch the same cell are
+    merged: the most recently played one wins, and the cell returns to an
+    older animation (or to nothing) when the newer one ends. A frame never
+    writes more cells than the message budget allows; cells returning to
+    what's underneath are written first, and cells left over are picked up
+    by the next frame.
+    """
+
+    def __init__(self, fps=DEFAULT_FPS, max_messages=DEFAULT_MAX_MESSAGES, clock=time.monotonic):
+        """
+        Initialize timeline
+
+        Args:
+            fps: Maximum frames per second
+            max_messages: MIDI message budget per frame
+            clock: Function returning the current time in seconds
+        """
+        self.fps = fps
+        self.max_messages = max_messages
+        self.clock = clock
+
+        # Playing animations by key, oldest first
+        self._animations = {}
+        self._next_key = 0
+
+        # Cells the timeline currently shows: (column, row) -> color
+        self.shown = {}
+
+        self._epoch = None
+        self._frame = -1
+
+        # Counters
+        self.frames = 0
+        self.deferred_cells = 0
+
+    @property
+    def active(self):
+        """True while animations are playing or cells still need restoring"""
+        return bool(self._animations or self.shown)
+
+    def play(self, animation, key=None):
+        """
+        Start an animation on the next frame
+
+        Args:
+            animation: Animation to play
+            key: Handle for stop(); playing again with the same key replaces
+                 the previous animation (None for a fresh key)
+
+        Returns:
+            The key
+        """
+        if key is None:
+            key = self._next_key
+            self._next_key += 1
+
+        animation.start = self._frame + 1
+        self._animations.pop(key, None)
+        self._animations[key] = animation
+        return key
+
+    def stop(self, key):
+        """Stop an animation (its cells are restored on the next frame)"""
+        self._animations.pop(key, None)
+
+    def stop_all(self):
+        """Stop every animation"""
+        self._animations.clear()
+
+    def is_playing(self, key):
+        """Check if an animation is still playing"""
+        return key in self._animations
+
+    def next_frame_in(self, now=None):
+        """Seconds until the next frame is due (0 if one is due now or the clock hasn't started)"""
+        if self._epoch is None:
+            return 0.0
+        now = self.clock() if now is None else now
+        return max(self._epoch + (self._frame + 1) / self.fps - now, 0.0)
+
+    def advance(self, now=None):
+        """
+        Produce the next frame if one is due
+
+        Args:
+            now: Time in seconds (default: the timeline's clock)
+
+        Returns:
+            List of ((column, row), color) cells that changed, color None
+            where the timeline no longer lights the cell (empty if no frame
+            was due or nothing changed)
+        """
+        if not self.active:
+            return []
+
+        now = self.clock() if now is None else now
+        if self._epoch is None:
+            self._epoch = now - (self._frame + 1) / self.fps
+
+        # The epsilon keeps float jitter from landing just short of a frame boundary
+        frame = int((now - self._epoch) * self.fps + 1e-6)
+        if frame <= self._frame:
+            return []
+        self._frame = frame
+        self.frames += 1
+
+        # Merge: later animations overwrite earlier ones
+        wanted = {}
+        for key, animation in list(self._animations.items()):
+            color, finished = animation.color_at(frame)
+            if finished:
+                del self._animations[key]
+                continue
+            for cell in animation.cells:
+                if color is None:
+                    wanted.setdefault(cell, None)
+                else:
+                    wanted[cell] = color
+
+        # Restores go first: a budget spent on busy animations must not
+        # leave cells whose animation ended lit indefinitely
+        shown = self.shown
+        changes = [(cell, None) for cell in shown if wanted.get(cell) is None]
+        changes.extend((cell, color) for cell, color in wanted.items()
+                       if color is not None and shown.get(cell) != color)
+
+        budget = max(self.max_messages // MESSAGES_PER_CELL, 1)
+        if len(changes) > budget:
+            self.deferred_cells += len(changes) - budget
+            changes = changes[:budget]
+
+        for cell, color in changes:
+            if color is None:
+                del shown[cell]
+            else:
+                shown[cell] = color
+
+        if not self._animations and not shown:
+            # Idle: the next animation starts a fresh clock
+            self._epoch = None
+
+        return changes
@@ -0,0 +1,224 @@
+"""
+LED transport for Linnstrument
+Sends CC20 (column) / CC21 (row) / CC22 (color) cell writes, skipping
+coordinate CCs whose value the Linnstrument already has latched
+"""
+
+# Linnstrument LED control CCs
+CC_COLUMN = 20
+CC_ROW = 21
+CC_COLOR = 22
+
+
+class FrameReport:
+    """
+    Message counts for one batch of cell writes
+    """
+
+    __slots__ = ('cells', 'messages')
+
+    def __init__(self, cells=0, messages=0):
+        self.cells = cells
+        self.messages = messages
+
+    @property
+    def naive_messages(self):
+        """Messages the batch would cost with column, row and color sent for every cell"""
+        return self.cells * 3
+
+    @property
+    def saved(self):
+        """Messages skipped thanks to coordinate elision"""
+        return self.naive_messages - self.messages
+
+    def __repr__(self):
+        return (f"FrameReport(cells={self.cells}, messages={self.messages}, "
+                f"naive={self.naive_messages}, saved={self.saved})")
+
+
+def encode_tuple(status, control, value):
+    """Default message encoding: a (status, control, value) tuple"""
+    return (status, control, value)
+
+
+class LEDTransport:
+    """
+    Writes LED cells to the Linnstrument with CC20/CC21 coordinate elision
+
+    The Linnstrument keeps the last column (CC20) and row (CC21) values it
+    received and paints that cell when the color (CC22) arrives, so a
+    coordinate CC only needs sending when it differs from the latched value.
+    Anything else that sends CC20/CC21 to the device must call invalidate().
+
+    Every CC20/CC21/CC22 message for the channel is encoded once up front, so
+    writing a cell only looks up pre-built messages.
+    """
+
+    def __init__(self, send, channel=0, column_base=0, encode=encode_tuple, send_many=None):
+        """
+        Initialize transport
+
+        Args:
+            send: Callable taking one encoded message and sending it
+            channel: MIDI channel (0-15)
+            column_base: Added to every column (1 when column 0 is the control column)
+            encode: Callable (status, control, value) -> message object for send
+                    (default: tuple; e.g. raw bytes or mido.Message for the standalone tool)
+            send_many: Optional callable taking a list of encoded messages, used by
+                       write_batch to hand a whole batch to the backend at once
+        """
+        self._send = send
+        self._send_many = send_many
+        self._encode = encode
+        self.column_base = column_base
+        self.channel = channel
+
+        # Last coordinate values sent to the device (None = unknown)
+        self._latched_column = None
+        self._latched_row = None
+
+        # Running totals and the report for the most recent batch
+        self.cells_written = 0
+        self.messages_sent = 0
+        self.last_report = None
+
+    @property
+    def channel(self):
+        return self._channel
+
+    @channel.setter
+    def channel(self, value):
+        self._channel = value
+        self.status = 0xB0 + value
+
+        # Pre-encoded messages indexed by value (0-127)
+        encode = self._encode
+        status = self.status
+        self._column_messages = tuple(encode(status, CC_COLUMN, v) for v in range(128))
+        self._row_messages = tuple(encode(status, CC_ROW, v) for v in range(128))
+        self._color_messages = tuple(encode(status, CC_COLOR, v) for v in range(128))
+
+    def invalidate(self):
+        """Forget the latched coordinates so the next write sends both"""
+        self._latched_column = None
+        self._latched_row = None
+
+    def _encode_cell(self, column, row, color, out):
+        """Append the messages for one cell to out, updating the latched coordinates"""
+        column += self.column_base
+        if column != self._latched_column:
+            out.append(self._column_messages[column])
+            self._latched_column = column
+        if row != self._latched_row:
+            out.append(self._row_messages[row])
+            self._latched_row = row
+        out.append(self._color_messages[color])
+
+    def write_cell(self, column, row, color):
+        """
+        Write a single cell
+
+        Args:
+            column: Column number (before column_base is applied)
+            row: Row number
+            color: Color number (0-11)
+
+        Returns:
+            Number of MIDI messages sent (1-3)
+        """
+        messages = []
+        self._encode_cell(column, row, color, messages)
+
+        send = self._send
+        for message in messages:
+            send(message)
+
+        self.cells_written += 1
+        self.messages_sent += len(messages)
+        return len(messages)
+
+    def write_batch(self, cells, ordered=True, max_messages=None):
+        """
+        Write a batch of cells
+
+        Args:
+            cells: Iterable of (column, row, color) tuples
+            ordered: If True, reorder the batch to maximize coordinate reuse
+            max_messages: Stop before the cell that would exceed this many
+                          messages (None for no limit); the first cell is
+                          always written so every call makes progress
+
+        Returns:
+            FrameReport for the batch (also kept as last_report); with
+            max_messages, report.cells is how many leading cells were written
+        """
+        if ordered:
+            cells = self.order_cells(cells)
+
+        messages = []
+        report = FrameReport()
+        encode_cell = self._encode_cell
+        for column, row, color in cells:
+            if max_messages is not None and report.cells:
+                cost = (1 + (column + self.column_base != self._latched_column) +
+                        (row != self._latched_row))
+                if len(messages) + cost > max_messages:
+                    break
+            encode_cell(column, row, color, messages)
+            report.cells += 1
+        report.messages = len(messages)
+
+        if messages:
+            if self._send_many is not None:
+                self._send_many(messages)
+            else:
+                send = self._send
+                for message in messages:
+                    send(message)
+
+        self.cells_written += report.cells
+        self.messages_sent += report.messages
+        self.last_report = report
+        return report
+
+    @staticmethod
+    def order_cells(cells):
+        """
+        Sort a batch of cell writes so consecutive writes share a coordinate
+
+        Later writes to the same cell replace earlier ones. Cells are grouped
+        along whichever axis has fewer distinct values (rows for row sweeps,
+        columns for column sweeps) and walked serpentine-style, so every
+        group after the first can start on the coordinate the last one ended on.
+
+        Args:
+            cells: Iterable of (column, row, color) tuples
+
+        Returns:
+            List of (column, row, color) tuples
+        """
+        latest = {}
+        for column, row, color in cells:
+            latest[(column, row)] = color
+
+        if not latest:
+            return []
+
+        rows = {row for _, row in latest}
+        columns = {column for column, _ in latest}
+
+        if len(rows) <= len(columns):
+            group_key, order_key = (lambda pos: pos[1]), (lambda pos: pos[0])
+        else:
+            group_key, order_key = (lambda pos: pos[0]), (lambda pos: pos[1])
+
+        groups = {}
+        for pos in latest:
+            groups.setdefault(group_key(pos), []).append(pos)
+
+        ordered = []
+        for i, key in enumerate(sorted(groups)):
+            positions = sorted(groups[key], key=order_key, reverse=bool(i % 2))
+            ordered.extend((column, row, latest[(column, row)]) for column, row in positions)
+
+        return ordered
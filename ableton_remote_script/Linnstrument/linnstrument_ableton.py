@@ -2,6 +2,10 @@
 Linnstrument control using only Ableton's MIDI API (no external dependencies)
 """
 
+from .config import LED_MESSAGES_PER_TICK
+from .grid_geometry import get_geometry
+from .led_transport import FrameReport, LEDTransport
+
 # Linnstrument 128: 16-column x 8-row grid
 LINNSTRUMENT_COLUMNS = 16
 LINNSTRUMENT_ROWS = 8
@@ -31,7 +35,8 @@ class LinnstrumentAbletonMIDI:
     Control Linnstrument using Ableton's MIDI API (no mido dependency)
     """
 
-    def __init__(self, c_instance, channel=0, row_offset=None, column_offset=None, base_note=None):
+    def __init__(self, c_instance, channel=0, row_offset=None, column_offset=None, base_note=None,
+                 deferred=True):
         """
         Initialize Linnstrument controller
 
@@ -41,9 +46,23 @@ class LinnstrumentAbletonMIDI:
             row_offset: Semitones between rows (None = auto-detect)
             column_offset: Semitones between columns (None = auto-detect)
             base_note: MIDI note number at position (0, 0) (None = auto-detect)
+            deferred: If True, LED writes are queued until flush_leds() (call it
+                      from update_display); if False they are sent immediately
         """
         self.c_instance = c_instance
         self.channel = channel
+        self._geometry = None
+
+        # IMPORTANT: Linnstrument columns are 1-indexed for playable surface
+        # Column 0 = control buttons, so the transport adds 1 to every column
+        # Messages are pre-built (status, cc, value) tuples, handed straight to Live
+        self.transport = LEDTransport(self.c_instance.send_midi, channel=channel, column_base=1)
+
+        # Queued LED cells {(column, row): color}, newest write per cell wins
+        # Interactive cells (single-cell feedback) are flushed before bulk redraws
+        self.deferred = deferred
+        self._interactive_cells = {}
+        self._bulk_cells = {}
 
         # Auto-detect Linnstrument layout by calculating from known standard tunings
         # Linnstrument default factory settings:
@@ -101,7 +120,7 @@ class LinnstrumentAbletonMIDI:
         return default_base
 
     def send_midi(self, midi_bytes):
-        """Send MIDI message using Ableton's API"""
+        """Send MIDI message using Ableton's API (immediately, never queued)"""
         self.c_instance.send_midi(tuple(midi_bytes))
 
 
@@ -117,38 +136,133 @@ class LinnstrumentAbletonMIDI:
         if isinstance(color, str):
             color = COLORS.get(color.lower(), 0)
 
-        # Linnstrument uses CC20 for column, CC21 for row, CC22 for color
-        # MIDI CC message: [status, controller, value]
-        status = 0xB0 + self.channel  # Control Change on channel
+        if not self.deferred:
+            # Linnstrument uses CC20 for column, CC21 for row, CC22 for color;
+            # the transport skips CC20/CC21 when the device already has that value
+            self.transport.write_cell(column, row, color)
+            return
 
-        # IMPORTANT: Linnstrument columns are 1-indexed for playable surface
-        # Column 0 = control buttons, Columns 1-16 = playable pads (Linnstrument 128)
-        self.send_midi([status, 20, column + 1])  # Add 1 to skip control column
-        self.send_midi([status, 21, row])
-        self.send_midi([status, 22, color])
+        # Interactive feedback: jumps ahead of any queued bulk write to the same cell
+        self._bulk_cells.pop((column, row), None)
+        self._interactive_cells[(column, row)] = color
+
+    def set_cells(self, cells):
+        """
+        Set a batch of LED cells, ordered to reuse latched coordinates
+
+        Args:
+            cells: Iterable of (column, row, color) tuples, colors as numbers
+
+        Returns:
+            FrameReport with the cell and message counts for the batch, or
+            None when deferred (the cells are queued for flush_leds)
+        """
+        if not self.deferred:
+            return self.transport.write_batch(cells)
+
+        interactive = self._interactive_cells
+        bulk = self._bulk_cells
+        for column, row, color in cells:
+            # A cell already queued as interactive keeps its priority
+            if (column, row) in interactive:
+                interactive[(column, row)] = color
+            else:
+                bulk[(column, row)] = color
+        return None
+
+    @property
+    def pending_leds(self):
+        """Number of LED cells waiting for flush_leds()"""
+        return len(self._interactive_cells) + len(self._bulk_cells)
+
+    def flush_leds(self, budget=LED_MESSAGES_PER_TICK):
+        """
+        Send queued LED cells, interactive ones first
+
+        Call once per update_display tick. Cells that don't fit in the budget
+        stay queued for the next tick (at least one cell is always sent).
+        Coordinate elision happens here, at send time, so the latched
+        CC20/CC21 values are always the ones the device last received.
+
+        Args:
+            budget: Max MIDI messages to send (None to send everything)
+
+        Returns:
+            FrameReport for the cells sent
+        """
+        report = FrameReport()
+
+        for queue in (self._interactive_cells, self._bulk_cells):
+            if not queue:
+                continue
+
+            remaining = None if budget is None else budget - report.messages
+            if remaining is not None and remaining <= 0:
+                break
+
+            cells = self.transport.order_cells((column, row, color)
+                                               for (column, row), color in queue.items())
+            sent = self.transport.write_batch(cells, ordered=False, max_messages=remaining)
+            for column, row, _ in cells[:sent.cells]:
+                del queue[(column, row)]
+
+            report.cells += sent.cells
+            report.messages += sent.messages
+
+        return report
+
+    # Changing the layout drops the geometry index so the next lookup rebuilds it
+    # (DrumMode.enter and _auto_switch_mode flip row_offset between 5 and 4)
+    @property
+    def row_offset(self):
+        return self._row_offset
+
+    @row_offset.setter
+    def row_offset(self, value):
+        self._row_offset = value
+        self._geometry = None
+
+    @property
+    def column_offset(self):
+        return self._column_offset
+
+    @column_offset.setter
+    def column_offset(self, value):
+        self._column_offset = value
+        self._geometry = None
+
+    @property
+    def base_note(self):
+        return self._base_note
+
+    @base_note.setter
+    def base_note(self, value):
+        self._base_note = value
+        self._geometry = None
+
+    @property
+    def geometry(self):
+        """GridGeometry index for the current layout"""
+        if self._geometry is None:
+            self._geometry = get_geometry(self._base_note, self._row_offset, self._column_offset,
+                                          LINNSTRUMENT_COLUMNS, LINNSTRUMENT_ROWS)
+        return self._geometry
 
     def get_note_at_position(self, column, row):
         """Calculate MIDI note number at a given grid position"""
-        return self.base_note + (column * self.column_offset) + (row * self.row_offset)
+        return self.geometry.note_at(column, row)
 
     def get_position_for_note(self, note):
-        """Find all grid positions that play a given MIDI note"""
-        positions = []
-
-        for row in range(LINNSTRUMENT_ROWS):
-            for column in range(LINNSTRUMENT_COLUMNS):
-                note_at_pos = self.get_note_at_position(column, row)
-                if note_at_pos == note:
-                    positions.append((column, row))
-
-        return positions
+        """Find all grid positions that play a given MIDI note (O(1) table lookup)"""
+        return self.geometry.positions_for_note(note)
 
     def clear_all_lights(self, skip_top_row=False):
         """Turn off all LEDs"""
         max_row = LINNSTRUMENT_ROWS - 1 if skip_top_row else LINNSTRUMENT_ROWS
-        for row in range(max_row):
-            for column in range(LINNSTRUMENT_COLUMNS):
-                self.set_cell_color(column, row, 'off')
+        off = COLORS['off']
+        self.set_cells((column, row, off)
+                       for row in range(max_row)
+                       for column in range(LINNSTRUMENT_COLUMNS))
 
     def light_note(self, note, color, skip_top_row=False):
         """Light up all cells that play a specific note"""
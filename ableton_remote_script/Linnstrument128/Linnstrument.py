@@ -12,9 +12,14 @@ import Live
 
 try:
     from .config import LINNSTRUMENT_BASE_NOTE, LINNSTRUMENT_ROW_OFFSET, LINNSTRUMENT_COLUMN_OFFSET
+    from .config import LINNSTRUMENT_COLUMNS, LINNSTRUMENT_ROWS, SEQUENCER_DATA_KEY
+    from .grid_geometry import get_geometry
     from .scales import NOTE_NAMES, get_scale_notes
     from .linnstrument_ableton import LinnstrumentAbletonMIDI
-    from .led_manager import LEDManager
+    from .led_manager import LEDManager, resolve_color
+    from .change_dispatcher import ChangeDispatcher
+    from .device_index import TrackDeviceIndex
+    from .pattern_store import PatternStore
     MODULES_AVAILABLE = True
 except ImportError as e:
     MODULES_AVAILABLE = False
@@ -75,18 +80,34 @@ class Linnstrument(ControlSurface):
         self.current_root = None
         self.current_scale = None
 
+        # Each mode's grid, kept current while the other mode is shown;
+        # switching modes commits it as a diff
+        self._keyboard_frame = None
+        self._drum_frame = None  # Drawn for _drum_rack (None until there is one)
+
         # Drum mode state
         self._drum_rack = None
+        self._pad_occupancy = None  # Loaded pads of the drum rack (chains listeners keep it current)
         self._selected_pad = 0  # 0-15
-        self._sequences = [[0 for _ in range(16)] for _ in range(16)]  # 16 pads x 16 steps
+        self._patterns = PatternStore(pads=16, max_patterns=1, length=16,
+                                      key=SEQUENCER_DATA_KEY)  # 16 pads x 16 steps
+        self._patterns_changed = False  # Save to the set on the next tick
+        self._load_patterns()
         self._is_playing = False
         self._current_step = 0
         self._needs_led_update = False
 
         # Add listeners
-        self.song().add_root_note_listener(self._on_scale_changed)
-        self.song().add_scale_name_listener(self._on_scale_changed)
-        self.song().view.add_selected_track_listener(self._on_track_changed)
+        # Listeners only mark what changed; update_display handles each burst once
+        self._dispatcher = ChangeDispatcher()
+
+        # Each track's drum rack, so arrowing through tracks doesn't rescan devices
+        self._device_index = TrackDeviceIndex(on_change=self._on_devices_changed,
+                                              on_pads_change=self._on_pads_changed)
+        self.song().add_root_note_listener(self._dispatcher.listener(self._on_changed, 'root_note'))
+        self.song().add_scale_name_listener(self._dispatcher.listener(self._on_changed, 'scale_name'))
+        self.song().view.add_selected_track_listener(
+            self._dispatcher.listener(self._on_changed, 'selected_track'))
 
         # Initial mode
         self._auto_switch_mode()
@@ -103,11 +124,14 @@ class Linnstrument(ControlSurface):
 
         # Remove listeners
         try:
-            self.song().remove_root_note_listener(self._on_scale_changed)
-            self.song().remove_scale_name_listener(self._on_scale_changed)
-            self.song().view.remove_selected_track_listener(self._on_track_changed)
+            self.song().remove_root_note_listener(self._dispatcher.listener(self._on_changed, 'root_note'))
+            self.song().remove_scale_name_listener(
+                self._dispatcher.listener(self._on_changed, 'scale_name'))
+            self.song().view.remove_selected_track_listener(
+                self._dispatcher.listener(self._on_changed, 'selected_track'))
         except:
             pass
+        self._device_index.clear()
 
         ControlSurface.disconnect(self)
 
@@ -126,27 +150,39 @@ class Linnstrument(ControlSurface):
         self._c_instance.send_midi((status, 101, 127))
         self._c_instance.send_midi((status, 100, 127))
 
-    def _on_scale_changed(self):
-        """Scale changed - update if in keyboard mode"""
-        if self._mode == 'keyboard':
+    def _on_changed(self, changes):
+        """Scale, selected track and/or its devices changed since the last tick"""
+        if 'selected_track' in changes or 'devices' in changes:
+            # Track changed - check if we should switch modes
+            self._auto_switch_mode()
+        if 'root_note' in changes or 'scale_name' in changes:
+            # Re-render the keyboard frame (shown if in keyboard mode)
             self._update_keyboard_leds()
 
-    def _on_track_changed(self):
-        """Track changed - check if we should switch modes"""
-        self._auto_switch_mode()
+    def _on_devices_changed(self, track):
+        """A track's device chain changed - recheck the mode if it's the selected one"""
+        if track == self.song().view.selected_track:
+            self._dispatcher.mark(self._on_changed, 'devices')
+
+    def _on_pads_changed(self, drum_rack, note):
+        """A drum pad was loaded or cleared - update its cell, shown on the next tick"""
+        if drum_rack == self._drum_rack:
+            self._draw_drum_pad(note - 24)
+            if self._mode == 'drum':
+                self._needs_led_update = True
 
     def _auto_switch_mode(self):
         """Auto-switch to drum mode if drum rack detected"""
         track = self.song().view.selected_track
 
-        # Check for drum rack
-        has_drum_rack = False
-        if hasattr(track, 'devices'):
-            for device in track.devices:
-                if device.class_name == 'DrumGroupDevice':
-                    has_drum_rack = True
-                    self._drum_rack = device
-                    break
+        # Check for drum rack (cached per track, kept current by devices listeners)
+        drum_rack = self._device_index.drum_rack(track)
+        has_drum_rack = drum_rack is not None
+        if has_drum_rack and drum_rack != self._drum_rack:
+            # Another rack: its pads are drawn from scratch
+            self._drum_rack = drum_rack
+            self._pad_occupancy = self._device_index.pad_occupancy(drum_rack)
+            self._drum_frame = None
 
         # Switch mode
         if has_drum_rack and self._mode != 'drum':
@@ -163,7 +199,8 @@ class Linnstrument(ControlSurface):
         elif not has_drum_rack and self._mode != 'keyboard':
             self.log_message("No drum rack - switching to Keyboard Mode")
             self._mode = 'keyboard'
-            self._drum_rack = None
+            # The drum rack and its frame are kept (and kept current by the pad
+            # listener), so coming back to the same rack only sends the diff
             # Restore row offset to 5 (fifths) and base note to 36 (C2) for keyboard mode
             self._send_nrpn(227, 5)
             self.linnstrument.row_offset = 5
@@ -185,105 +222,138 @@ class Linnstrument(ControlSurface):
             root = self.song().root_note
             scale_name = self.song().scale_name
 
-            # Check if changed
-            if root == self.current_root and scale_name == self.current_scale:
-                return
+            # Re-render only when the scale changed; the stored frame is
+            # committed either way, so switching modes still redraws the grid
+            if (self._keyboard_frame is None or
+                    root != self.current_root or scale_name != self.current_scale):
+                self._keyboard_frame = self._render_keyboard_frame(root, scale_name)
+
+            if self._mode == 'keyboard':
+                self._keyboard_frame.commit()
+
+        except Exception as e:
+            self.log_message(f"Error updating keyboard LEDs: {e}")
+
+    def _render_keyboard_frame(self, root, scale_name):
+        """Build the keyboard frame for a scale (not displayed)"""
+        self.current_root = root
+        self.current_scale = scale_name
 
-            self.current_root = root
-            self.current_scale = scale_name
+        # Map scale name
+        our_scale_name = ABLETON_SCALE_MAP.get(
+            scale_name,
+            scale_name.lower().replace(' ', '_')
+        )
 
-            # Map scale name
-            our_scale_name = ABLETON_SCALE_MAP.get(
-                scale_name,
-                scale_name.lower().replace(' ', '_')
-            )
+        root_name = NOTE_NAMES[root]
+        self.log_message(f"Displaying scale: {root_name} {scale_name}")
 
-            root_name = NOTE_NAMES[root]
-            self.log_message(f"Displaying scale: {root_name} {scale_name}")
+        # Get scale notes
+        scale_notes = get_scale_notes(root, our_scale_name)
 
-            # Get scale notes
-            scale_notes = get_scale_notes(root, our_scale_name)
+        # Light the scale as one frame (only changed cells are sent)
+        frame = self.led_manager.begin_frame()
+        geometry = self._keyboard_geometry()
+        root_color, scale_color = resolve_color('red'), resolve_color('blue')
 
-            # Clear and light
-            self.led_manager.clear_all()
+        for note in scale_notes:
+            positions = geometry.positions_for_note(note)
+            is_root = (note % 12) == root
+            color = root_color if is_root else scale_color
 
-            for note in scale_notes:
-                positions = self.linnstrument.get_position_for_note(note)
-                is_root = (note % 12) == root
-                color = 'red' if is_root else 'blue'
+            for column, row in positions:
+                frame.set(column, row, color)
 
-                for column, row in positions:
-                    self.led_manager.set_led(column, row, color)
+        return frame
 
-        except Exception as e:
-            self.log_message(f"Error updating keyboard LEDs: {e}")
+    def _keyboard_geometry(self):
+        """Keyboard layout, which differs from the hardware's while in drum mode"""
+        return get_geometry(LINNSTRUMENT_BASE_NOTE, LINNSTRUMENT_ROW_OFFSET,
+                            LINNSTRUMENT_COLUMN_OFFSET, LINNSTRUMENT_COLUMNS, LINNSTRUMENT_ROWS)
 
     def _update_drum_leds(self):
         """Update LEDs for drum mode"""
         try:
-            # Clear all
-            self.led_manager.clear_all()
-
-            # Log which pads have samples (first time only)
-            if self._drum_rack and not hasattr(self, '_logged_drum_pads'):
-                self._logged_drum_pads = True
-                loaded_pads = []
-                for i in range(16):
-                    drum_note = 24 + i  # C1 = 24
-                    if drum_note < len(self._drum_rack.drum_pads):
-                        drum_pad = self._drum_rack.drum_pads[drum_note]
-                        if hasattr(drum_pad, 'chains') and len(drum_pad.chains) > 0:
-                            loaded_pads.append(f"{i}(note{drum_note})")
-                self.log_message(f"Drum pads with samples: {loaded_pads}")
-
-            # Bottom 4 rows: 4x4 drum grid (pads 0-15, notes 24-39 = C1-D#3)
-            for row in range(4):
-                for col in range(4):
-                    pad_index = row * 4 + col
-                    color = self._get_drum_pad_color(pad_index)
-                    self.led_manager.set_led(col, row, color)
-
-            # Top 4 rows: 16-step sequencer (all rows show selected pad's sequence)
-            sequence = self._sequences[self._selected_pad]
-            for step in range(16):
-                is_active = sequence[step] > 0
-                is_current = (step == self._current_step and self._is_playing)
-
-                if is_current and is_active:
-                    color = 'white'  # Playing step
-                elif is_current:
-                    color = 'yellow'  # Playhead on empty
-                elif is_active:
-                    color = 'green'  # Active step
-                else:
-                    color = 'off'  # Empty
-
-                # Show same sequence on all 4 rows (like Push)
-                for seq_row in range(4, 8):
-                    self.led_manager.set_led(step, seq_row, color)
+            # Render only for a new drum rack; pad changes, pad selection and
+            # step toggles update the stored frame in place, so showing it is
+            # a diff against the grid
+            if self._drum_frame is None:
+                self._render_drum_frame()
+
+            if self._mode == 'drum':
+                self._drum_frame.commit()
 
         except Exception as e:
             self.log_message(f"Error updating drum LEDs: {e}")
 
+    def _render_drum_frame(self):
+        """Build the drum frame for the current rack (not displayed)"""
+        # Log which pads have samples (first time only)
+        if self._drum_rack and not hasattr(self, '_logged_drum_pads'):
+            self._logged_drum_pads = True
+            loaded_pads = [f"{i}(note{24 + i})" for i in range(16)
+                           if self._pad_occupancy.is_loaded(24 + i)]
+            self.log_message(f"Drum pads with samples: {loaded_pads}")
+
+        self._drum_frame = self.led_manager.begin_frame()
+
+        # Bottom 4 rows: 4x4 drum grid (pads 0-15, notes 24-39 = C1-D#3)
+        for pad_index in range(16):
+            self._draw_drum_pad(pad_index)
+
+        # Top 4 rows: 16-step sequencer (all rows show selected pad's sequence)
+        for step in range(16):
+            self._draw_drum_step(step)
+
+    def _draw_drum_pad(self, pad_index):
+        """Set a pad's cell in the drum frame (if there is one)"""
+        if self._drum_frame is None or not 0 <= pad_index < 16:
+            return
+        self._drum_frame.set(pad_index % 4, pad_index // 4, self._get_drum_pad_color(pad_index))
+
+    def _draw_drum_step(self, step):
+        """Set a step's column (rows 4-7) in the drum frame (if there is one)"""
+        if self._drum_frame is None:
+            return
+        is_active = self._patterns.pattern.velocity(self._selected_pad, step) > 0
+        is_current = (step == self._current_step and self._is_playing)
+
+        if is_current and is_active:
+            color = 'white'  # Playing step
+        elif is_current:
+            color = 'yellow'  # Playhead on empty
+        elif is_active:
+            color = 'green'  # Active step
+        else:
+            color = 'off'  # Empty
+
+        # Show same sequence on all 4 rows (like Push)
+        self._drum_frame.fill_region(step, step, 4, 7, color)
+
+    def _load_patterns(self):
+        """Read the sequencer pattern saved with the set"""
+        try:
+            self._patterns.load(self.song())
+        except ValueError as e:
+            self.log_message(f"Error loading patterns: {e}")
+
+    def _save_patterns(self):
+        """Store the sequencer pattern with the set (only written when it changed)"""
+        try:
+            self._patterns.save(self.song())
+        except Exception as e:
+            self.log_message(f"Error saving patterns: {e}")
+
     def _get_drum_pad_color(self, pad_index):
         """Get color for drum pad (0-15)"""
         # Highlight selected pad
         if pad_index == self._selected_pad:
             return 'white'
 
-        # Check if pad has sample
-        if self._drum_rack:
-            try:
-                drum_note = 24 + pad_index  # C1 = 24
-                if drum_note < len(self._drum_rack.drum_pads):
-                    drum_pad = self._drum_rack.drum_pads[drum_note]
-                    has_chains = hasattr(drum_pad, 'chains') and len(drum_pad.chains) > 0
-                    if has_chains:
-                        return 'green'  # Has sample
-                    else:
-                        return 'off'  # No sample
-            except Exception as e:
-                self.log_message(f"Error checking pad {pad_index} (note {drum_note}): {e}")
+        # Check if pad has sample (from the occupancy bitmap, not the rack)
+        drum_note = 24 + pad_index  # C1 = 24
+        if self._pad_occupancy is not None and self._pad_occupancy.is_loaded(drum_note):
+            return 'green'  # Has sample
 
         return 'off'  # No drum rack or no sample
 
@@ -323,10 +393,18 @@ class Linnstrument(ControlSurface):
             if 24 <= note <= 39:
                 pad_index = note - 24
                 if pad_index < 16:
+                    # Hit flash on the pad (decays back to the pad color)
+                    self.led_manager.flash_led(pad_index % 4, pad_index // 4)
+
                     # Select this pad
                     if self._selected_pad != pad_index:
-                        self._selected_pad = pad_index
-                        # Schedule LED update for next update_display cycle
+                        previous_pad, self._selected_pad = self._selected_pad, pad_index
+                        # Redraw both pads and the new pad's steps in the frame;
+                        # it's shown on the next update_display cycle
+                        self._draw_drum_pad(previous_pad)
+                        self._draw_drum_pad(pad_index)
+                        for step in range(16):
+                            self._draw_drum_step(step)
                         self._needs_led_update = True
 
                     # Re-send the note to play the drum sound (forwarded notes are intercepted)
@@ -340,18 +418,29 @@ class Linnstrument(ControlSurface):
                 if row >= 4 and row < 8 and col < 16:
                     # Sequencer step toggle
                     step = col
-                    sequence = self._sequences[self._selected_pad]
-                    if sequence[step] > 0:
-                        sequence[step] = 0  # Turn off
-                    else:
-                        sequence[step] = 100  # Turn on
-                    # Schedule LED update (don't update in MIDI handler)
+                    self._patterns.pattern.toggle(self._selected_pad, step)
+                    self._patterns_changed = True  # Saved with the set on the next tick
+                    # Update the frame; it's sent on the next tick (not from the MIDI handler)
+                    self._draw_drum_step(step)
                     self._needs_led_update = True
                     return
 
     def update_display(self):
         """Called periodically - update LEDs if needed"""
+        # One update for all scale/track changes since the last tick
+        self._dispatcher.dispatch()
+
         if self._needs_led_update:
             self._needs_led_update = False
             if self._mode == 'drum':
                 self._update_drum_leds()
+
+        if self._patterns_changed:
+            self._patterns_changed = False
+            self._save_patterns()
+
+        # Advance LED animations (frame rate capped by the timeline)
+        self.led_manager.update_animations()
+
+        # Send queued LED writes, within the per-tick message budget
+        self.linnstrument.flush_leds()
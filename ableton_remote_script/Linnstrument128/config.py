@@ -34,6 +34,7 @@ DRUM_PAD_COLUMNS = 4  # 4x4 grid on left side (like Push)
 DRUM_PAD_EXTENDED_COLUMNS = 16  # Can extend to show more pads to the right
 SEQUENCER_ROWS = 4  # Top 4 rows (4-7) for sequencer
 SEQUENCER_STEPS = 16  # 16 steps for LinnStrument 128 (full width)
+SEQUENCER_DATA_KEY = 'linnstrument128_patterns'  # Song data key the pattern is saved under
 
 # Session Mode Configuration
 SESSION_ROWS = 8  # Full grid height
@@ -43,6 +44,17 @@ SESSION_SCENE_LAUNCH_COLUMN = None  # Optional: column for scene launch
 # Keyboard Mode Configuration
 KEYBOARD_SKIP_TOP_ROW = False  # Whether to reserve top row for track selection
 
+# LED Output
+# LED writes are queued and drained from update_display (about every 100 ms),
+# at most this many MIDI messages per tick, so big redraws spread over a few ticks
+LED_MESSAGES_PER_TICK = 150
+
+# LED animations (pulses, blinks, hit flashes) are advanced from update_display:
+# at most ANIMATION_FPS frames per second, each costing at most
+# ANIMATION_MESSAGES_PER_FRAME messages of the tick's budget
+ANIMATION_FPS = 10
+ANIMATION_MESSAGES_PER_FRAME = 48
+
 # Color Schemes
 DEFAULT_ROOT_COLOR = 'red'
 DEFAULT_SCALE_COLOR = 'blue'
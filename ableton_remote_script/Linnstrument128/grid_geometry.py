@@ -0,0 +1,88 @@
+"""
+Grid geometry index for Linnstrument layouts
+Precomputes note <-> position tables so lookups never scan the grid
+"""
+
+from functools import lru_cache
+
+
+class GridGeometry:
+    """
+    Note/position lookup tables for one Linnstrument layout
+
+    Built once per (base_note, row_offset, column_offset, columns, rows).
+    Cells are indexed row * columns + column.
+    """
+
+    def __init__(self, base_note, row_offset, column_offset, columns, rows):
+        """
+        Build lookup tables for a layout
+
+        Args:
+            base_note: MIDI note number at position (0, 0)
+            row_offset: Semitones between rows
+            column_offset: Semitones between columns
+            columns: Number of playable columns
+            rows: Number of rows
+        """
+        self.base_note = base_note
+        self.row_offset = row_offset
+        self.column_offset = column_offset
+        self.columns = columns
+        self.rows = rows
+
+        cell_notes = []
+        positions = {}
+
+        # Row-major order so positions come out the same way the old grid scan found them
+        for row in range(rows):
+            for column in range(columns):
+                note = base_note + (column * column_offset) + (row * row_offset)
+                cell_notes.append(note)
+                positions.setdefault(note, []).append((column, row))
+
+        self._cell_notes = tuple(cell_notes)
+        self._positions = {note: tuple(cells) for note, cells in positions.items()}
+
+    def note_at(self, column, row):
+        """
+        Get MIDI note number at a grid position
+
+        Args:
+            column: Column number
+            row: Row number
+
+        Returns:
+            MIDI note number
+        """
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            return self._cell_notes[row * self.columns + column]
+        # Off-grid positions still follow the layout formula
+        return self.base_note + (column * self.column_offset) + (row * self.row_offset)
+
+    def positions_for_note(self, note):
+        """
+        Get all grid positions that play a MIDI note
+
+        Args:
+            note: MIDI note number
+
+        Returns:
+            Tuple of (column, row) tuples (empty if the note is not on the grid)
+        """
+        return self._positions.get(note, ())
+
+    def notes(self):
+        """Get all distinct notes playable on the grid"""
+        return self._positions.keys()
+
+
+@lru_cache(maxsize=32)
+def get_geometry(base_note, row_offset, column_offset, columns, rows):
+    """
+    Get the shared GridGeometry for a layout, building it on first use
+
+    Switching back and forth between layouts (e.g. row offset 5 <-> 4)
+    reuses the tables instead of rebuilding them.
+    """
+    return GridGeometry(base_note, row_offset, column_offset, columns, rows)
@@ -5,6 +5,7 @@ Top 4 rows: Reserved for future sequencer
 """
 
 from .base_mode import BaseMode
+from ..device_index import TrackDeviceIndex
 from ..config import (
     DRUM_PAD_ROWS,
     DRUM_PAD_COLUMNS
@@ -19,15 +20,23 @@ class DrumMode(BaseMode):
     - Row offset = 4 semitones (chromatic blocks: 36-39, 40-43, 44-47, 48-51)
     """
 
-    def __init__(self, c_instance, linnstrument, led_manager, song):
-        super().__init__(c_instance, linnstrument, led_manager, song)
+    def __init__(self, c_instance, linnstrument, led_manager, song, dispatcher=None):
+        super().__init__(c_instance, linnstrument, led_manager, song, dispatcher)
 
         # Drum rack reference
         self._drum_rack = None
         self._drum_rack_device = None
 
-        # Pad selection (0-15)
+        # Each track's drum rack, so selection changes don't rescan device chains
+        self._device_index = TrackDeviceIndex(on_change=self._on_devices_changed,
+                                              on_pads_change=self._on_pads_changed)
+
+        # Loaded pads of the current drum rack, kept current by chains listeners
+        self._pad_occupancy = None
+
+        # Pad selection (0-15), highlighted on an overlay above the pad colors
         self._selected_pad = 0
+        self._selection_layer = led_manager.add_layer('drum_selection', order=1)
 
     def _send_nrpn(self, nrpn_number, value):
         """
@@ -73,19 +82,10 @@ class DrumMode(BaseMode):
             self.linnstrument.row_offset = 4
             self.log_message(f"Row offset set to 4 (internal value updated)")
 
-            # Find drum rack on selected track
-            self._find_drum_rack()
-
-            # Add listener for track changes
-            self._add_listener(self.song.view, 'add_selected_track_listener', self._on_track_changed)
-
-            # Force clear all LEDs
-            self.log_message("Clearing all LEDs...")
-            self.led_manager.clear_all(force=True)
-
-            # Initial display - light up the 4x4 drum pad grid
-            self.log_message("Lighting up drum pads...")
-            self.update_leds()
+            # Show the drum pad framebuffer (kept current by the track listener)
+            # and the selection highlight over it
+            self.show()
+            self._show_selection()
             self.log_message("Drum mode ready")
             self.show_message("Linnstrument: Drum Mode (Push Layout)")
         except Exception as e:
@@ -104,7 +104,19 @@ class DrumMode(BaseMode):
         self.log_message(f"Row offset restored to 5 via NRPN (internal value updated: {self.linnstrument.row_offset})")
 
         super().exit()
-        self.led_manager.clear_all()
+        self._selection_layer.clear_all()
+        self.led_manager.composite()
+
+    def attach(self):
+        """Find the drum rack before the framebuffer is first rendered"""
+        if not self._attached:
+            self._find_drum_rack()
+        super().attach()
+
+    def _add_background_listeners(self):
+        """Follow the selected track's drum rack while other modes are shown"""
+        self._add_background_listener(self.song.view, 'add_selected_track_listener',
+                                      self._changed(self._on_track_changed, 'selected_track'))
 
     def build_midi_map(self, midi_map_handle):
         """
@@ -120,50 +132,40 @@ class DrumMode(BaseMode):
             import traceback
             self.log_message(traceback.format_exc())
 
-    def _on_track_changed(self):
-        """Track changed - find new drum rack"""
+    def detach(self):
+        """Stop background updates, including the device chain listeners"""
+        super().detach()
+        self._device_index.clear()
+
+    def _on_track_changed(self, changes):
+        """Track or its devices changed (once per tick however many) - find new drum rack"""
         self.log_message("Track changed - updating drum rack")
         self._find_drum_rack()
         self.update_leds()
 
+    def _on_devices_changed(self, track):
+        """A device chain changed; only the selected track's matters"""
+        if self._attached and track == self.song.view.selected_track:
+            self.dispatcher.mark(self._on_track_changed, 'devices')
+
+    def _on_pads_changed(self, drum_rack, note):
+        """A pad was loaded or cleared; redraw it if it's on the grid"""
+        if drum_rack == self._drum_rack:
+            self._update_single_pad_led(note - 36)
+
     def _find_drum_rack(self):
-        """Find drum rack on selected track"""
+        """Find drum rack on selected track (cached per track)"""
         try:
             track = self.song.view.selected_track
-            self.log_message(f"Looking for drum rack on track: {track.name}")
-
-            # Check if it's a MIDI track
-            if not hasattr(track, 'devices'):
-                self._drum_rack = None
-                self._drum_rack_device = None
-                self.log_message("Selected track has no devices")
-                return
-
-            # Find first drum rack
-            self.log_message(f"Track has {len(track.devices)} devices")
-            for device in track.devices:
-                self.log_message(f"  Device: {device.name} (class: {device.class_name})")
-                if device.class_name == 'DrumGroupDevice':
-                    self._drum_rack_device = device
-                    self._drum_rack = device
-                    self.log_message(f"Found drum rack: {device.name}")
-
-                    # Debug drum pads - check which ones have samples
-                    if hasattr(device, 'drum_pads'):
-                        self.log_message(f"  Drum rack has {len(device.drum_pads)} pads")
-                        loaded_pads = []
-                        for i in range(len(device.drum_pads)):
-                            pad = device.drum_pads[i]
-                            has_chains = hasattr(pad, 'chains') and len(pad.chains) > 0
-                            if has_chains:
-                                loaded_pads.append(i)
-                        self.log_message(f"  Loaded pads (indices with samples): {loaded_pads}")
-                        self.log_message(f"  Total loaded: {len(loaded_pads)}")
-                    return
+            rack = self._device_index.drum_rack(track)
+            self._drum_rack = rack
+            self._drum_rack_device = rack
+            self._pad_occupancy = self._device_index.pad_occupancy(rack) if rack is not None else None
 
-            self._drum_rack = None
-            self._drum_rack_device = None
-            self.log_message("No drum rack found on track")
+            if rack is not None:
+                self.log_message(f"Found drum rack on {track.name}: {rack.name}")
+            else:
+                self.log_message(f"No drum rack found on track: {track.name}")
 
         except Exception as e:
             self.log_message(f"Error finding drum rack: {e}")
@@ -171,14 +173,15 @@ class DrumMode(BaseMode):
             self.log_message(traceback.format_exc())
             self._drum_rack = None
             self._drum_rack_device = None
+            self._pad_occupancy = None
 
     def update_leds(self):
         """Update drum pad LED display - simple 4x4 grid"""
         try:
             self.log_message("=== UPDATING DRUM PAD LEDS ===")
 
-            # Clear all LEDs first
-            self.led_manager.clear_all()
+            # Everything outside the pad grid is off
+            frame = self.led_manager.begin_frame()
 
             # Light up 4x4 drum pad grid (rows 0-3, columns 0-3)
             for row in range(DRUM_PAD_ROWS):
@@ -190,7 +193,11 @@ class DrumMode(BaseMode):
                     color = self._get_drum_pad_color(pad_index)
 
                     self.log_message(f"  Setting LED ({col},{row}) pad={pad_index} color={color}")
-                    self.led_manager.set_led(col, row, color)
+                    frame.set(col, row, color)
+
+            self._present(frame)
+            if self.is_active():
+                self._show_selection()
 
             self.log_message("Drum pad LED update complete")
 
@@ -199,9 +206,17 @@ class DrumMode(BaseMode):
             import traceback
             self.log_message(traceback.format_exc())
 
+    def _show_selection(self):
+        """Move the white selection highlight to the selected pad"""
+        self._selection_layer.clear_all()
+        row = self._selected_pad // DRUM_PAD_COLUMNS
+        col = self._selected_pad % DRUM_PAD_COLUMNS
+        self._selection_layer.set(col, row, 'white')
+        self.led_manager.composite()
+
     def _get_drum_pad_color(self, pad_index):
         """
-        Get color for a drum pad
+        Get color for a drum pad (the selected pad is highlighted by the selection overlay)
 
         Args:
             pad_index: Pad index (0-15)
@@ -209,29 +224,13 @@ class DrumMode(BaseMode):
         Returns:
             Color name
         """
-        # Highlight selected pad in white
-        if pad_index == self._selected_pad:
-            return 'white'
-
         # Map pad index to MIDI note (36-51)
         drum_rack_note = 36 + pad_index
 
-        # If drum rack exists, check if this note has a sample
-        if self._drum_rack and hasattr(self._drum_rack, 'drum_pads'):
-            try:
-                # Drum rack pads array is indexed by MIDI note (0-127)
-                if drum_rack_note < len(self._drum_rack.drum_pads):
-                    drum_pad = self._drum_rack.drum_pads[drum_rack_note]
-
-                    # Check if pad has chains (samples loaded)
-                    has_sample = hasattr(drum_pad, 'chains') and len(drum_pad.chains) > 0
-
-                    if has_sample:
-                        # Has sample - show as green
-                        return 'green'
-
-            except Exception as e:
-                self.log_message(f"Error checking pad {pad_index} (note {drum_rack_note}): {e}")
+        # Loaded pads (with chains) come from the occupancy bitmap, not the rack
+        if self._pad_occupancy is not None and self._pad_occupancy.is_loaded(drum_rack_note):
+            # Has sample - show as green
+            return 'green'
 
         # No sample or no drum rack - show dim blue so pads are visible
         return 'blue'
@@ -271,15 +270,17 @@ class DrumMode(BaseMode):
                 # Calculate pad index (0-15)
                 pad_index = row * DRUM_PAD_COLUMNS + column
 
+                # Hit flash (decays back to the pad color)
+                self.led_manager.flash_led(column, row)
+
                 # Update selection if different
                 if pad_index != self._selected_pad:
                     old_selected = self._selected_pad
                     self._selected_pad = pad_index
                     self.log_message(f"Selected pad {pad_index} (was {old_selected})")
 
-                    # Update only the two affected pads to save MIDI bandwidth
-                    self._update_single_pad_led(old_selected)
-                    self._update_single_pad_led(pad_index)
+                    # Only the highlight moves; the pad colors underneath are unchanged
+                    self._show_selection()
 
                 # Let note pass through to drum rack
                 return False
@@ -300,9 +301,15 @@ class DrumMode(BaseMode):
         col = pad_index % DRUM_PAD_COLUMNS
         color = self._get_drum_pad_color(pad_index)
 
-        self.led_manager.set_led(col, row, color)
+        if self.framebuffer is None:
+            return
+        self.framebuffer.set(col, row, color)
+        # Commit without dispatching: this runs inside Live's pad listener, and
+        # pending track/device changes wait for the next tick
+        if self.is_active():
+            self.framebuffer.commit()
         self.log_message(f"Updated pad {pad_index} LED to {color}")
 
     def update(self):
         """Per-frame update for drum mode"""
-        pass
+        super().update()
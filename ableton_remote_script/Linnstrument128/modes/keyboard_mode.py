@@ -5,9 +5,15 @@ Displays scale notes with colored pads based on Ableton's scale settings
 
 from .base_mode import BaseMode
 from ..scales import get_scale_notes, NOTE_NAMES
+from ..led_manager import resolve_color
+from ..grid_geometry import get_geometry
+from ..color_palette import color_scheme
 from ..config import (
     LINNSTRUMENT_COLUMNS,
     LINNSTRUMENT_ROWS,
+    LINNSTRUMENT_BASE_NOTE,
+    LINNSTRUMENT_ROW_OFFSET,
+    LINNSTRUMENT_COLUMN_OFFSET,
     KEYBOARD_SKIP_TOP_ROW,
     DEFAULT_ROOT_COLOR,
     DEFAULT_SCALE_COLOR
@@ -49,45 +55,38 @@ class KeyboardMode(BaseMode):
     Keyboard mode - displays musical scales on the LinnStrument grid
     """
 
-    def __init__(self, c_instance, linnstrument, led_manager, song):
-        super().__init__(c_instance, linnstrument, led_manager, song)
+    def __init__(self, c_instance, linnstrument, led_manager, song, dispatcher=None):
+        super().__init__(c_instance, linnstrument, led_manager, song, dispatcher)
         self.current_scale = None
         self.current_root = None
         self.current_track_color = None
 
+    def _add_background_listeners(self):
+        """Keep the scale framebuffer current while other modes are shown"""
+        # Key changes fire root and scale back-to-back, and arrowing through
+        # tracks fires selected_track per track; each burst is one redraw
+        self._add_background_listener(self.song, 'add_root_note_listener',
+                                      self._changed(self._on_changed, 'root_note'))
+        self._add_background_listener(self.song, 'add_scale_name_listener',
+                                      self._changed(self._on_changed, 'scale_name'))
+        self._add_background_listener(self.song.view, 'add_selected_track_listener',
+                                      self._changed(self._on_changed, 'selected_track'))
+        self._add_background_listener(self.song, 'add_tracks_listener',
+                                      self._changed(self._on_changed, 'tracks'))
+
     def enter(self):
-        """Enter keyboard mode - set up listeners and display scale"""
+        """Enter keyboard mode - display the scale framebuffer"""
         super().enter()
-
-        # Add listeners for scale changes
-        self._add_listener(self.song, 'add_root_note_listener', self._on_scale_changed)
-        self._add_listener(self.song, 'add_scale_name_listener', self._on_scale_changed)
-        self._add_listener(self.song.view, 'add_selected_track_listener', self._on_track_changed)
-        self._add_listener(self.song, 'add_tracks_listener', self._on_tracks_changed)
-
-        # Display current scale
-        self.update_leds()
+        self.show()
         self.show_message("Linnstrument: Keyboard Mode")
 
     def exit(self):
-        """Exit keyboard mode - clean up"""
+        """Exit keyboard mode - the scale stays rendered off-screen"""
         super().exit()
-        # Clear LEDs (base class removes listeners)
-        self.led_manager.clear_all()
-
-    def _on_scale_changed(self):
-        """Called when scale or root note changes"""
-        self.log_message("Scale changed")
-        self.update_leds()
 
-    def _on_track_changed(self):
-        """Called when selected track changes"""
-        self.log_message("Track changed")
-        self.update_leds()
-
-    def _on_tracks_changed(self):
-        """Called when track list changes"""
-        self.log_message("Track list changed")
+    def _on_changed(self, changes):
+        """Called once per tick with the scale/track changes since the last one"""
+        self.log_message(f"Changed: {', '.join(sorted(changes))}")
         self.update_leds()
 
     def update_leds(self):
@@ -126,7 +125,8 @@ class KeyboardMode(BaseMode):
             self._light_scale(root, our_scale_name, track_color)
 
             # Update status message
-            self.show_message(f"Linnstrument: {root_name} {scale_name}")
+            if self.is_active():
+                self.show_message(f"Linnstrument: {root_name} {scale_name}")
 
         except Exception as e:
             self.log_message(f"Error updating scale LEDs: {e}")
@@ -141,9 +141,15 @@ class KeyboardMode(BaseMode):
             track_color: Optional Ableton track color (RGB int)
         """
         try:
+            # Render with the keyboard layout, which may not be the one the
+            # hardware has right now (drum mode changes the row offset)
+            geometry = get_geometry(LINNSTRUMENT_BASE_NOTE, LINNSTRUMENT_ROW_OFFSET,
+                                    LINNSTRUMENT_COLUMN_OFFSET, LINNSTRUMENT_COLUMNS,
+                                    LINNSTRUMENT_ROWS)
+
             # Calculate note range for LinnStrument
-            min_note = self.linnstrument.base_note
-            max_note = self.linnstrument.base_note + \
+            min_note = LINNSTRUMENT_BASE_NOTE
+            max_note = LINNSTRUMENT_BASE_NOTE + \
                       (LINNSTRUMENT_COLUMNS * 1) + (LINNSTRUMENT_ROWS * 5)
 
             # Get all scale notes
@@ -152,8 +158,9 @@ class KeyboardMode(BaseMode):
 
             # Get colors based on track color
             color_scheme = self._map_track_color_to_scheme(track_color)
-            root_color = color_scheme['root']
-            scale_color = color_scheme['other']
+            # Resolved once here rather than per cell
+            root_color = resolve_color(color_scheme['root'])
+            scale_color = resolve_color(color_scheme['other'])
 
             # Log for debugging
             root_name = NOTE_NAMES[root]
@@ -161,11 +168,11 @@ class KeyboardMode(BaseMode):
             pitch_class_names = [NOTE_NAMES[pc] for pc in pitch_classes]
             self.log_message(f"Scale notes: {pitch_class_names}")
 
-            # Clear and light scale
-            self.led_manager.clear_all()
+            # Describe the whole frame; only cells that change are sent
+            frame = self.led_manager.begin_frame()
 
             for note in scale_notes:
-                positions = self.linnstrument.get_position_for_note(note)
+                positions = geometry.positions_for_note(note)
                 is_root = (note % 12) == root
                 color = root_color if is_root else scale_color
 
@@ -173,7 +180,9 @@ class KeyboardMode(BaseMode):
                     # Skip top row if configured
                     if KEYBOARD_SKIP_TOP_ROW and row == 7:
                         continue
-                    self.led_manager.set_led(column, row, color)
+                    frame.set(column, row, color)
+
+            self._present(frame)
 
         except Exception as e:
             self.log_message(f"Error lighting scale: {e}")
@@ -186,40 +195,11 @@ class KeyboardMode(BaseMode):
             ableton_color: RGB integer or None
 
         Returns:
-            Dict with 'root' and 'other' color names
+            Dict with 'root' and 'other' colors (names or numbers)
         """
         if ableton_color is None:
             return {'root': DEFAULT_ROOT_COLOR, 'other': DEFAULT_SCALE_COLOR}
-
-        # Extract RGB components
-        r = (ableton_color >> 16) & 0xFF
-        g = (ableton_color >> 8) & 0xFF
-        b = ableton_color & 0xFF
-
-        # Map to LinnStrument colors
-        if r > g and r > b:
-            if r > 200 and g < 100:
-                return {'root': 'red', 'other': 'pink'}
-            else:
-                return {'root': 'orange', 'other': 'yellow'}
-        elif g > r and g > b:
-            if g > 200:
-                return {'root': 'green', 'other': 'lime'}
-            else:
-                return {'root': 'lime', 'other': 'green'}
-        elif b > r and b > g:
-            if b > 200:
-                return {'root': 'blue', 'other': 'cyan'}
-            else:
-                return {'root': 'cyan', 'other': 'blue'}
-        elif r > 150 and g > 150 and b < 100:
-            return {'root': 'yellow', 'other': 'lime'}
-        elif r > 150 and b > 150:
-            return {'root': 'magenta', 'other': 'pink'}
-        elif g > 150 and b > 150:
-            return {'root': 'cyan', 'other': 'blue'}
-        else:
-            return {'root': 'white', 'other': 'blue'}
+        return color_scheme(ableton_color)
 
     def handle_note(self, note, velocity, is_note_on):
         """
@@ -238,4 +218,4 @@ class KeyboardMode(BaseMode):
 
     def update(self):
         """Per-frame update (not needed for keyboard mode)"""
-        pass
+        super().update()
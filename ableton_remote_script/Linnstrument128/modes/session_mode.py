@@ -5,8 +5,14 @@ Full grid (16x8 for LS128) for launching clips and scenes
 
 from .base_mode import BaseMode
 from ..config import SESSION_ROWS, SESSION_COLUMNS
+from ..led_animation import blink
+from ..color_palette import quantize
+from ..session_model import SessionWindow, SessionModel
 import Live
 
+# Grid rows 1-6 show clips (row 0 is navigation/track stop, row 7 scene launch)
+CLIP_ROWS = SESSION_ROWS - 2
+
 
 class SessionMode(BaseMode):
     """
@@ -14,147 +20,196 @@ class SessionMode(BaseMode):
     Each pad launches a clip, LEDs show clip states and colors
     """
 
-    def __init__(self, c_instance, linnstrument, led_manager, song):
-        super().__init__(c_instance, linnstrument, led_manager, song)
+    def __init__(self, c_instance, linnstrument, led_manager, song, dispatcher=None):
+        super().__init__(c_instance, linnstrument, led_manager, song, dispatcher)
 
-        # Session navigation offsets
-        self._session_offset_x = 0  # Track offset
-        self._session_offset_y = 0  # Scene offset
+        # Tracks and scenes in view (only these are referenced, however big the set)
+        self._window = SessionWindow(song, SESSION_COLUMNS, CLIP_ROWS,
+                                     scene_span=SESSION_COLUMNS)
 
-        # Clip slot state cache
-        self._clip_slot_cache = {}
+        # Visible clip slots, with one set of listeners per slot
+        self._session_model = SessionModel(self._window, self._on_slot_changed)
 
-    def enter(self):
-        """Enter session mode - set up session grid"""
-        super().enter()
+        # Grid cells of triggered clips (in the framebuffer), and those blinking now
+        self._triggered = set()
+        self._blinking = set()
 
-        # Add listeners for session changes
-        self._add_listener(self.song.view, 'add_selected_track_listener', self._on_session_changed)
-        self._add_listener(self.song.view, 'add_selected_scene_listener', self._on_session_changed)
-        self._add_listener(self.song, 'add_tracks_listener', self._on_session_changed)
-        self._add_listener(self.song, 'add_scenes_listener', self._on_session_changed)
+        # Navigation buttons sit on an overlay, so grid redraws never repaint them
+        self._nav_layer = led_manager.add_layer('session_nav', order=1)
 
-        # Add clip slot listeners
-        self._add_clip_slot_listeners()
+    def _add_background_listeners(self):
+        """Keep the session grid current while other modes are shown"""
+        self._add_background_listener(self.song, 'add_tracks_listener',
+                                      self._changed(self._on_session_changed, 'tracks'))
+        self._add_background_listener(self.song, 'add_scenes_listener',
+                                      self._changed(self._on_session_changed, 'scenes'))
 
-        # Initial LED update
-        self.update_leds()
+        # Clip slot listeners (the session model owns them)
+        self._refresh_window()
+
+    def detach(self):
+        """Stop background updates, including the clip slot listeners"""
+        super().detach()
+        self._session_model.clear()
+
+    def enter(self):
+        """Enter session mode - show the session grid"""
+        super().enter()
+        self.show()
+        self._set_blinking(self._triggered)
+        self._show_navigation()
         self.show_message("Linnstrument: Session Mode")
 
     def exit(self):
         """Exit session mode"""
         super().exit()
-        self.led_manager.clear_all()
-
-    def _on_session_changed(self):
-        """Called when session structure changes"""
-        self.log_message("Session changed")
-        self._add_clip_slot_listeners()  # Refresh listeners
+        self._set_blinking(set())
+        self._nav_layer.clear_all()
+        self.led_manager.composite()
+
+    def _show_navigation(self):
+        """Light the navigation buttons on the bottom row"""
+        self._nav_layer.set(0, 0, 'blue')   # Scroll scenes up
+        self._nav_layer.set(1, 0, 'blue')   # Scroll scenes down
+        self._nav_layer.set(2, 0, 'cyan')   # Scroll tracks left
+        self._nav_layer.set(3, 0, 'cyan')   # Scroll tracks right
+        self.led_manager.composite()
+
+    def _on_session_changed(self, changes):
+        """Tracks or scenes were added, removed or moved (once per tick)"""
+        self.log_message(f"Session changed: {', '.join(sorted(changes))}")
+        self._refresh_window()
         self.update_leds()
 
-    def _add_clip_slot_listeners(self):
-        """Add listeners to all visible clip slots"""
+    def _refresh_window(self):
+        """Re-read the tracks/scenes in view and watch their clip slots"""
         try:
-            tracks = list(self.song.tracks)
-            scenes = list(self.song.scenes)
-
-            for track_idx in range(self._session_offset_x,
-                                  min(self._session_offset_x + SESSION_COLUMNS, len(tracks))):
-                track = tracks[track_idx]
-
-                for scene_idx in range(self._session_offset_y,
-                                      min(self._session_offset_y + SESSION_ROWS, len(scenes))):
-                    if scene_idx < len(track.clip_slots):
-                        clip_slot = track.clip_slots[scene_idx]
-
-                        # Add listeners for clip state changes
-                        self._add_listener(clip_slot, 'add_has_clip_listener', self._on_session_changed)
-                        if clip_slot.has_clip:
-                            clip = clip_slot.clip
-                            self._add_listener(clip, 'add_playing_status_listener', self._on_session_changed)
-                            self._add_listener(clip, 'add_color_listener', self._on_session_changed)
-
+            self._window.refresh()
+            self._session_model.watch(reread=True)
         except Exception as e:
-            self.log_message(f"Error adding clip slot listeners: {e}")
+            self.log_message(f"Error refreshing session window: {e}")
+
+    def _slot_cell(self, track_idx, scene_idx):
+        """Grid cell showing a clip slot (None if it isn't visible)"""
+        column = track_idx - self._window.track_offset
+        scene = scene_idx - self._window.scene_offset
+        if 0 <= column < SESSION_COLUMNS and 0 <= scene < CLIP_ROWS:
+            return column, scene + 1
+        return None
+
+    def _cell_slot(self, column, row):
+        """(track index, scene index) of the clip slot a grid cell shows"""
+        return self._window.track_offset + column, self._window.scene_offset + row - 1
+
+    def _on_slot_changed(self, track_idx, scene_idx):
+        """One visible clip slot changed - redraw just its pad"""
+        cell = self._slot_cell(track_idx, scene_idx)
+        if cell is None or self.framebuffer is None:
+            return
+
+        color, is_triggered = self._slot_state(track_idx, scene_idx)
+        self.framebuffer.set(cell[0], cell[1], color)
+
+        triggered = set(self._triggered)
+        if is_triggered:
+            triggered.add(cell)
+        else:
+            triggered.discard(cell)
+        self._triggered = triggered
+
+        if self.is_active():
+            self.framebuffer.commit()
+            self._set_blinking(triggered)
 
     def update_leds(self):
-        """Update session grid LED display"""
+        """Render the session grid from the visible clip slots"""
         try:
-            tracks = list(self.song.tracks)
-            scenes = list(self.song.scenes)
-
-            # Clear grid
-            self.led_manager.clear_all()
-
-            # Bottom row (row 0) = Navigation controls
-            self.led_manager.set_led(0, 0, 'blue')   # Scroll scenes up
-            self.led_manager.set_led(1, 0, 'blue')   # Scroll scenes down
-            self.led_manager.set_led(2, 0, 'cyan')   # Scroll tracks left
-            self.led_manager.set_led(3, 0, 'cyan')   # Scroll tracks right
-
-            # Display each clip slot (rows 1-6)
-            for grid_col in range(SESSION_COLUMNS):
-                track_idx = self._session_offset_x + grid_col
-                if track_idx >= len(tracks):
-                    continue
-
-                track = tracks[track_idx]
-
-                # Track stop button on bottom row (columns 4+)
-                if grid_col >= 4:
-                    self.led_manager.set_led(grid_col, 0, 'red')
-
-                for grid_row in range(1, SESSION_ROWS):  # Skip row 0 (navigation)
-                    scene_idx = self._session_offset_y + (grid_row - 1)
-                    if scene_idx >= len(scenes) or scene_idx >= len(track.clip_slots):
-                        continue
-
-                    clip_slot = track.clip_slots[scene_idx]
-                    color = self._get_clip_slot_color(clip_slot, track)
-
-                    # Map to LinnStrument grid (row 1-6 for clips, row 7 for scenes)
-                    linnstrument_row = grid_row
-                    self.led_manager.set_led(grid_col, linnstrument_row, color)
+            model = self._session_model
+            window = self._window
+            blinking = set()
+
+            # Build the whole grid; cells left unset are off
+            # (navigation buttons on row 0 are drawn by the nav overlay)
+            frame = self.led_manager.begin_frame()
+
+            # Track stop buttons on the bottom row (columns 4+)
+            for grid_col in range(4, len(window.tracks)):
+                frame.set(grid_col, 0, 'red')
+
+            # Clip slots (rows 1-6)
+            for track_idx, scene_idx in model.slots:
+                grid_col, grid_row = self._slot_cell(track_idx, scene_idx)
+                color, is_triggered = self._slot_state(track_idx, scene_idx)
+                frame.set(grid_col, grid_row, color)
+                if is_triggered:
+                    blinking.add((grid_col, grid_row))
 
             # Top row (row 7) = Scene launch buttons
-            for grid_col in range(min(SESSION_COLUMNS, len(scenes) - self._session_offset_y)):
-                self.led_manager.set_led(grid_col, 7, 'yellow')
+            for grid_col in range(len(window.scenes)):
+                frame.set(grid_col, 7, 'yellow')
+
+            self._present(frame)
+            self._triggered = blinking
+            if self.is_active():
+                self._set_blinking(blinking)
 
         except Exception as e:
             self.log_message(f"Error updating session LEDs: {e}")
 
-    def _get_clip_slot_color(self, clip_slot, track):
+    def _set_blinking(self, cells):
+        """Blink exactly these grid cells (triggered clips), leaving running blinks in phase"""
+        animations = self.led_manager.animations
+        for cell in self._blinking - cells:
+            animations.stop(('session_blink', cell))
+        for cell in cells - self._blinking:
+            animations.play(blink([cell], 'yellow'), key=('session_blink', cell))
+        self._blinking = cells
+
+    def _slot_state(self, track_idx, scene_idx):
+        """
+        (color, is_triggered) of a visible slot, read from Live only when it's
+        new in the window or changed since it was last drawn
         """
-        Determine color for a clip slot
+        model = self._session_model
+        state = model.state(track_idx, scene_idx)
+        if state is None:
+            state = self._get_clip_slot_state(model.slot(track_idx, scene_idx),
+                                              self._window.track(track_idx))
+            model.set_state(track_idx, scene_idx, state)
+        return state
+
+    def _get_clip_slot_state(self, clip_slot, track):
+        """
+        Determine color for a clip slot, and whether its clip is triggered
 
         Args:
             clip_slot: Live.ClipSlot.ClipSlot
             track: Live.Track.Track
 
         Returns:
-            Color name string
+            (color name string, is_triggered) - triggered clips blink
         """
         try:
             if not clip_slot.has_clip:
                 # Empty slot - dim color based on track
-                return self._get_dim_track_color(track)
+                return self._get_dim_track_color(track), False
 
             clip = clip_slot.clip
 
             # Check playing state
             if clip.is_playing:
-                return 'green'  # Playing
+                return 'green', False  # Playing
             elif clip.is_triggered:
-                return 'yellow'  # Triggered/queued
+                return 'yellow', True  # Triggered/queued
             elif clip.is_recording:
-                return 'red'  # Recording
+                return 'red', False  # Recording
             else:
                 # Stopped clip - show clip color
-                return self._map_ableton_color_to_linnstrument(clip.color)
+                return self._map_ableton_color_to_linnstrument(clip.color), False
 
         except Exception as e:
             self.log_message(f"Error getting clip slot color: {e}")
-            return 'off'
+            return 'off', False
 
     def _get_dim_track_color(self, track):
         """Get a dimmed version of track color for empty slots"""
@@ -174,31 +229,11 @@ class SessionMode(BaseMode):
             ableton_color: RGB integer
 
         Returns:
-            Color name string
+            Color name string or number
         """
         if ableton_color is None:
             return 'white'
-
-        # Extract RGB
-        r = (ableton_color >> 16) & 0xFF
-        g = (ableton_color >> 8) & 0xFF
-        b = ableton_color & 0xFF
-
-        # Map to closest LinnStrument color
-        if r > g and r > b:
-            return 'red' if r > 200 else 'orange'
-        elif g > r and g > b:
-            return 'green' if g > 200 else 'lime'
-        elif b > r and b > g:
-            return 'blue' if b > 200 else 'cyan'
-        elif r > 150 and g > 150 and b < 100:
-            return 'yellow'
-        elif r > 150 and b > 150:
-            return 'magenta'
-        elif g > 150 and b > 150:
-            return 'cyan'
-        else:
-            return 'white'
+        return quantize(ableton_color)
 
     def handle_note(self, note, velocity, is_note_on):
         """
@@ -244,28 +279,16 @@ class SessionMode(BaseMode):
                     self.navigate_session(1, 0)
                 elif column >= 4:
                     # Stop track
-                    track_idx = self._session_offset_x + (column - 4)
+                    track_idx = self._window.track_offset + (column - 4)
                     self._stop_track(track_idx)
                 return True
 
-            # Main grid (rows 1-6) = Clip launching
-            grid_row = (SESSION_ROWS - 1) - row
-            track_idx = self._session_offset_x + column
-            scene_idx = self._session_offset_y + grid_row
-
-            # Get clip slot
-            tracks = list(self.song.tracks)
-            scenes = list(self.song.scenes)
-
-            if track_idx >= len(tracks) or scene_idx >= len(scenes):
+            # Main grid (rows 1-6) = Clip launching, from the slots in view
+            track_idx, scene_idx = self._cell_slot(column, row)
+            clip_slot = self._session_model.slot(track_idx, scene_idx)
+            if clip_slot is None:
                 return True
 
-            track = tracks[track_idx]
-            if scene_idx >= len(track.clip_slots):
-                return True
-
-            clip_slot = track.clip_slots[scene_idx]
-
             # Launch clip or stop
             self._launch_clip_slot(clip_slot)
 
@@ -307,22 +330,12 @@ class SessionMode(BaseMode):
             tracks_delta: Horizontal scroll amount
             scenes_delta: Vertical scroll amount
         """
-        tracks = list(self.song.tracks)
-        scenes = list(self.song.scenes)
-
-        # Update offsets with clamping
-        self._session_offset_x = max(0, min(
-            self._session_offset_x + tracks_delta,
-            len(tracks) - SESSION_COLUMNS
-        ))
-
-        self._session_offset_y = max(0, min(
-            self._session_offset_y + scenes_delta,
-            len(scenes) - SESSION_ROWS
-        ))
-
-        self.log_message(f"Session view: tracks {self._session_offset_x}, scenes {self._session_offset_y}")
-        self._add_clip_slot_listeners()
+        # Clamped to the set; nothing to redraw if the window didn't move
+        if not self._window.scroll(tracks_delta, scenes_delta):
+            return
+
+        self.log_message(f"Session view: tracks {self._window.track_offset}, scenes {self._window.scene_offset}")
+        self._session_model.watch()
         self.update_leds()
 
     def _launch_scene(self, column):
@@ -333,11 +346,12 @@ class SessionMode(BaseMode):
             column: Grid column (maps to scene index)
         """
         try:
-            scene_idx = self._session_offset_y + (7 - column)  # Map top row to scenes
-            scenes = list(self.song.scenes)
+            # Column n launches the scene lit there (window scene n)
+            scene_idx = self._window.scene_offset + column
+            scene = self._window.scene(scene_idx)
 
-            if scene_idx < len(scenes):
-                scenes[scene_idx].fire()
+            if scene is not None:
+                scene.fire()
                 self.log_message(f"Launched scene {scene_idx}")
         except Exception as e:
             self.log_message(f"Error launching scene: {e}")
@@ -350,14 +364,14 @@ class SessionMode(BaseMode):
             track_idx: Track index
         """
         try:
-            tracks = list(self.song.tracks)
-            if track_idx < len(tracks):
-                tracks[track_idx].stop_all_clips()
+            track = self._window.track(track_idx)
+            if track is not None:
+                track.stop_all_clips()
                 self.log_message(f"Stopped track {track_idx}")
         except Exception as e:
             self.log_message(f"Error stopping track: {e}")
 
     def update(self):
         """Per-frame update for session mode"""
+        super().update()
         # Could update playing clip animations here
-        pass
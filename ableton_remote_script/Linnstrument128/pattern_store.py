@@ -0,0 +1,257 @@
+"""
+Drum pattern storage for Linnstrument
+Patterns are per-pad step bitmasks plus velocity bytes, and the whole store
+serialises to a small binary blob saved with the Live set
+"""
+
+import base64
+import struct
+
+# Longest pattern (steps; one 64-bit mask per pad)
+MAX_STEPS = 64
+
+# Velocity of a step entered from the grid
+DEFAULT_VELOCITY = 100
+
+# Default song data key the store is saved under (each script passes its own,
+# since their stores hold different numbers of patterns)
+DATA_KEY = 'linnstrument_patterns'
+
+# Blob layout (little-endian):
+#   header:  magic, version, pads, pattern count, current pattern
+#   pattern: length, bitmask of pads with steps, then for each such pad its
+#            64-bit step mask followed by one velocity byte per set step
+_MAGIC = b'LSQ'
+_VERSION = 1
+_HEADER = struct.Struct('<3sBBBB')
+_PATTERN_HEADER = struct.Struct('<BI')
+_MASK = struct.Struct('<Q')
+
+
+def iter_steps(mask):
+    """Steps set in a mask, lowest first (visits set bits only)"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Pattern:
+    """
+    One drum pattern: which steps each pad plays, and how hard
+
+    masks[pad] has bit n set when the pad plays on step n; velocities holds
+    one byte per (pad, step), meaningful only where the bit is set. Memory
+    is fixed (MAX_STEPS bytes per pad) whatever the length.
+    """
+
+    __slots__ = ('pads', 'length', 'masks', 'velocities')
+
+    def __init__(self, pads=16, length=16):
+        """
+        Initialize an empty pattern
+
+        Args:
+            pads: Number of pads
+            length: Steps (1 to MAX_STEPS)
+        """
+        self.pads = pads
+        self.length = max(1, min(length, MAX_STEPS))
+        self.masks = [0] * pads
+        self.velocities = bytearray(pads * MAX_STEPS)
+
+    @property
+    def is_empty(self):
+        """True if no pad has a step"""
+        return not any(self.masks)
+
+    def velocity(self, pad, step):
+        """Velocity of a step (0 if the pad doesn't play on it)"""
+        if (self.masks[pad] >> step) & 1:
+            return self.velocities[pad * MAX_STEPS + step]
+        return 0
+
+    def set_step(self, pad, step, velocity):
+        """Set a step's velocity (0 clears the step)"""
+        if velocity > 0:
+            self.masks[pad] |= 1 << step
+            self.velocities[pad * MAX_STEPS + step] = min(int(velocity), 127)
+        else:
+            self.masks[pad] &= ~(1 << step)
+
+    def toggle(self, pad, step, velocity=DEFAULT_VELOCITY):
+        """
+        Turn a step on (at velocity) or off
+
+        Returns:
+            The step's new velocity (0 if now off)
+        """
+        velocity = 0 if (self.masks[pad] >> step) & 1 else velocity
+        self.set_step(pad, step, velocity)
+        return velocity
+
+    def steps(self, pad):
+        """Steps the pad plays within the pattern length, lowest first"""
+        return iter_steps(self.masks[pad] & ((1 << self.length) - 1))
+
+    def clear(self):
+        """Remove every step (the length is kept)"""
+        self.masks = [0] * self.pads
+
+    def copy(self):
+        """Independent copy of the pattern"""
+        pattern = Pattern(self.pads, self.length)
+        pattern.masks = list(self.masks)
+        pattern.velocities[:] = self.velocities
+        return pattern
+
+
+class PatternStore:
+    """
+    A bank of patterns with one selected for editing
+
+    Patterns are created on first selection. The store persists through
+    song.set_data/get_data as one base64 blob under the store's key; empty
+    patterns cost 5 bytes and each pad with steps 8 bytes plus one byte per
+    step. save() only writes to the set when the blob changed.
+    """
+
+    def __init__(self, pads=16, max_patterns=16, length=16, key=DATA_KEY):
+        """
+        Initialize store with one empty pattern
+
+        Args:
+            pads: Pads per pattern
+            max_patterns: Number of pattern slots
+            length: Length of new patterns (steps)
+            key: Song data key to save under (one per script)
+        """
+        self.pads = pads
+        self.max_patterns = max_patterns
+        self.default_length = length
+        self.key = key
+        self.patterns = [Pattern(pads, length)]
+        self.current = 0
+
+        # Value last saved to or loaded from the set
+        self._saved = None
+
+    @property
+    def pattern(self):
+        """The selected pattern"""
+        return self.patterns[self.current]
+
+    def select(self, index):
+        """
+        Select a pattern slot, creating empty patterns up to it
+
+        Returns:
+            The selected Pattern
+        """
+        index = max(0, min(index, self.max_patterns - 1))
+        while len(self.patterns) <= index:
+            self.patterns.append(Pattern(self.pads, self.default_length))
+        self.current = index
+        return self.patterns[index]
+
+    def store(self, index, pattern):
+        """
+        Put a copy of a pattern in a slot and select it
+
+        Returns:
+            The stored Pattern
+        """
+        self.select(index)
+        self.patterns[self.current] = pattern.copy()
+        return self.patterns[self.current]
+
+    def has_steps(self, index):
+        """Check if a pattern slot holds any steps"""
+        return index < len(self.patterns) and not self.patterns[index].is_empty
+
+    def to_bytes(self):
+        """Serialise every pattern to a binary blob"""
+        out = bytearray(_HEADER.pack(_MAGIC, _VERSION, self.pads,
+                                     len(self.patterns), self.current))
+        for pattern in self.patterns:
+            pads_used = 0
+            for pad, mask in enumerate(pattern.masks):
+                if mask:
+                    pads_used |= 1 << pad
+            out += _PATTERN_HEADER.pack(pattern.length, pads_used)
+            for pad in iter_steps(pads_used):
+                mask = pattern.masks[pad]
+                out += _MASK.pack(mask)
+                base = pad * MAX_STEPS
+                out += bytes(pattern.velocities[base + step] for step in iter_steps(mask))
+        return bytes(out)
+
+    def from_bytes(self, blob):
+        """
+        Replace the patterns with ones read from a blob
+
+        Raises:
+            ValueError: If the blob isn't a pattern store this version can read
+        """
+        try:
+            magic, version, pads, count, current = _HEADER.unpack_from(blob, 0)
+            if magic != _MAGIC or version != _VERSION or pads != self.pads:
+                raise ValueError("unsupported pattern data")
+
+            offset = _HEADER.size
+            patterns = []
+            for _ in range(count):
+                length, pads_used = _PATTERN_HEADER.unpack_from(blob, offset)
+                offset += _PATTERN_HEADER.size
+                pattern = Pattern(pads, length)
+                for pad in iter_steps(pads_used):
+                    mask, = _MASK.unpack_from(blob, offset)
+                    offset += _MASK.size
+                    pattern.masks[pad] = mask
+                    base = pad * MAX_STEPS
+                    for step in iter_steps(mask):
+                        pattern.velocities[base + step] = blob[offset]
+                        offset += 1
+                patterns.append(pattern)
+        except (struct.error, IndexError) as e:
+            raise ValueError(f"truncated pattern data: {e}")
+
+        if not patterns:
+            patterns.append(Pattern(self.pads, self.default_length))
+        self.patterns = patterns[:self.max_patterns]
+        self.current = min(current, len(self.patterns) - 1)
+
+    def save(self, song):
+        """
+        Store the patterns with the Live set (if they changed since the last save or load)
+
+        Returns:
+            True if the set was written
+        """
+        value = base64.b64encode(self.to_bytes()).decode('ascii')
+        if value == self._saved:
+            return False
+        song.set_data(self.key, value)
+        self._saved = value
+        return True
+
+    def load(self, song):
+        """
+        Read the patterns stored with the Live set (kept as is if there are none)
+
+        Returns:
+            True if patterns were read
+
+        Raises:
+            ValueError: If the stored data can't be read
+        """
+        value = song.get_data(self.key, None)
+        if not value:
+            return False
+        try:
+            blob = base64.b64decode(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"corrupt pattern data: {e}")
+        self.from_bytes(blob)
+        self._saved = value
+        return True
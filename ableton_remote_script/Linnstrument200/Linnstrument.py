@@ -10,6 +10,8 @@ from pathlib import Path
 try:
     from .scales import get_scale_notes, note_name_to_number, NOTE_NAMES
     from .linnstrument_ableton import LinnstrumentAbletonMIDI
+    from .change_dispatcher import ChangeDispatcher
+    from .color_palette import color_scheme
     MODULES_AVAILABLE = True
 except ImportError as e:
     MODULES_AVAILABLE = False
@@ -111,12 +113,13 @@ class Linnstrument(ControlSurface):
             self.log_message(f"Warning: Could not initialize Linnstrument: {e}")
             self.show_message("Linnstrument Scale: Initialization Error")
 
-        # Add listeners for scale changes
-        self.song().add_root_note_listener(self._on_scale_changed)
-        self.song().add_scale_name_listener(self._on_scale_changed)
-
-        # Add listener for track changes
-        self.song().view.add_selected_track_listener(self._on_track_changed)
+        # Add listeners for scale and track changes; they only mark what
+        # changed, and update_display handles each burst once
+        self._dispatcher = ChangeDispatcher()
+        self.song().add_root_note_listener(self._dispatcher.listener(self._on_changed, 'root_note'))
+        self.song().add_scale_name_listener(self._dispatcher.listener(self._on_changed, 'scale_name'))
+        self.song().view.add_selected_track_listener(
+            self._dispatcher.listener(self._on_changed, 'selected_track'))
 
         # Run diagnostic to find scale API
         if DIAGNOSTIC_AVAILABLE:
@@ -134,24 +137,24 @@ class Linnstrument(ControlSurface):
 
         # Remove listeners
         try:
-            self.song().remove_root_note_listener(self._on_scale_changed)
-            self.song().remove_scale_name_listener(self._on_scale_changed)
-            self.song().view.remove_selected_track_listener(self._on_track_changed)
+            self.song().remove_root_note_listener(self._dispatcher.listener(self._on_changed, 'root_note'))
+            self.song().remove_scale_name_listener(
+                self._dispatcher.listener(self._on_changed, 'scale_name'))
+            self.song().view.remove_selected_track_listener(
+                self._dispatcher.listener(self._on_changed, 'selected_track'))
         except:
             pass
 
         ControlSurface.disconnect(self)
         self.log_message("Linnstrument Scale Light - Disconnected")
 
-    def _on_track_changed(self):
-        """Called when selected track changes"""
-        self.log_message("Track changed, updating scale...")
-        self.note_history = []  # Clear note history when changing tracks
-        self._update_scale()
-
-    def _on_scale_changed(self):
-        """Called when scale or root note changes"""
-        self.log_message("Scale changed, updating Linnstrument...")
+    def _on_changed(self, changes):
+        """Called once per tick when the scale, root note and/or selected track changed"""
+        if 'selected_track' in changes:
+            self.log_message("Track changed, updating scale...")
+            self.note_history = []  # Clear note history when changing tracks
+        else:
+            self.log_message("Scale changed, updating Linnstrument...")
         self._update_scale()
 
     def _update_scale(self):
@@ -231,44 +234,8 @@ class Linnstrument(ControlSurface):
             # Default: red for root, blue for other scale notes
             return {'root': 'red', 'other': 'blue'}
 
-        # Ableton colors are RGB integers (0-16777215)
-        # Extract RGB components
-        r = (ableton_color >> 16) & 0xFF
-        g = (ableton_color >> 8) & 0xFF
-        b = ableton_color & 0xFF
-
-        # Map to closest Linnstrument color based on dominant RGB channel
-        # Use bright color for root, dimmer/related color for other scale notes
-        if r > g and r > b:
-            # Red dominant
-            if r > 200 and g < 100:
-                return {'root': 'red', 'other': 'pink'}
-            else:
-                return {'root': 'orange', 'other': 'yellow'}
-        elif g > r and g > b:
-            # Green dominant
-            if g > 200:
-                return {'root': 'green', 'other': 'lime'}
-            else:
-                return {'root': 'lime', 'other': 'green'}
-        elif b > r and b > g:
-            # Blue dominant
-            if b > 200:
-                return {'root': 'blue', 'other': 'cyan'}
-            else:
-                return {'root': 'cyan', 'other': 'blue'}
-        elif r > 150 and g > 150 and b < 100:
-            # Yellow
-            return {'root': 'yellow', 'other': 'lime'}
-        elif r > 150 and b > 150:
-            # Magenta
-            return {'root': 'magenta', 'other': 'pink'}
-        elif g > 150 and b > 150:
-            # Cyan
-            return {'root': 'cyan', 'other': 'blue'}
-        else:
-            # Default/White
-            return {'root': 'white', 'other': 'blue'}
+        # Nearest LED color by lookup, then its root/other pair
+        return color_scheme(ableton_color)
 
     def _light_scale(self, root, scale_name, track_color=None):
         """Update Linnstrument lights with the scale"""
@@ -320,8 +287,15 @@ class Linnstrument(ControlSurface):
         pass
 
     def update_display(self):
-        """Update display (required by API but not used)"""
-        pass
+        """Called periodically - send queued LED writes within the per-tick budget"""
+        # Both are missing if initialization failed
+        dispatcher = getattr(self, '_dispatcher', None)
+        if dispatcher is not None:
+            dispatcher.dispatch()
+
+        # linnstrument is None if the controller couldn't be initialized
+        if getattr(self, 'linnstrument', None) is not None:
+            self.linnstrument.flush_leds()
 
     def receive_midi(self, midi_bytes):
         """Receive MIDI and analyze for scale detection"""
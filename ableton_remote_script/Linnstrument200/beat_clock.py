@@ -0,0 +1,136 @@
+"""
+Beat clock for Linnstrument
+Turns Live's current_song_time notifications into quantised step, beat and
+bar callbacks
+"""
+
+# Song time resolution (divides into 16ths, 32nds and triplets)
+TICKS_PER_BEAT = 96
+
+
+class BeatClock:
+    """
+    One current_song_time listener shared by every subscriber
+
+    Live notifies current_song_time at UI rate, many times per step. The
+    clock converts song time to integer ticks once per notification and
+    remembers the window of ticks in which no subscriber's interval changes;
+    notifications inside it return straight away. On leaving it, each
+    subscriber whose interval changed is called once with the new interval
+    index (e.g. the 16th-note count since the start of the song, or since a
+    clip's launch for a subscription offset to the clip's steps).
+
+    The listener is only connected while there are subscribers.
+    """
+
+    def __init__(self, song, ticks_per_beat=TICKS_PER_BEAT):
+        """
+        Initialize clock
+
+        Args:
+            song: Live.Song.Song
+            ticks_per_beat: Song time resolution
+        """
+        self.song = song
+        self.ticks_per_beat = ticks_per_beat
+
+        # Subscriptions: [callback, interval in ticks, current index, offset in ticks]
+        self._subscriptions = []
+
+        # Bumped on (un)subscribe, so a callback subscribing invalidates the window
+        self._generation = 0
+
+        # Ticks [_window_start, _window_end) where no subscriber's index changes
+        self._window_start = 0
+        self._window_end = 0
+
+        self._listening = False
+
+        # Song time at the last notification (read by subscribers, no API call)
+        self.song_time = 0.0
+
+        # Counters
+        self.notifications = 0
+        self.callbacks = 0
+
+    def bar_length(self):
+        """Beats in a bar at the song's time signature"""
+        return self.song.signature_numerator * 4.0 / self.song.signature_denominator
+
+    def subscribe(self, callback, beats, offset=0.0):
+        """
+        Call a function at every interval boundary
+
+        Args:
+            callback: Function taking the interval index ((song time - offset) // beats);
+                      called on the first notification, then when it changes
+            beats: Interval in beats (0.25 for 16th-note steps, 1 for beats,
+                   bar_length() for bars)
+            offset: Song time of a boundary, in beats (e.g. where a clip's
+                    steps start when it was launched off the grid)
+
+        Returns:
+            Handle for unsubscribe()
+        """
+        interval = max(int(round(beats * self.ticks_per_beat)), 1)
+        offset_ticks = int(round(offset * self.ticks_per_beat)) % interval
+        subscription = [callback, interval, None, offset_ticks]
+        self._subscriptions.append(subscription)
+        self._invalidate()
+        if not self._listening:
+            self.song.add_current_song_time_listener(self._on_song_time_changed)
+            self._listening = True
+        return subscription
+
+    def unsubscribe(self, handle):
+        """Stop calling a subscriber (disconnects from Live after the last one)"""
+        if handle in self._subscriptions:
+            self._subscriptions.remove(handle)
+            self._invalidate()
+        if not self._subscriptions:
+            self.disconnect()
+
+    def disconnect(self):
+        """Drop every subscriber and remove the song time listener"""
+        self._subscriptions = []
+        self._invalidate()
+        if self._listening:
+            try:
+                self.song.remove_current_song_time_listener(self._on_song_time_changed)
+            except Exception:
+                pass  # Song is gone (script unloading)
+            self._listening = False
+
+    def _invalidate(self):
+        """Make the next notification look at every subscriber"""
+        self._generation += 1
+        self._window_start = self._window_end = 0
+
+    def _on_song_time_changed(self):
+        """current_song_time listener: call the subscribers whose interval changed"""
+        self.notifications += 1
+        self.song_time = self.song.current_song_time
+        # The epsilon keeps float jitter from landing just short of a boundary
+        tick = int(self.song_time * self.ticks_per_beat + 1e-6)
+        if self._window_start <= tick < self._window_end:
+            return
+
+        generation = self._generation
+        start = 0
+        end = None
+        for subscription in list(self._subscriptions):
+            callback, interval, index, offset = subscription
+            new_index = (tick - offset) // interval
+            if new_index != index:
+                subscription[2] = new_index
+                self.callbacks += 1
+                callback(new_index)
+
+            # Window where this subscriber's index stays the same
+            start = max(start, new_index * interval + offset)
+            boundary = (new_index + 1) * interval + offset
+            end = boundary if end is None else min(end, boundary)
+
+        if generation == self._generation and end is not None:
+            self._window_start = start
+            self._window_end = end
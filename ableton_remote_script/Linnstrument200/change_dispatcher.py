@@ -0,0 +1,85 @@
+"""
+Coalesced change dispatch for Live listeners
+Listeners only record what changed; the handlers run once per display tick
+"""
+
+
+class ChangeDispatcher:
+    """
+    Turns bursts of Live notifications into one handler call per tick
+
+    Live fires listeners synchronously and often back-to-back: changing the
+    key fires root_note then scale_name, and arrowing through tracks fires
+    selected_track for every track passed. Listeners created with listener()
+    just mark their handler dirty. dispatch(), called from update_display,
+    runs each dirty handler once with the set of changes seen since the
+    previous tick.
+    """
+
+    def __init__(self):
+        # handler -> set of change names, in the order handlers were first marked
+        self._pending = {}
+
+        # (handler, change) -> listener callback, so add/remove get the same object
+        self._listeners = {}
+
+        # Counters
+        self.marks = 0
+        self.dispatches = 0
+
+    def listener(self, handler, change):
+        """
+        Get the Live listener callback that marks a change for a handler
+
+        The same callback is returned for the same (handler, change), so it
+        can be passed to both add_*_listener and remove_*_listener.
+
+        Args:
+            handler: Function taking the set of changes, e.g. self._on_changed
+            change: Name recorded for this listener (e.g. 'root_note')
+        """
+        key = (handler, change)
+        callback = self._listeners.get(key)
+        if callback is None:
+            def callback():
+                self.mark(handler, change)
+            self._listeners[key] = callback
+        return callback
+
+    def mark(self, handler, change):
+        """Record a change; handler runs on the next dispatch()"""
+        self.marks += 1
+        changes = self._pending.get(handler)
+        if changes is None:
+            self._pending[handler] = {change}
+        else:
+            changes.add(change)
+
+    def cancel(self, handler):
+        """Drop a handler's pending changes (e.g. when its owner goes away)"""
+        self._pending.pop(handler, None)
+
+    def is_pending(self, handler=None):
+        """Check if a handler (or any handler) has changes waiting"""
+        if handler is None:
+            return bool(self._pending)
+        return handler in self._pending
+
+    def dispatch(self):
+        """
+        Run every marked handler once with the union of its changes
+
+        Changes marked while handlers run (by the handlers themselves) wait
+        for the next dispatch, so one tick never loops.
+
+        Returns:
+            Number of handlers run
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        for handler, changes in pending.items():
+            self.dispatches += 1
+            handler(changes)
+        return len(pending)
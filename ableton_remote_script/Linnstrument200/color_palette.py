@@ -0,0 +1,159 @@
+"""
+Color quantisation for Linnstrument
+Maps Live's RGB clip and track colors to the nearest LinnStrument LED color
+"""
+
+from .linnstrument_ableton import COLORS
+
+# Hue of each colored LED as a fully saturated, full brightness RGB triple.
+# Values are matched against these after being stretched the same way; white
+# is for grays only and 'off' is never a match (a colored clip or track
+# should always be visible).
+PALETTE_RGB = {
+    'red': (255, 0, 0),
+    'orange': (255, 128, 0),
+    'yellow': (255, 255, 0),
+    'lime': (128, 255, 0),
+    'green': (0, 255, 0),
+    'cyan': (0, 255, 255),
+    'blue': (0, 0, 255),
+    'magenta': (255, 0, 255),
+    'pink': (255, 0, 128),
+}
+
+# Root and other-scale-note colors for a track of each LED color
+COLOR_SCHEMES = {
+    'red': ('red', 'pink'),
+    'orange': ('orange', 'yellow'),
+    'yellow': ('yellow', 'lime'),
+    'lime': ('lime', 'green'),
+    'green': ('green', 'lime'),
+    'cyan': ('cyan', 'blue'),
+    'blue': ('blue', 'cyan'),
+    'magenta': ('magenta', 'pink'),
+    'pink': ('pink', 'magenta'),
+    'white': ('white', 'blue'),
+}
+
+# Below this chroma (max - min channel, as a fraction of 255 of the
+# brightest channel) a color counts as gray and shows white
+GRAY_CHROMA = 32
+
+# Bits kept per channel in the lookup table (4 bits: 4096 entries)
+LUT_BITS = 4
+
+# Live's clip/track color palette (color_index 0-69, row by row as shown in
+# Live's color chooser). These are matched exactly; anything else goes
+# through the lookup table.
+LIVE_CLIP_COLORS = (
+    0xFF94A6, 0xFFA529, 0xCC9927, 0xF7F47C, 0xBFFB00, 0x1AFF2F, 0x25FFA8,
+    0x5CFFE8, 0x8BC5FF, 0x5480E4, 0x92A7FF, 0xD86CE4, 0xE553A0, 0xFFFFFF,
+    0xFF3636, 0xF66C03, 0x99724B, 0xFFF034, 0x87FF67, 0x3DC300, 0x00BFAF,
+    0x19E9FF, 0x10A4EE, 0x007DC0, 0x886CE4, 0xB677C6, 0xFF39D4, 0xD0D0D0,
+    0xE2675A, 0xFFA374, 0xD3AD71, 0xEDFFAE, 0xD2E498, 0xBAD074, 0x9BC48D,
+    0xD4FDE1, 0xCDF1F8, 0xB9C1E3, 0xCDBBE4, 0xAE98E5, 0xE5DCE1, 0xA9A9A9,
+    0xC6928B, 0xB78256, 0x99836A, 0xBFBA69, 0xA6BE00, 0x7DB04D, 0x88C2BA,
+    0x9BB3C4, 0x85A5C2, 0x8393CC, 0xA595B5, 0xBF9FBE, 0xBC7196, 0x7B7B7B,
+    0xAF3333, 0xA95131, 0x724F41, 0xDBC300, 0x85961F, 0x539F31, 0x0A9C8E,
+    0x236384, 0x1A2F96, 0x2F52A2, 0x624BAD, 0xA34BAD, 0xCC2E6E, 0x3C3C3C,
+)
+
+_PALETTE = [(COLORS[name], rgb) for name, rgb in PALETTE_RGB.items()]
+
+# Color number -> {'root': number, 'other': number}
+_SCHEMES = {COLORS[name]: {'root': COLORS[root], 'other': COLORS[other]}
+            for name, (root, other) in COLOR_SCHEMES.items()}
+
+# Built on first use by _lut()
+_LUT = None
+
+
+def _distance(a, b):
+    """
+    Perceptual distance between two RGB triples ("redmean" weighted
+    Euclidean, squared): green differences count most, and red and blue are
+    weighted by how red the pair is
+    """
+    rmean = (a[0] + b[0]) >> 1
+    dr = a[0] - b[0]
+    dg = a[1] - b[1]
+    db = a[2] - b[2]
+    return (((512 + rmean) * dr * dr) >> 8) + 4 * dg * dg + (((767 - rmean) * db * db) >> 8)
+
+
+def nearest_color(r, g, b):
+    """
+    Find the LED color closest to an RGB value (full search, no caching)
+
+    LEDs have no brightness or saturation control, so the value is first
+    stretched to full brightness and saturation: dark and pastel colors match
+    their hue rather than collapsing to white, and only grays show white.
+
+    Returns:
+        Color number
+    """
+    peak = max(r, g, b)
+    low = min(r, g, b)
+    chroma = peak - low
+    if chroma * 255 < GRAY_CHROMA * peak or chroma == 0:
+        return COLORS['white']
+
+    rgb = ((r - low) * 255 // chroma, (g - low) * 255 // chroma, (b - low) * 255 // chroma)
+    return min(_PALETTE, key=lambda entry: _distance(rgb, entry[1]))[0]
+
+
+def _lut():
+    """Build (once) the table of nearest colors over LUT_BITS bits per channel"""
+    global _LUT
+    if _LUT is None:
+        levels = 1 << LUT_BITS
+        shift = 8 - LUT_BITS
+        half = 1 << (shift - 1)
+        # Each entry is the color of its bucket's center
+        centers = [(level << shift) | half for level in range(levels)]
+        _LUT = bytes(nearest_color(r, g, b)
+                     for r in centers for g in centers for b in centers)
+    return _LUT
+
+
+def quantize(ableton_color):
+    """
+    Map an Ableton clip/track color to an LED color
+
+    Live's palette colors are one dict lookup (matched exactly, since a
+    lookup table bucket can straddle two LED colors); any other value is one
+    lookup table index.
+
+    Args:
+        ableton_color: RGB integer (0xRRGGBB)
+
+    Returns:
+        Color number
+    """
+    color = _CLIP_COLORS.get(ableton_color)
+    if color is not None:
+        return color
+
+    r = (ableton_color >> 16) & 0xFF
+    g = (ableton_color >> 8) & 0xFF
+    b = ableton_color & 0xFF
+    shift = 8 - LUT_BITS
+    return _lut()[((r >> shift) << (2 * LUT_BITS)) | ((g >> shift) << LUT_BITS) | (b >> shift)]
+
+
+# Live palette RGB int -> color number, searched exactly once at import
+_CLIP_COLORS = {rgb: nearest_color((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF)
+                for rgb in LIVE_CLIP_COLORS}
+
+
+def color_scheme(ableton_color):
+    """
+    Root and other-scale-note colors for a track color
+
+    Args:
+        ableton_color: RGB integer
+
+    Returns:
+        Dict with 'root' and 'other' color numbers (shared; don't modify)
+    """
+    return _SCHEMES[quantize(ableton_color)]
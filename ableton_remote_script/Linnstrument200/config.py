@@ -35,6 +35,17 @@ DRUM_PAD_EXTENDED_COLUMNS = 25  # Full width for duplicate detection (LinnStrume
 SEQUENCER_ROWS = 4  # Top 4 rows (4-7) for sequencer
 SEQUENCER_COLUMNS = 8  # 8 columns for sequencer
 SEQUENCER_STEPS = 8  # 8 steps visible at once
+SEQUENCER_STEP_LENGTH = 0.25  # Beats per step (16th notes)
+SEQUENCER_MAX_STEPS = 64  # Longest pattern (pages of SEQUENCER_STEPS)
+SEQUENCER_PATTERNS = 16  # Pattern slots
+SEQUENCER_DATA_KEY = 'linnstrument200_patterns'  # Song data key the patterns are saved under
+SEQUENCER_PAGE_ROW = 7  # Page buttons: top row, columns 9-16 (right of the steps)
+SEQUENCER_PAGE_COLUMN = 9
+SEQUENCER_PATTERN_ROW = 6  # Pattern buttons: row 6, columns 9-24
+SEQUENCER_PATTERN_COLUMN = 9
+SEQUENCER_LENGTH_ROW = 5  # Length buttons: row 5, columns 9-16 (the pattern ends at that page)
+SEQUENCER_LENGTH_COLUMN = 9
+DRUM_BASE_NOTE = 36  # MIDI note of pad 0 (C1, the first pad of a drum rack)
 
 # Session Mode Configuration
 SESSION_ROWS = 8  # Full grid height
@@ -44,6 +55,17 @@ SESSION_SCENE_LAUNCH_COLUMN = None  # Optional: column for scene launch
 # Keyboard Mode Configuration
 KEYBOARD_SKIP_TOP_ROW = False  # Whether to reserve top row for track selection
 
+# LED Output
+# LED writes are queued and drained from update_display (about every 100 ms),
+# at most this many MIDI messages per tick, so big redraws spread over a few ticks
+LED_MESSAGES_PER_TICK = 150
+
+# LED animations (pulses, blinks, hit flashes) are advanced from update_display:
+# at most ANIMATION_FPS frames per second, each costing at most
+# ANIMATION_MESSAGES_PER_FRAME messages of the tick's budget
+ANIMATION_FPS = 10
+ANIMATION_MESSAGES_PER_FRAME = 48
+
 # Color Schemes
 DEFAULT_ROOT_COLOR = 'red'
 DEFAULT_SCALE_COLOR = 'blue'
@@ -4,7 +4,186 @@ Handles LED updates across all modes with optimization and batching
 """
 
 from .linnstrument_ableton import COLORS
-from .config import LINNSTRUMENT_COLUMNS, LINNSTRUMENT_ROWS
+from .config import (
+    LINNSTRUMENT_COLUMNS,
+    LINNSTRUMENT_ROWS,
+    ANIMATION_FPS,
+    ANIMATION_MESSAGES_PER_FRAME
+)
+from .led_animation import AnimationTimeline, flash, pulse
+
+# Stacking order of the animation overlay (above every mode overlay)
+ANIMATION_LAYER_ORDER = 100
+
+
+# Cells in the grid; caches and frames are flat byte arrays indexed row * columns + column
+GRID_SIZE = LINNSTRUMENT_COLUMNS * LINNSTRUMENT_ROWS
+
+# Layer cell value that shows whatever is underneath
+TRANSPARENT = 0xFF
+
+
+def resolve_color(color):
+    """
+    Convert a color name to its number (numbers pass through)
+
+    Resolve colors once, outside per-cell loops; the cache and frames store
+    color numbers.
+    """
+    if isinstance(color, str):
+        return COLORS.get(color.lower(), 0)
+    return color
+
+
+def cell_index(column, row):
+    """Index of a cell in a flat LED cache or frame"""
+    return row * LINNSTRUMENT_COLUMNS + column
+
+
+def _clip_region(start_col, end_col, start_row, end_row):
+    """Clip an inclusive region to the grid, returning half-open column/row ranges"""
+    return (max(start_col, 0), min(end_col + 1, LINNSTRUMENT_COLUMNS),
+            max(start_row, 0), min(end_row + 1, LINNSTRUMENT_ROWS))
+
+
+class LEDFrame:
+    """
+    Complete desired state of the grid, built off-line and applied in one commit
+
+    Every cell starts as the frame's fill color, so a mode only sets the cells
+    it lights. Committing diffs the frame against the LED cache and sends only
+    the cells that changed. As a context manager, the frame commits on exit:
+
+        with led_manager.begin_frame() as frame:
+            frame.set(0, 0, 'red')
+    """
+
+    def __init__(self, led_manager, color='off'):
+        """
+        Initialize frame
+
+        Args:
+            led_manager: LEDManager the frame commits to
+            color: Fill color for cells that aren't set
+        """
+        self.led_manager = led_manager
+        fill = resolve_color(color)
+
+        # Desired LED states, one byte per cell (same layout as the cache)
+        self.cells = bytearray([fill]) * GRID_SIZE
+
+        # FrameReport from commit()
+        self.report = None
+
+    def set(self, column, row, color):
+        """Set one cell (out-of-range cells are ignored)"""
+        if 0 <= column < LINNSTRUMENT_COLUMNS and 0 <= row < LINNSTRUMENT_ROWS:
+            self.cells[row * LINNSTRUMENT_COLUMNS + column] = resolve_color(color)
+
+    def get(self, column, row):
+        """Get a cell's color number (None if out of range)"""
+        if 0 <= column < LINNSTRUMENT_COLUMNS and 0 <= row < LINNSTRUMENT_ROWS:
+            return self.cells[row * LINNSTRUMENT_COLUMNS + column]
+        return None
+
+    def fill_region(self, start_col, end_col, start_row, end_row, color):
+        """Fill a rectangular region (inclusive ranges)"""
+        start_col, stop_col, start_row, stop_row = _clip_region(start_col, end_col,
+                                                                start_row, end_row)
+        if start_col >= stop_col:
+            return
+        span = bytes([resolve_color(color)]) * (stop_col - start_col)
+        for row in range(start_row, stop_row):
+            base = row * LINNSTRUMENT_COLUMNS
+            self.cells[base + start_col:base + stop_col] = span
+
+    def commit(self, force=False):
+        """Send the frame (see LEDManager.commit)"""
+        self.report = self.led_manager.commit(self, force=force)
+        return self.report
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Don't show a half-built frame
+        if exc_type is None:
+            self.commit()
+
+
+class LEDLayer:
+    """
+    Overlay drawn on top of the base grid (playhead, selection, buttons)
+
+    Cells are TRANSPARENT until set. Changes are only recorded here; they
+    reach the hardware on the next LEDManager.composite(), which recomputes
+    and sends just the cells the layer touched:
+
+        playhead.clear_column(old_step)
+        playhead.fill_region(new_step, new_step, 4, 7, 'yellow')
+        led_manager.composite()
+    """
+
+    def __init__(self, name, order=0):
+        """
+        Initialize layer
+
+        Args:
+            name: Layer name (unique per LEDManager)
+            order: Stacking order; higher layers are drawn over lower ones
+        """
+        self.name = name
+        self.order = order
+        self.cells = bytearray([TRANSPARENT]) * GRID_SIZE
+
+        # Indices of cells changed since the last composite
+        self._dirty = set()
+
+    @property
+    def is_dirty(self):
+        """True if the layer has changes that haven't been composited"""
+        return bool(self._dirty)
+
+    def set(self, column, row, color):
+        """Set one cell (out-of-range cells are ignored)"""
+        if 0 <= column < LINNSTRUMENT_COLUMNS and 0 <= row < LINNSTRUMENT_ROWS:
+            index = row * LINNSTRUMENT_COLUMNS + column
+            color = resolve_color(color)
+            if self.cells[index] != color:
+                self.cells[index] = color
+                self._dirty.add(index)
+
+    def get(self, column, row):
+        """Get a cell's color number (TRANSPARENT if unset, None if out of range)"""
+        if 0 <= column < LINNSTRUMENT_COLUMNS and 0 <= row < LINNSTRUMENT_ROWS:
+            return self.cells[row * LINNSTRUMENT_COLUMNS + column]
+        return None
+
+    def clear(self, column, row):
+        """Make one cell transparent"""
+        self.set(column, row, TRANSPARENT)
+
+    def fill_region(self, start_col, end_col, start_row, end_row, color):
+        """Fill a rectangular region (inclusive ranges)"""
+        start_col, stop_col, start_row, stop_row = _clip_region(start_col, end_col,
+                                                                start_row, end_row)
+        for row in range(start_row, stop_row):
+            for column in range(start_col, stop_col):
+                self.set(column, row, color)
+
+    def clear_region(self, start_col, end_col, start_row, end_row):
+        """Make a rectangular region transparent (inclusive ranges)"""
+        self.fill_region(start_col, end_col, start_row, end_row, TRANSPARENT)
+
+    def clear_column(self, column):
+        """Make a column transparent"""
+        self.fill_region(column, column, 0, LINNSTRUMENT_ROWS - 1, TRANSPARENT)
+
+    def clear_all(self):
+        """Make every cell transparent"""
+        cells = self.cells
+        self._dirty.update(index for index in range(GRID_SIZE) if cells[index] != TRANSPARENT)
+        self.cells = bytearray([TRANSPARENT]) * GRID_SIZE
 
 
 class LEDManager:
@@ -12,7 +191,13 @@ class LEDManager:
     Manages LED state and updates for the LinnStrument grid
     - Caches LED states to minimize MIDI traffic
     - Batches updates for efficiency
+    - Composites overlay layers over the base grid
+    - Plays LED animations on the top overlay
     - Mode-specific LED update methods
+
+    set_led, frames and the fill/clear methods draw the base grid. Overlays
+    from add_layer() are drawn over it, so moving an overlay never requires
+    repainting the base.
     """
 
     def __init__(self, linnstrument, c_instance):
@@ -26,9 +211,21 @@ class LEDManager:
         self.linnstrument = linnstrument
         self.c_instance = c_instance
 
-        # Cache LED states [column][row] = color_value
-        self._led_cache = [[0 for _ in range(LINNSTRUMENT_ROWS)]
-                          for _ in range(LINNSTRUMENT_COLUMNS)]
+        # Cache LED states, one color number per cell at row * LINNSTRUMENT_COLUMNS + column
+        # This is what the hardware shows: the base grid with overlays on top
+        self._led_cache = bytearray(GRID_SIZE)
+
+        # Base grid as drawn by the modes, before overlays
+        self._base = bytearray(GRID_SIZE)
+
+        # Overlay layers, lowest first, and their merged cells (TRANSPARENT where none is lit)
+        self._layers = []
+        self._overlay = bytearray([TRANSPARENT]) * GRID_SIZE
+
+        # Animations, drawn on their own overlay by update_animations()
+        self.animations = AnimationTimeline(fps=ANIMATION_FPS,
+                                            max_messages=ANIMATION_MESSAGES_PER_FRAME)
+        self._animation_layer = self.add_layer('animation', order=ANIMATION_LAYER_ORDER)
 
         # Dirty flag to track if cache needs refresh
         self._dirty = True
@@ -47,19 +244,99 @@ class LEDManager:
             return
 
         # Convert color name to number
-        if isinstance(color, str):
-            color_num = COLORS.get(color.lower(), 0)
-        else:
-            color_num = color
+        color_num = resolve_color(color)
+
+        index = row * LINNSTRUMENT_COLUMNS + column
+        self._base[index] = color_num
+
+        # An overlay hides the base cell
+        if self._overlay[index] != TRANSPARENT:
+            color_num = self._overlay[index]
 
         # Check cache to avoid redundant MIDI messages
-        if not force and self._led_cache[column][row] == color_num:
+        if not force and self._led_cache[index] == color_num:
             return
 
         # Update cache and hardware
-        self._led_cache[column][row] = color_num
+        self._led_cache[index] = color_num
         self.linnstrument.set_cell_color(column, row, color_num)
 
+    def _write_batch(self, led_list, force=False):
+        """
+        Update the cache for a batch of LEDs and send the changed ones as one ordered batch
+
+        Args:
+            led_list: Iterable of (column, row, color) tuples
+            force: If True, bypass cache
+
+        Returns:
+            FrameReport for the cells sent (None while LED output is deferred;
+            the cells go out on the next LinnstrumentAbletonMIDI.flush_leds)
+        """
+        cache, base, overlay = self._led_cache, self._base, self._overlay
+        changed = []
+
+        for column, row, color in led_list:
+            if not (0 <= column < LINNSTRUMENT_COLUMNS and 0 <= row < LINNSTRUMENT_ROWS):
+                continue
+
+            color = resolve_color(color)
+            index = row * LINNSTRUMENT_COLUMNS + column
+            base[index] = color
+            if overlay[index] != TRANSPARENT:
+                color = overlay[index]
+
+            if not force and cache[index] == color:
+                continue
+
+            cache[index] = color
+            changed.append((column, row, color))
+
+        return self.linnstrument.set_cells(changed)
+
+    def _write_span(self, row, start_col, values, changed, force=False):
+        """
+        Write a run of base cells in one row, collecting the displayed cells that change
+
+        The run is compared to the cache as one slice, so an unchanged run costs
+        a single bytes comparison. Cells under an overlay keep the overlay color.
+
+        Args:
+            row: Row index
+            start_col: Column of the first value
+            values: bytes of color numbers, already clipped to the grid
+            changed: List that (column, row, color) tuples are appended to
+            force: If True, treat every cell as changed
+        """
+        start = row * LINNSTRUMENT_COLUMNS + start_col
+        stop = start + len(values)
+        self._base[start:stop] = values
+
+        overlay = self._overlay[start:stop]
+        if overlay.count(TRANSPARENT) != len(overlay):
+            values = bytes(color if above == TRANSPARENT else above
+                           for color, above in zip(values, overlay))
+
+        cached = self._led_cache[start:stop]
+        if cached == values and not force:
+            return
+
+        for offset, color in enumerate(values):
+            if force or cached[offset] != color:
+                changed.append((start_col + offset, row, color))
+        self._led_cache[start:stop] = values
+
+    def _fill_rows(self, start_col, end_col, start_row, end_row, color, force=False):
+        """Fill a region (inclusive ranges) through the cache and send the changed cells"""
+        start_col, stop_col, start_row, stop_row = _clip_region(start_col, end_col,
+                                                                start_row, end_row)
+        changed = []
+        if start_col < stop_col:
+            span = bytes([resolve_color(color)]) * (stop_col - start_col)
+            for row in range(start_row, stop_row):
+                self._write_span(row, start_col, span, changed, force=force)
+        return self.linnstrument.set_cells(changed)
+
     def set_leds_batch(self, led_list, force=False):
         """
         Set multiple LEDs efficiently
@@ -68,34 +345,83 @@ class LEDManager:
             led_list: List of (column, row, color) tuples
             force: If True, bypass cache
         """
-        for column, row, color in led_list:
-            self.set_led(column, row, color, force=force)
+        self._write_batch(led_list, force=force)
+
+    def begin_frame(self, color='off'):
+        """
+        Start a frame transaction
+
+        Describe the complete desired grid on the returned frame, then call
+        frame.commit() (or use it as a context manager). Nothing is sent until
+        the commit, and then only cells that differ from what is displayed.
+
+        Args:
+            color: Fill color for cells the frame doesn't set
+
+        Returns:
+            LEDFrame
+        """
+        return LEDFrame(self, color)
+
+    def commit(self, frame, force=False):
+        """
+        Apply a frame, sending only the cells that differ from the cache
+
+        The frame replaces the base grid; overlays stay on top. An unchanged
+        frame costs one bytes comparison; otherwise rows are compared as
+        slices and only differing rows are scanned cell by cell.
+        While the cache is dirty (before the first commit or refresh, or after
+        invalidate_cache) the hardware state is unknown, so every cell is sent.
+
+        Args:
+            frame: LEDFrame from begin_frame()
+            force: If True, send every cell
+
+        Returns:
+            FrameReport for the cells sent (None while LED output is deferred;
+            the cells go out on the next LinnstrumentAbletonMIDI.flush_leds)
+        """
+        force = force or self._dirty
+        changed = []
+
+        if force or self._base != frame.cells:
+            wanted = frame.cells
+            for row in range(LINNSTRUMENT_ROWS):
+                start = row * LINNSTRUMENT_COLUMNS
+                self._write_span(row, 0, wanted[start:start + LINNSTRUMENT_COLUMNS],
+                                 changed, force=force)
+
+        self._dirty = False
+        return self.linnstrument.set_cells(changed)
 
     def clear_all(self, skip_rows=None, force=True):
         """
-        Clear all LEDs
+        Clear all LEDs of the base grid (overlays stay lit; clear their layers)
 
         Args:
             skip_rows: List of row indices to skip (e.g., [7] to preserve top row)
             force: Force clear even if cache says LED is already off
         """
         skip_rows = skip_rows or []
+        span = bytes([COLORS['off']]) * LINNSTRUMENT_COLUMNS
 
+        changed = []
         for row in range(LINNSTRUMENT_ROWS):
-            if row in skip_rows:
-                continue
-            for column in range(LINNSTRUMENT_COLUMNS):
-                self.set_led(column, row, 'off', force=force)
+            if row not in skip_rows:
+                self._write_span(row, 0, span, changed, force=force)
+        self.linnstrument.set_cells(changed)
+
+        # A forced full clear leaves the hardware matching the cache
+        if force and not skip_rows:
+            self._dirty = False
 
     def clear_row(self, row):
         """Clear all LEDs in a specific row"""
-        for column in range(LINNSTRUMENT_COLUMNS):
-            self.set_led(column, row, 'off')
+        self._fill_rows(0, LINNSTRUMENT_COLUMNS - 1, row, row, 'off')
 
     def clear_column(self, column):
         """Clear all LEDs in a specific column"""
-        for row in range(LINNSTRUMENT_ROWS):
-            self.set_led(column, row, 'off')
+        self._fill_rows(column, column, 0, LINNSTRUMENT_ROWS - 1, 'off')
 
     def clear_region(self, start_col, end_col, start_row, end_row):
         """
@@ -105,26 +431,106 @@ class LEDManager:
             start_col, end_col: Column range (inclusive)
             start_row, end_row: Row range (inclusive)
         """
-        for row in range(start_row, end_row + 1):
-            for column in range(start_col, end_col + 1):
-                self.set_led(column, row, 'off')
+        self._fill_rows(start_col, end_col, start_row, end_row, 'off')
+
+    def add_layer(self, name, order=0):
+        """
+        Get an overlay layer, creating it if needed
+
+        Args:
+            name: Layer name
+            order: Stacking order for a new layer; higher layers are drawn on top
+
+        Returns:
+            LEDLayer
+        """
+        for layer in self._layers:
+            if layer.name == name:
+                return layer
+
+        layer = LEDLayer(name, order)
+        self._layers.append(layer)
+        self._layers.sort(key=lambda item: item.order)
+        return layer
+
+    def get_layer(self, name):
+        """Get an overlay layer by name (None if there is none)"""
+        for layer in self._layers:
+            if layer.name == name:
+                return layer
+        return None
+
+    def remove_layer(self, name):
+        """Remove an overlay layer, restoring the cells it covered"""
+        layer = self.get_layer(name)
+        if layer is None:
+            return
+        layer.clear_all()
+        self.composite()
+        self._layers.remove(layer)
+
+    def composite(self, force=False):
+        """
+        Recomposite and send the cells the layers changed since the last call
+
+        Only cells touched on a layer are recomputed (topmost non-transparent
+        layer, else the base grid); of those, only cells whose displayed color
+        changes are sent.
+
+        Args:
+            force: If True, send the touched cells even if unchanged
+
+        Returns:
+            FrameReport for the cells sent (None while LED output is deferred)
+        """
+        touched = set()
+        for layer in self._layers:
+            if layer._dirty:
+                touched |= layer._dirty
+                layer._dirty = set()
+
+        cache, base, overlay = self._led_cache, self._base, self._overlay
+        top_down = self._layers[::-1]
+        changed = []
+
+        for index in sorted(touched):
+            above = TRANSPARENT
+            for layer in top_down:
+                above = layer.cells[index]
+                if above != TRANSPARENT:
+                    break
+            overlay[index] = above
+
+            color = base[index] if above == TRANSPARENT else above
+            if force or cache[index] != color:
+                cache[index] = color
+                column, row = index % LINNSTRUMENT_COLUMNS, index // LINNSTRUMENT_COLUMNS
+                changed.append((column, row, color))
+
+        return self.linnstrument.set_cells(changed)
 
     def invalidate_cache(self):
         """Mark cache as dirty, forcing next update to refresh all LEDs"""
         self._dirty = True
+        # Hardware state is unknown, so latched coordinates are too
+        self.linnstrument.transport.invalidate()
 
     def refresh_all(self):
         """Force refresh of all cached LEDs to hardware"""
-        for column in range(LINNSTRUMENT_COLUMNS):
-            for row in range(LINNSTRUMENT_ROWS):
-                color = self._led_cache[column][row]
-                self.linnstrument.set_cell_color(column, row, color)
+        cache = self._led_cache
+        self.linnstrument.set_cells((column, row, cache[row * LINNSTRUMENT_COLUMNS + column])
+                                    for column in range(LINNSTRUMENT_COLUMNS)
+                                    for row in range(LINNSTRUMENT_ROWS))
         self._dirty = False
 
+    def last_frame_report(self):
+        """Get the FrameReport (cells, messages, savings) for the most recent batch"""
+        return self.linnstrument.transport.last_report
+
     def get_cached_color(self, column, row):
         """Get cached LED color without querying hardware"""
         if 0 <= column < LINNSTRUMENT_COLUMNS and 0 <= row < LINNSTRUMENT_ROWS:
-            return self._led_cache[column][row]
+            return self._led_cache[row * LINNSTRUMENT_COLUMNS + column]
         return None
 
     def fill_region(self, start_col, end_col, start_row, end_row, color):
@@ -136,9 +542,7 @@ class LEDManager:
             start_row, end_row: Row range (inclusive)
             color: Color to fill with
         """
-        for row in range(start_row, end_row + 1):
-            for column in range(start_col, end_col + 1):
-                self.set_led(column, row, color)
+        self._fill_rows(start_col, end_col, start_row, end_row, color)
 
     def set_row_colors(self, row, colors):
         """
@@ -148,18 +552,55 @@ class LEDManager:
             row: Row index
             colors: List of colors (length should match LINNSTRUMENT_COLUMNS)
         """
-        for column, color in enumerate(colors[:LINNSTRUMENT_COLUMNS]):
-            self.set_led(column, row, color)
+        if not 0 <= row < LINNSTRUMENT_ROWS:
+            return
+        changed = []
+        self._write_span(row, 0, bytes(resolve_color(color)
+                                       for color in colors[:LINNSTRUMENT_COLUMNS]), changed)
+        self.linnstrument.set_cells(changed)
+
+    def update_animations(self, now=None):
+        """
+        Advance the animation timeline and composite the cells it changed
+
+        Call from update_display; frames are produced at most ANIMATION_FPS
+        times per second.
+
+        Args:
+            now: Time in seconds (default: the timeline's clock)
+        """
+        changes = self.animations.advance(now)
+        if not changes:
+            return
+
+        layer = self._animation_layer
+        for (column, row), color in changes:
+            if color is None:
+                layer.clear(column, row)
+            else:
+                layer.set(column, row, color)
+        self.composite()
 
     def pulse_led(self, column, row, color, duration_frames=10):
         """
-        Create a pulsing effect (placeholder for future animation system)
+        Pulse an LED over whatever it shows
 
         Args:
             column, row: LED position
             color: Color to pulse
-            duration_frames: How many update cycles to pulse for
+            duration_frames: How many animation frames to pulse for
+
+        Returns:
+            Animation key (for animations.stop)
+        """
+        return self.animations.play(pulse([(column, row)], color, duration_frames),
+                                    key=('pulse', column, row))
+
+    def flash_led(self, column, row):
+        """
+        Decaying hit flash on an LED (e.g. a drum pad being played)
+
+        Returns:
+            Animation key (for animations.stop)
         """
-        # For now, just set the LED
-        # TODO: Implement animation queue system
-        self.set_led(column, row, color)
+        return self.animations.play(flash([(column, row)]), key=('flash', column, row))
@@ -5,14 +5,26 @@ Defines common interface that all modes must implement
 
 from abc import ABC, abstractmethod
 
+from ..change_dispatcher import ChangeDispatcher
+
 
 class BaseMode(ABC):
     """
     Abstract base class for LinnStrument operating modes
     Each mode handles a different use case (keyboard, session, drum sequencer)
+
+    Each mode renders into its own off-screen framebuffer (an LEDFrame). Once
+    attached, background listeners keep the framebuffer current even while
+    the mode is inactive, so entering a mode only sends the cells that differ
+    from what the outgoing mode left on the grid.
+
+    Listeners that trigger redraws go through a ChangeDispatcher, so a burst
+    of notifications costs one redraw on the next update(). Modes driven by
+    the same script should share one dispatcher; then the active mode's
+    update() also brings the inactive modes' framebuffers up to date.
     """
 
-    def __init__(self, c_instance, linnstrument, led_manager, song):
+    def __init__(self, c_instance, linnstrument, led_manager, song, dispatcher=None):
         """
         Initialize mode
 
@@ -21,6 +33,7 @@ class BaseMode(ABC):
             linnstrument: LinnstrumentAbletonMIDI instance
             led_manager: LEDManager instance
             song: Ableton Song instance
+            dispatcher: Shared ChangeDispatcher (default: one for this mode)
         """
         self.c_instance = c_instance
         self.linnstrument = linnstrument
@@ -29,12 +42,23 @@ class BaseMode(ABC):
         self._is_active = False
         self._listeners = []
 
+        # Listeners that keep the framebuffer current while inactive (until detach)
+        self._background_listeners = []
+        self._attached = False
+
+        # The mode's complete grid, rendered by update_leds()
+        self.framebuffer = None
+
+        # Coalesces listener notifications into one handler call per tick
+        self.dispatcher = dispatcher if dispatcher is not None else ChangeDispatcher()
+
     @abstractmethod
     def enter(self):
         """
         Called when entering this mode
-        Should set up listeners, update LEDs, etc.
+        Should set up listeners, show the framebuffer, etc.
         """
+        self.attach()
         self._is_active = True
         self.log_message(f"Entering {self.__class__.__name__}")
 
@@ -42,7 +66,8 @@ class BaseMode(ABC):
     def exit(self):
         """
         Called when leaving this mode
-        Should clean up listeners, clear LEDs, etc.
+        Should clean up listeners and overlays; the grid is left for the next
+        mode to diff against
         """
         self._is_active = False
         self._remove_all_listeners()
@@ -51,11 +76,55 @@ class BaseMode(ABC):
     @abstractmethod
     def update_leds(self):
         """
-        Update LED display for current mode state
+        Render the framebuffer for current mode state (shown if the mode is active)
         Called whenever mode state changes
         """
         pass
 
+    def attach(self):
+        """
+        Start keeping the framebuffer current in the background
+
+        Adds the mode's background listeners and renders the framebuffer once.
+        enter() attaches automatically; attach modes up front to make the first
+        switch to them a diff too.
+        """
+        if self._attached:
+            return
+        self._attached = True
+        self._add_background_listeners()
+        self.update_leds()
+
+    def detach(self):
+        """Stop background updates and drop the framebuffer (e.g. on disconnect)"""
+        if self._is_active:
+            self.exit()
+        self._remove_listeners(self._background_listeners)
+        self._attached = False
+        self.framebuffer = None
+
+    def _add_background_listeners(self):
+        """
+        Add listeners that keep the framebuffer current while inactive
+        Override and register them with _add_background_listener()
+        """
+        pass
+
+    def show(self):
+        """Display the framebuffer (sends only cells that differ from the grid)"""
+        # Apply changes still waiting for a tick, so the framebuffer is current
+        self.dispatcher.dispatch()
+        if self.framebuffer is None:
+            self.update_leds()
+        if self.framebuffer is not None:
+            self.framebuffer.commit()
+
+    def _present(self, frame):
+        """Make a freshly rendered frame the framebuffer, displaying it if the mode is active"""
+        self.framebuffer = frame
+        if self._is_active:
+            frame.commit()
+
     @abstractmethod
     def handle_note(self, note, velocity, is_note_on):
         """
@@ -87,9 +156,10 @@ class BaseMode(ABC):
     def update(self):
         """
         Called periodically (from update_display)
-        Override to implement per-frame updates (e.g., sequencer playhead)
+        Runs coalesced listener changes; override (calling super) to implement
+        per-frame updates (e.g., sequencer playhead)
         """
-        pass
+        self.dispatcher.dispatch()
 
     def is_active(self):
         """Check if this mode is currently active"""
@@ -112,16 +182,46 @@ class BaseMode(ABC):
             method: Listener method name (e.g., 'add_root_note_listener')
             listener_name: Callback function
         """
+        self._track_listener(self._listeners, subject, method, listener_name)
+
+    def _add_background_listener(self, subject, method, listener_name):
+        """
+        Helper to add a listener that stays connected while the mode is inactive
+
+        Args:
+            subject: Object to add listener to
+            method: Listener method name (e.g., 'add_root_note_listener')
+            listener_name: Callback function
+        """
+        self._track_listener(self._background_listeners, subject, method, listener_name)
+
+    def _changed(self, handler, change):
+        """
+        Listener callback that marks a change for handler instead of running it
+
+        Args:
+            handler: Method taking the set of changes since the last tick
+            change: Name recorded for this listener (e.g. 'root_note')
+        """
+        return self.dispatcher.listener(handler, change)
+
+    @staticmethod
+    def _track_listener(listeners, subject, method, listener_name):
+        """Add a listener and record it in a list for cleanup"""
         add_method = getattr(subject, method, None)
         if add_method:
             add_method(listener_name)
             # Store for cleanup: (subject, remove_method_name, callback)
             remove_method = method.replace('add_', 'remove_')
-            self._listeners.append((subject, remove_method, listener_name))
+            listeners.append((subject, remove_method, listener_name))
 
     def _remove_all_listeners(self):
-        """Remove all tracked listeners"""
-        for subject, remove_method_name, callback in self._listeners:
+        """Remove all tracked listeners added while active"""
+        self._remove_listeners(self._listeners)
+
+    def _remove_listeners(self, listeners):
+        """Remove the tracked listeners in a list"""
+        for subject, remove_method_name, callback in listeners:
             try:
                 remove_method = getattr(subject, remove_method_name, None)
                 if remove_method:
@@ -129,7 +229,7 @@ class BaseMode(ABC):
             except Exception as e:
                 self.log_message(f"Error removing listener: {e}")
 
-        self._listeners.clear()
+        listeners.clear()
 
     def get_grid_position(self, note):
         """
@@ -1,19 +1,46 @@
 """
 Drum Mode - Push-style drum sequencer
 Bottom 4 rows (0-3): 4x4 drum pad grid (16 pads)
-Top 4 rows (4-7): 8-step sequencer for selected pad (4 rows x 8 columns)
+Top 4 rows (4-7): 8-step sequencer for selected pad (4 rows x 8 columns),
+with page, length and pattern buttons to the right
+
+The pattern is stored in the MIDI clip in the highlighted clip slot of the
+selected drum track (created on the first step entered), so Live plays it
+sample-accurately; the script only edits and displays it. Tracks without a
+drum rack are never written to.
+
+Patterns are also kept in a PatternStore saved with the set. Moving to
+another clip slot only shows that slot's clip; a stored pattern changes only
+once it has been explicitly loaded into (or saved from) the clip.
 """
 
 from .base_mode import BaseMode
+from ..device_index import TrackDeviceIndex
 from ..config import (
     DRUM_PAD_ROWS,
     DRUM_PAD_COLUMNS,
     SEQUENCER_ROWS,
     SEQUENCER_COLUMNS,
-    SEQUENCER_STEPS
+    SEQUENCER_STEPS,
+    SEQUENCER_STEP_LENGTH,
+    SEQUENCER_MAX_STEPS,
+    SEQUENCER_PATTERNS,
+    SEQUENCER_DATA_KEY,
+    SEQUENCER_PAGE_ROW,
+    SEQUENCER_PAGE_COLUMN,
+    SEQUENCER_PATTERN_ROW,
+    SEQUENCER_PATTERN_COLUMN,
+    SEQUENCER_LENGTH_ROW,
+    SEQUENCER_LENGTH_COLUMN,
+    DRUM_BASE_NOTE
 )
+from ..pattern_store import Pattern, PatternStore, iter_steps
+from ..beat_clock import BeatClock
 import Live
 
+# Pages of SEQUENCER_STEPS steps in the longest pattern
+SEQUENCER_PAGES = SEQUENCER_MAX_STEPS // SEQUENCER_STEPS
+
 
 class DrumMode(BaseMode):
     """
@@ -21,116 +48,488 @@ class DrumMode(BaseMode):
     - Bottom: 4x4 drum pads (16 pads)
     - Top: 4x8 sequencer grid (8 steps, displayed across 4 rows)
     - Select pad = white, sequence steps = cyan, playhead = yellow VERTICAL BAR
+    - Steps are notes in the highlighted slot's clip on the selected drum
+      track: toggles are written in one batch per tick, and edits made in
+      Live are read back
+    - Page buttons (row 7) show 8 steps at a time of patterns up to 64 steps
+    - Length buttons (row 5) end the pattern at a page, lengthening or
+      shortening it (steps past the end are kept, just not played)
+    - Pattern buttons (row 6): a stored pattern is loaded into the clip, an
+      empty one keeps the clip's pattern; edits then also go to that stored
+      pattern until another clip slot is highlighted
     """
 
-    def __init__(self, c_instance, linnstrument, led_manager, song):
-        super().__init__(c_instance, linnstrument, led_manager, song)
+    def __init__(self, c_instance, linnstrument, led_manager, song, dispatcher=None):
+        super().__init__(c_instance, linnstrument, led_manager, song, dispatcher)
 
         # Selected pad (0-15)
         self._selected_pad = 0
 
-        # Sequences: 16 pads x 8 steps
-        # _sequences[pad_index][step_index] = velocity (0 = off, 1-127 = on)
-        self._sequences = [[0 for _ in range(SEQUENCER_STEPS)] for _ in range(16)]
+        # Stored patterns (step bitmasks and velocities per pad), saved with the set
+        self._patterns = PatternStore(pads=16, max_patterns=SEQUENCER_PATTERNS,
+                                      length=SEQUENCER_STEPS, key=SEQUENCER_DATA_KEY)
+
+        # True while the clip holds the selected stored pattern (loaded into or
+        # saved from it); otherwise the clip's notes are edited in
+        # _clip_pattern, which is never saved
+        self._bound = False
+        self._clip_pattern = Pattern(16, SEQUENCER_STEPS)
+
+        # Page of SEQUENCER_STEPS steps shown on the grid
+        self._page = 0
+
+        # Clip slot the pattern is written to (the highlighted one, only on a
+        # track with a drum rack) and its MIDI clip
+        self._clip_slot = None
+        self._clip = None
+
+        # Each track's drum rack, so selection changes don't rescan device chains
+        self._device_index = TrackDeviceIndex(on_change=self._on_devices_changed)
 
-        # Playback
+        # (pad, step) cells toggled since the last write to the clip
+        self._pending_steps = set()
+
+        # True when the whole pattern must be rewritten (pattern switched or resized)
+        self._rewrite_clip = False
+
+        # True while writing to the clip (our own notes changes aren't read back)
+        self._writing = False
+
+        # Playback (display only; Live plays the clip). The current step is
+        # None while the clip isn't playing, which hides the playhead
         self._is_playing = False
-        self._current_step = 0
+        self._current_step = None
+
+        # Step boundaries from song time; subscribed only while playing in drum mode,
+        # shifted to the song time of one of the clip's step boundaries
+        self._clock = BeatClock(song)
+        self._step_subscription = None
+        self._step_offset = 0.0
 
         # Step length (16th notes)
-        self._step_length = 0.25
+        self._step_length = SEQUENCER_STEP_LENGTH
+
+        # Selection highlight and playhead are overlays above the pads and steps,
+        # so moving them only resends the cells they leave and enter
+        self._selection_layer = led_manager.add_layer('drum_selection', order=1)
+        self._playhead_layer = led_manager.add_layer('drum_playhead', order=2)
+
+    def attach(self):
+        """Load the stored patterns and start following the highlighted clip slot, then render"""
+        if not self._attached:
+            try:
+                self._patterns.load(self.song)
+            except ValueError as e:
+                self.log_message(f"Error loading patterns: {e}")
+            self._set_clip_slot(self._target_clip_slot())
+        super().attach()
+
+    def detach(self):
+        """Write pending steps and stop listening to the clip and song time"""
+        self._flush_steps()
+        self._set_clip_slot(None)
+        self._clock.disconnect()
+        self._step_subscription = None
+        self.dispatcher.cancel(self._on_clip_changed)
+        self.dispatcher.cancel(self._on_clip_playback_changed)
+        self.dispatcher.cancel(self._on_target_changed)
+        super().detach()
+        self._device_index.clear()
+
+    def _add_background_listeners(self):
+        """Follow the highlighted clip slot (it moves with the selected track and scene)"""
+        self._add_background_listener(self.song.view, 'add_selected_track_listener',
+                                      self._changed(self._on_target_changed, 'selected_track'))
+        self._add_background_listener(self.song.view, 'add_selected_scene_listener',
+                                      self._changed(self._on_target_changed, 'selected_scene'))
 
     def enter(self):
         """Enter drum mode"""
         super().enter()
 
-        # Add listeners
+        # Add listeners (song time only while playing, through the beat clock)
         self._add_listener(self.song, 'add_is_playing_listener', self._on_playback_changed)
-        self._add_listener(self.song, 'add_current_song_time_listener', self._on_song_time_changed)
+        self._is_playing = self.song.is_playing
+        self._follow_playhead(self._is_playing)
 
-        # Initial display
-        self.update_leds()
+        # Show the pads and sequence, with the highlight and playhead over them
+        self.show()
+        self._show_selection()
+        self._update_playhead()
         self.show_message("Linnstrument: Drum Mode (Push-style)")
 
     def exit(self):
         """Exit drum mode"""
         super().exit()
-        self.led_manager.clear_all()
+        self._follow_playhead(False)
+        self._flush_steps()
+        self._current_step = None
+        self._selection_layer.clear_all()
+        self._playhead_layer.clear_all()
+        self.led_manager.composite()
+
+    @property
+    def _pattern(self):
+        """The pattern being shown and edited"""
+        return self._patterns.pattern if self._bound else self._clip_pattern
 
     def _on_playback_changed(self):
         """Playback started/stopped"""
         self._is_playing = self.song.is_playing
+        self._follow_playhead(self._is_playing)
 
         if not self._is_playing:
-            self._current_step = 0
+            self._current_step = None
 
         self.update_leds()
 
-    def _on_song_time_changed(self):
-        """Update sequencer playhead"""
-        if not self._is_playing:
+    def _on_target_changed(self, changes):
+        """Selected track or scene (or the track's devices) changed: edit the newly highlighted slot's clip"""
+        self._flush_steps()
+        clip_slot = self._target_clip_slot()
+        if clip_slot != self._clip_slot:
+            self._set_clip_slot(clip_slot)
+            self.update_leds()
+
+    def _on_devices_changed(self, track):
+        """A device chain changed; a drum rack added to or removed from the selected track moves the target"""
+        if self._attached and track == self.song.view.selected_track:
+            self.dispatcher.mark(self._on_target_changed, 'devices')
+
+    def _target_clip_slot(self):
+        """The highlighted clip slot if the selected track has a drum rack, else None"""
+        try:
+            if not self._device_index.has_drum_rack(self.song.view.selected_track):
+                return None
+            return self.song.view.highlighted_clip_slot
+        except Exception as e:
+            self.log_message(f"Error finding drum track clip slot: {e}")
+            return None
+
+    def _set_clip_slot(self, clip_slot):
+        """Point the sequencer at a clip slot (None for none) and show its clip's pattern"""
+        if self._clip_slot is not None:
+            try:
+                self._clip_slot.remove_has_clip_listener(self._on_has_clip_changed)
+            except Exception:
+                pass  # Slot was deleted
+
+        self._clip_slot = clip_slot
+        if clip_slot is not None:
+            clip_slot.add_has_clip_listener(self._on_has_clip_changed)
+
+        # A different clip: stored patterns are left alone until one is loaded
+        self._bound = False
+        self._clip_pattern = Pattern(16, SEQUENCER_STEPS)
+        self._page = 0
+        self._watch_clip()
+        self._load_pattern()
+
+    def _watch_clip(self):
+        """Move the notes listener to the slot's current MIDI clip (if any)"""
+        clip_slot = self._clip_slot
+        clip = None
+        if clip_slot is not None and clip_slot.has_clip:
+            clip = clip_slot.clip
+            if not clip.is_midi_clip:
+                clip = None
+        if clip == self._clip:
             return
 
-        # Calculate current step (16th notes)
-        beats = self.song.current_song_time
-        step = int((beats % (SEQUENCER_STEPS * self._step_length)) / self._step_length)
+        if self._clip is not None:
+            try:
+                self._clip.remove_notes_listener(self._on_notes_changed)
+                self._clip.remove_playing_status_listener(self._on_clip_playing_changed)
+            except Exception:
+                pass  # Clip was deleted
+        self._clip = clip
+        if clip is not None:
+            clip.add_notes_listener(self._on_notes_changed)
+            clip.add_playing_status_listener(self._on_clip_playing_changed)
+
+        # The playhead reappears at the new clip's next step
+        if self._current_step is not None:
+            self._current_step = None
+            if self.is_active():
+                self._show_playhead()
+
+    def _on_has_clip_changed(self):
+        """Clip created or deleted in the slot (by us or in Live)"""
+        if not self._writing:
+            self.dispatcher.mark(self._on_clip_changed, 'has_clip')
+
+    def _on_notes_changed(self):
+        """Notes edited in Live (our own writes are skipped)"""
+        if not self._writing:
+            self.dispatcher.mark(self._on_clip_changed, 'notes')
+
+    def _on_clip_playing_changed(self):
+        """Clip launched or stopped: move the playhead on the next tick"""
+        self.dispatcher.mark(self._on_clip_playback_changed, 'playing_status')
+
+    def _on_clip_playback_changed(self, changes):
+        """Called once per tick after the clip was launched or stopped"""
+        if self.is_active():
+            self._update_playhead()
+
+    def _on_clip_changed(self, changes):
+        """Called once per tick after the clip was replaced or edited in Live"""
+        self._flush_steps()
+        if 'has_clip' in changes:
+            self._watch_clip()
+        # Edits to a clip holding a stored pattern are edits of that pattern
+        if self._load_pattern() and self._bound:
+            self._save_patterns()
+        self.update_leds()
 
-        if step != self._current_step:
-            old_step = self._current_step
-            self._current_step = step
+    def _load_pattern(self):
+        """
+        Read the clip's notes for the 16 pads into the pattern being edited
+
+        The pattern takes the clip's length. With no clip the pattern is
+        kept, and written to the clip the first step entered creates. Nothing
+        is saved here: callers save when the pattern is a stored one.
+
+        Returns:
+            True if the pattern was read from the clip
+        """
+        if self._clip is None:
+            return False
+
+        try:
+            length = int(round(self._clip.length / self._step_length))
+            notes = self._clip.get_notes(0.0, DRUM_BASE_NOTE,
+                                         SEQUENCER_MAX_STEPS * self._step_length, 16)
+        except Exception as e:
+            self.log_message(f"Error reading clip notes: {e}")
+            return False
+
+        pattern = self._pattern
+        pattern.clear()
+        pattern.length = max(1, min(length, SEQUENCER_MAX_STEPS))
+        for pitch, time, duration, velocity, mute in notes:
+            step = int(time / self._step_length)
+            if not mute and step < SEQUENCER_MAX_STEPS:
+                pattern.set_step(pitch - DRUM_BASE_NOTE, step, max(int(velocity), 1))
+
+        self._page = min(self._page, (pattern.length - 1) // SEQUENCER_STEPS)
+        return True
 
-            # Trigger notes for this step
-            self._trigger_step(step)
+    def _save_patterns(self):
+        """Store the patterns with the set (only written when they changed)"""
+        try:
+            self._patterns.save(self.song)
+        except Exception as e:
+            self.log_message(f"Error saving patterns: {e}")
+
+    def _flush_steps(self):
+        """
+        Write the steps toggled since the last tick to the clip in one batch
+
+        Each toggled step's note is removed and the steps that are on are
+        added back with a single set_notes call; notes elsewhere in the clip
+        (other pitches, off-grid timing) are left alone. After a pattern
+        switch or resize the pads' notes are replaced wholesale and the
+        clip's loop set to the pattern length. A stored pattern is saved
+        either way.
+        """
+        if not self._pending_steps and not self._rewrite_clip:
+            return
+        pending, self._pending_steps = self._pending_steps, set()
+        rewrite, self._rewrite_clip = self._rewrite_clip, False
+        if self._bound:
+            self._save_patterns()
 
-            # Update entire sequencer display (old and new columns)
-            self._update_sequencer_column(old_step)
-            self._update_sequencer_column(step)
+        if self._clip_slot is None:
+            self.log_message("No drum track clip slot highlighted - steps not written")
+            return
 
-    def update_leds(self):
-        """Update all LEDs"""
-        self.led_manager.clear_all()
-
-        # Drum pads (rows 0-3)
-        for row in range(DRUM_PAD_ROWS):
-            for col in range(DRUM_PAD_COLUMNS):
-                pad_index = (row * DRUM_PAD_COLUMNS) + col
-                color = 'white' if pad_index == self._selected_pad else 'blue'
-                self.led_manager.set_led(col, row, color)
-
-        # Sequencer grid (rows 4-7, columns 0-7)
-        for col in range(SEQUENCER_STEPS):
-            self._update_sequencer_column(col)
-
-    def _update_sequencer_column(self, step):
-        """Update entire vertical column for a step (all 4 sequencer rows)"""
-        if step >= SEQUENCER_STEPS:
+        pattern = self._pattern
+        step_length = self._step_length
+        self._writing = True
+        try:
+            if self._clip is None:
+                self._clip_slot.create_clip(pattern.length * step_length)
+                self._watch_clip()
+                rewrite = True
+
+            clip = self._clip
+            if rewrite:
+                clip.remove_notes(0.0, DRUM_BASE_NOTE, SEQUENCER_MAX_STEPS * step_length, 16)
+                cells = [(pad_index, step) for pad_index in range(16)
+                         for step in pattern.steps(pad_index)]
+            else:
+                cells = []
+                for pad_index, step in sorted(pending):
+                    clip.remove_notes(step * step_length, DRUM_BASE_NOTE + pad_index,
+                                      step_length, 1)
+                    if pattern.velocity(pad_index, step) > 0:
+                        cells.append((pad_index, step))
+
+            notes = tuple((DRUM_BASE_NOTE + pad_index, step * step_length, step_length,
+                           pattern.velocity(pad_index, step), False)
+                          for pad_index, step in cells)
+            if notes:
+                clip.set_notes(notes)
+
+            if rewrite:
+                try:
+                    clip.loop_end = pattern.length * step_length
+                except Exception as e:
+                    self.log_message(f"Error setting clip loop: {e}")
+
+        except Exception as e:
+            self.log_message(f"Error writing steps to clip: {e}")
+        finally:
+            self._writing = False
+
+    def _follow_playhead(self, follow):
+        """Subscribe to (or drop) the clip's step boundaries from the beat clock"""
+        if follow and self._step_subscription is None:
+            self._step_subscription = self._clock.subscribe(self._on_step, self._step_length,
+                                                            offset=self._step_offset)
+        elif not follow and self._step_subscription is not None:
+            self._clock.unsubscribe(self._step_subscription)
+            self._step_subscription = None
+
+    def _on_step(self, step_count):
+        """Update sequencer playhead (called at each of the clip's step boundaries while playing)"""
+        position = self._update_playhead()
+        if position is None:
             return
 
-        sequence = self._sequences[self._selected_pad]
-        velocity = sequence[step]
+        # Song time of a clip step boundary; it moves when the clip is launched
+        # off the grid or its loop is shifted, and the subscription follows it
+        step_length = self._step_length
+        offset = (self._clock.song_time - position) % step_length
+        drift = (offset - self._step_offset) % step_length
+        if min(drift, step_length - drift) * self._clock.ticks_per_beat >= 0.5:
+            self._step_offset = offset
+            self._follow_playhead(False)
+            self._follow_playhead(True)
+
+    def _update_playhead(self):
+        """
+        Put the playhead on the step the clip is playing
+
+        The step comes from the clip's own playing position, so it follows
+        the clip's launch time and loop rather than the song's bar count.
+        The playhead is hidden while the clip isn't playing.
+
+        Returns:
+            The clip's playing position (None if it isn't playing)
+        """
+        step = None
+        position = None
+        clip = self._clip
+        try:
+            if self._is_playing and clip is not None and clip.is_playing:
+                # The epsilon keeps float jitter from landing just short of a step
+                position = clip.playing_position
+                step = int(position / self._step_length + 1e-6) % self._pattern.length
+        except Exception as e:
+            self.log_message(f"Error reading clip position: {e}")
 
-        # Determine if this step is active
-        is_active = velocity > 0
-        is_playhead = (step == self._current_step and self._is_playing)
+        if step != self._current_step:
+            self._current_step = step
+
+            # Move the playhead overlay (old and new columns)
+            self._show_playhead()
+        return position
 
-        # Set color for entire column
-        if is_playhead:
-            color = 'yellow'  # Playhead - entire column lights up yellow
-        elif is_active:
-            color = 'cyan'  # Active step - entire column lights up cyan
+    def update_leds(self):
+        """Render the pads and the selected pad's sequence"""
+        frame = self.led_manager.begin_frame()
+
+        # Drum pads (rows 0-3); the selected pad is highlighted by its overlay
+        frame.fill_region(0, DRUM_PAD_COLUMNS - 1, 0, DRUM_PAD_ROWS - 1, 'blue')
+
+        # Sequencer grid (rows 4-7, columns 0-7): the current page's steps
+        for column in range(SEQUENCER_STEPS):
+            frame.fill_region(column, column, SEQUENCER_ROWS, SEQUENCER_ROWS + 3,
+                              self._sequencer_column_color(column))
+
+        # Page buttons: current page white, pages inside the pattern blue
+        length = self._pattern.length
+        for page in range(SEQUENCER_PAGES):
+            if page == self._page:
+                color = 'white'
+            elif page * SEQUENCER_STEPS < length:
+                color = 'blue'
+            else:
+                continue
+            frame.set(SEQUENCER_PAGE_COLUMN + page, SEQUENCER_PAGE_ROW, color)
+
+        # Length buttons: the pattern's last page orange
+        last_page = (length - 1) // SEQUENCER_STEPS
+        frame.set(SEQUENCER_LENGTH_COLUMN + last_page, SEQUENCER_LENGTH_ROW, 'orange')
+
+        # Pattern buttons: pattern in the clip green, patterns with steps blue
+        for index in range(SEQUENCER_PATTERNS):
+            if self._bound and index == self._patterns.current:
+                color = 'green'
+            elif self._patterns.has_steps(index):
+                color = 'blue'
+            else:
+                continue
+            frame.set(SEQUENCER_PATTERN_COLUMN + index, SEQUENCER_PATTERN_ROW, color)
+
+        self._present(frame)
+        if self.is_active():
+            self._show_selection()
+            self._show_playhead()
+
+    def _show_selection(self):
+        """Move the white selection highlight to the selected pad"""
+        self._selection_layer.clear_all()
+        row = self._selected_pad // DRUM_PAD_COLUMNS
+        col = self._selected_pad % DRUM_PAD_COLUMNS
+        self._selection_layer.set(col, row, 'white')
+        self.led_manager.composite()
+
+    def _show_playhead(self):
+        """Move the yellow playhead bar to the current step (hidden when the clip isn't playing or on another page)"""
+        self._playhead_layer.clear_all()
+        if self._current_step is not None:
+            column = self._current_step - self._page * SEQUENCER_STEPS
         else:
-            color = 'off'  # Inactive - entire column is off
+            column = -1
+        if 0 <= column < SEQUENCER_STEPS:
+            self._playhead_layer.fill_region(column, column, SEQUENCER_ROWS, SEQUENCER_ROWS + 3,
+                                             'yellow')
+        self.led_manager.composite()
+
+    def _update_sequencer_steps(self, steps):
+        """
+        Update the columns of the steps set in a bitmask (all 4 sequencer rows)
+
+        Only steps on the current page are drawn; the others aren't visible.
+        """
+        first = self._page * SEQUENCER_STEPS
+        columns = (steps >> first) & ((1 << SEQUENCER_STEPS) - 1)
+        if not columns or self.framebuffer is None:
+            return
+
+        # Light up all 4 rows for each step column (rows 4-7)
+        for column in iter_steps(columns):
+            self.framebuffer.fill_region(column, column, SEQUENCER_ROWS, SEQUENCER_ROWS + 3,
+                                         self._sequencer_column_color(column))
+        # Commit without dispatching: this runs inside note handling, and
+        # pending Live changes wait for the next tick
+        if self.is_active():
+            self.framebuffer.commit()
 
-        # Light up all 4 rows for this step column
-        for seq_row in range(4):  # 4 sequencer rows
-            actual_row = SEQUENCER_ROWS + seq_row  # Rows 4-7
-            self.led_manager.set_led(step, actual_row, color)
+    def _sequencer_column_color(self, column):
+        """Color for a sequencer column on the current page (the playhead is drawn over it)"""
+        step = self._page * SEQUENCER_STEPS + column
+        pattern = self._pattern
+
+        if step < pattern.length and pattern.velocity(self._selected_pad, step) > 0:
+            return 'cyan'  # Active step - entire column lights up cyan
+        return 'off'  # Inactive or past the pattern's end - entire column is off
 
     def handle_note(self, note, velocity, is_note_on):
         """Handle pad presses"""
-        if not is_note_on:
-            return True
-
         positions = self.get_grid_position(note)
         if not positions:
             return True
@@ -139,67 +538,123 @@ class DrumMode(BaseMode):
 
         # Bottom 4 rows = drum pads
         if row < DRUM_PAD_ROWS:
-            self._handle_drum_pad(column, row, velocity)
+            self._handle_drum_pad(column, row, velocity, is_note_on)
         # Top 4 rows = sequencer
-        elif row >= SEQUENCER_ROWS:
+        elif row >= SEQUENCER_ROWS and is_note_on:
             self._handle_sequencer_pad(column, row)
 
         return True
 
-    def _handle_drum_pad(self, column, row, velocity):
-        """Handle drum pad press - select pad and trigger sound"""
+    def _handle_drum_pad(self, column, row, velocity, is_note_on=True):
+        """Handle drum pad press - select pad and trigger sound (release ends it)"""
         pad_index = (row * DRUM_PAD_COLUMNS) + column
 
         if pad_index >= 16:
             return
 
+        drum_note = DRUM_BASE_NOTE + pad_index
+        if not is_note_on:
+            self.c_instance.send_midi((0x80, drum_note, 0))
+            return
+
         # Update selection
-        old_pad = self._selected_pad
+        previous_pad = self._selected_pad
         self._selected_pad = pad_index
 
         self.log_message(f"Selected pad {pad_index} at ({column}, {row})")
 
-        # Update drum pad LEDs
-        old_row = old_pad // DRUM_PAD_COLUMNS
-        old_col = old_pad % DRUM_PAD_COLUMNS
-        self.led_manager.set_led(old_col, old_row, 'blue')
-        self.led_manager.set_led(column, row, 'white')
+        # Move the highlight; the pad colors underneath are unchanged
+        self._show_selection()
 
-        # Update entire sequencer display for new pad's sequence
-        for step in range(SEQUENCER_STEPS):
-            self._update_sequencer_column(step)
+        # Hit flash (decays back to the highlight)
+        self.led_manager.flash_led(column, row)
+
+        # Redraw only the step columns where the old and new pad's sequences differ
+        masks = self._pattern.masks
+        self._update_sequencer_steps(masks[previous_pad] ^ masks[pad_index])
 
         # Trigger sound
-        drum_note = 36 + pad_index
         self.c_instance.send_midi((0x90, drum_note, velocity))
 
     def _handle_sequencer_pad(self, column, row):
-        """Handle sequencer step toggle - ANY row in sequencer area"""
-        step = column  # Column directly maps to step (0-7)
+        """Handle sequencer area presses - step toggle (ANY row), page, length and pattern buttons"""
+        if column >= SEQUENCER_STEPS:
+            page = column - SEQUENCER_PAGE_COLUMN
+            last_page = column - SEQUENCER_LENGTH_COLUMN
+            pattern_index = column - SEQUENCER_PATTERN_COLUMN
+            if row == SEQUENCER_PAGE_ROW and 0 <= page < SEQUENCER_PAGES:
+                self._select_page(page)
+            elif row == SEQUENCER_LENGTH_ROW and 0 <= last_page < SEQUENCER_PAGES:
+                self._set_length(last_page)
+            elif row == SEQUENCER_PATTERN_ROW and 0 <= pattern_index < SEQUENCER_PATTERNS:
+                self._select_pattern(pattern_index)
+            return
 
-        if step >= SEQUENCER_STEPS:
+        # Column maps to a step of the current page
+        step = self._page * SEQUENCER_STEPS + column
+        pattern = self._pattern
+        if step >= pattern.length:
             return
 
         # Toggle step for selected pad
-        sequence = self._sequences[self._selected_pad]
-        if sequence[step] > 0:
-            sequence[step] = 0
-            self.log_message(f"Step {step} OFF for pad {self._selected_pad}")
-        else:
-            sequence[step] = 100
+        if pattern.toggle(self._selected_pad, step):
             self.log_message(f"Step {step} ON for pad {self._selected_pad}")
+        else:
+            self.log_message(f"Step {step} OFF for pad {self._selected_pad}")
+
+        # Written to the clip on the next tick, with any other toggles
+        self._pending_steps.add((self._selected_pad, step))
 
         # Update entire column for this step
-        self._update_sequencer_column(step)
+        self._update_sequencer_steps(1 << step)
 
-    def _trigger_step(self, step):
-        """Trigger all active pads for current step"""
-        for pad_index in range(16):
-            velocity = self._sequences[pad_index][step]
-            if velocity > 0:
-                drum_note = 36 + pad_index
-                self.c_instance.send_midi((0x90, drum_note, velocity))
+    def _select_page(self, page):
+        """Show a page of the pattern (pages past its end are ignored)"""
+        if page * SEQUENCER_STEPS >= self._pattern.length or page == self._page:
+            return
+        self._page = page
+        self.update_leds()
+
+    def _set_length(self, last_page):
+        """End the pattern at a page; the clip is rewritten on the next tick"""
+        pattern = self._pattern
+        end = (last_page + 1) * SEQUENCER_STEPS
+        if pattern.length == end:
+            return
+
+        pattern.length = end
+        self._rewrite_clip = True
+        self._page = min(self._page, last_page)
+        self.log_message(f"Pattern length {end} steps")
+        self.update_leds()
+
+    def _select_pattern(self, index):
+        """
+        Pattern button: load a stored pattern into the clip, or save the
+        clip's pattern into an empty slot
+
+        Either way the clip then holds that stored pattern, and edits go to both.
+        """
+        if self._bound and index == self._patterns.current:
+            return
+
+        # Finish writing the outgoing pattern first
+        self._flush_steps()
+
+        if self._patterns.has_steps(index):
+            # Replaces the clip's notes on the next tick
+            self._patterns.select(index)
+            self._page = 0
+            self._rewrite_clip = True
+            self.log_message(f"Pattern {index + 1} loaded")
+        else:
+            self._patterns.store(index, self._pattern)
+            self._save_patterns()
+            self.log_message(f"Pattern {index + 1} saved")
+        self._bound = True
+        self.update_leds()
 
     def update(self):
-        """Per-frame update"""
-        pass
+        """Per-frame update: write this tick's step toggles to the clip"""
+        super().update()
+        self._flush_steps()
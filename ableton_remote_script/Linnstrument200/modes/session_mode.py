@@ -5,6 +5,9 @@ Full grid (16x8 for LS128) for launching clips and scenes
 
 from .base_mode import BaseMode
 from ..config import SESSION_ROWS, SESSION_COLUMNS
+from ..led_animation import blink
+from ..color_palette import quantize
+from ..session_model import SessionWindow, SessionModel
 import Live
 
 
@@ -14,133 +17,172 @@ class SessionMode(BaseMode):
     Each pad launches a clip, LEDs show clip states and colors
     """
 
-    def __init__(self, c_instance, linnstrument, led_manager, song):
-        super().__init__(c_instance, linnstrument, led_manager, song)
+    def __init__(self, c_instance, linnstrument, led_manager, song, dispatcher=None):
+        super().__init__(c_instance, linnstrument, led_manager, song, dispatcher)
 
-        # Session navigation offsets
-        self._session_offset_x = 0  # Track offset
-        self._session_offset_y = 0  # Scene offset
+        # Tracks and scenes in view (only these are referenced, however big the set)
+        self._window = SessionWindow(song, SESSION_COLUMNS, SESSION_ROWS)
 
-        # Clip slot state cache
-        self._clip_slot_cache = {}
+        # Visible clip slots, with one set of listeners per slot
+        self._session_model = SessionModel(self._window, self._on_slot_changed)
 
-    def enter(self):
-        """Enter session mode - set up session grid"""
-        super().enter()
+        # Grid cells of triggered clips (in the framebuffer), and those blinking now
+        self._triggered = set()
+        self._blinking = set()
 
-        # Add listeners for session changes
-        self._add_listener(self.song.view, 'add_selected_track_listener', self._on_session_changed)
-        self._add_listener(self.song.view, 'add_selected_scene_listener', self._on_session_changed)
-        self._add_listener(self.song, 'add_tracks_listener', self._on_session_changed)
-        self._add_listener(self.song, 'add_scenes_listener', self._on_session_changed)
+    def _add_background_listeners(self):
+        """Keep the session grid current while other modes are shown"""
+        self._add_background_listener(self.song, 'add_tracks_listener',
+                                      self._changed(self._on_session_changed, 'tracks'))
+        self._add_background_listener(self.song, 'add_scenes_listener',
+                                      self._changed(self._on_session_changed, 'scenes'))
 
-        # Add clip slot listeners
-        self._add_clip_slot_listeners()
+        # Clip slot listeners (the session model owns them)
+        self._refresh_window()
 
-        # Initial LED update
-        self.update_leds()
+    def detach(self):
+        """Stop background updates, including the clip slot listeners"""
+        super().detach()
+        self._session_model.clear()
+
+    def enter(self):
+        """Enter session mode - show the session grid"""
+        super().enter()
+        self.show()
+        self._set_blinking(self._triggered)
         self.show_message("Linnstrument: Session Mode")
 
     def exit(self):
         """Exit session mode"""
         super().exit()
-        self.led_manager.clear_all()
+        self._set_blinking(set())
 
-    def _on_session_changed(self):
-        """Called when session structure changes"""
-        self.log_message("Session changed")
-        self._add_clip_slot_listeners()  # Refresh listeners
+    def _on_session_changed(self, changes):
+        """Tracks or scenes were added, removed or moved (once per tick)"""
+        self.log_message(f"Session changed: {', '.join(sorted(changes))}")
+        self._refresh_window()
         self.update_leds()
 
-    def _add_clip_slot_listeners(self):
-        """Add listeners to all visible clip slots"""
+    def _refresh_window(self):
+        """Re-read the tracks/scenes in view and watch their clip slots"""
         try:
-            tracks = list(self.song.tracks)
-            scenes = list(self.song.scenes)
-
-            for track_idx in range(self._session_offset_x,
-                                  min(self._session_offset_x + SESSION_COLUMNS, len(tracks))):
-                track = tracks[track_idx]
-
-                for scene_idx in range(self._session_offset_y,
-                                      min(self._session_offset_y + SESSION_ROWS, len(scenes))):
-                    if scene_idx < len(track.clip_slots):
-                        clip_slot = track.clip_slots[scene_idx]
-
-                        # Add listeners for clip state changes
-                        self._add_listener(clip_slot, 'add_has_clip_listener', self._on_session_changed)
-                        if clip_slot.has_clip:
-                            clip = clip_slot.clip
-                            self._add_listener(clip, 'add_playing_status_listener', self._on_session_changed)
-                            self._add_listener(clip, 'add_color_listener', self._on_session_changed)
-
+            self._window.refresh()
+            self._session_model.watch(reread=True)
         except Exception as e:
-            self.log_message(f"Error adding clip slot listeners: {e}")
+            self.log_message(f"Error refreshing session window: {e}")
+
+    def _slot_cell(self, track_idx, scene_idx):
+        """Grid cell showing a clip slot (None if it isn't visible)"""
+        column = track_idx - self._window.track_offset
+        scene = scene_idx - self._window.scene_offset
+        if 0 <= column < SESSION_COLUMNS and 0 <= scene < SESSION_ROWS:
+            # Rows are inverted: scene 0 = top row 7
+            return column, (SESSION_ROWS - 1) - scene
+        return None
+
+    def _cell_slot(self, column, row):
+        """(track index, scene index) of the clip slot a grid cell shows"""
+        return self._window.track_offset + column, self._window.scene_offset + (SESSION_ROWS - 1) - row
+
+    def _on_slot_changed(self, track_idx, scene_idx):
+        """One visible clip slot changed - redraw just its pad"""
+        cell = self._slot_cell(track_idx, scene_idx)
+        if cell is None or self.framebuffer is None:
+            return
+
+        color, is_triggered = self._slot_state(track_idx, scene_idx)
+        self.framebuffer.set(cell[0], cell[1], color)
+
+        triggered = set(self._triggered)
+        if is_triggered:
+            triggered.add(cell)
+        else:
+            triggered.discard(cell)
+        self._triggered = triggered
+
+        if self.is_active():
+            self.framebuffer.commit()
+            self._set_blinking(triggered)
 
     def update_leds(self):
-        """Update session grid LED display"""
+        """Render the session grid from the visible clip slots"""
         try:
-            tracks = list(self.song.tracks)
-            scenes = list(self.song.scenes)
+            model = self._session_model
+            blinking = set()
 
-            # Clear grid
-            self.led_manager.clear_all()
+            # Build the whole grid; cells left unset are off
+            frame = self.led_manager.begin_frame()
 
             # Display each clip slot
-            for grid_col in range(SESSION_COLUMNS):
-                track_idx = self._session_offset_x + grid_col
-                if track_idx >= len(tracks):
-                    continue
-
-                track = tracks[track_idx]
-
-                for grid_row in range(SESSION_ROWS):
-                    scene_idx = self._session_offset_y + grid_row
-                    if scene_idx >= len(scenes) or scene_idx >= len(track.clip_slots):
-                        continue
-
-                    clip_slot = track.clip_slots[scene_idx]
-                    color = self._get_clip_slot_color(clip_slot, track)
-
-                    # Map to LinnStrument grid (invert rows: scene 0 = top row 7)
-                    linnstrument_row = (SESSION_ROWS - 1) - grid_row
-                    self.led_manager.set_led(grid_col, linnstrument_row, color)
+            for track_idx, scene_idx in model.slots:
+                grid_col, grid_row = self._slot_cell(track_idx, scene_idx)
+                color, is_triggered = self._slot_state(track_idx, scene_idx)
+                frame.set(grid_col, grid_row, color)
+                if is_triggered:
+                    blinking.add((grid_col, grid_row))
+
+            self._present(frame)
+            self._triggered = blinking
+            if self.is_active():
+                self._set_blinking(blinking)
 
         except Exception as e:
             self.log_message(f"Error updating session LEDs: {e}")
 
-    def _get_clip_slot_color(self, clip_slot, track):
+    def _set_blinking(self, cells):
+        """Blink exactly these grid cells (triggered clips), leaving running blinks in phase"""
+        animations = self.led_manager.animations
+        for cell in self._blinking - cells:
+            animations.stop(('session_blink', cell))
+        for cell in cells - self._blinking:
+            animations.play(blink([cell], 'yellow'), key=('session_blink', cell))
+        self._blinking = cells
+
+    def _slot_state(self, track_idx, scene_idx):
+        """
+        (color, is_triggered) of a visible slot, read from Live only when it's
+        new in the window or changed since it was last drawn
+        """
+        model = self._session_model
+        state = model.state(track_idx, scene_idx)
+        if state is None:
+            state = self._get_clip_slot_state(model.slot(track_idx, scene_idx),
+                                              self._window.track(track_idx))
+            model.set_state(track_idx, scene_idx, state)
+        return state
+
+    def _get_clip_slot_state(self, clip_slot, track):
         """
-        Determine color for a clip slot
+        Determine color for a clip slot, and whether its clip is triggered
 
         Args:
             clip_slot: Live.ClipSlot.ClipSlot
             track: Live.Track.Track
 
         Returns:
-            Color name string
+            (color name string, is_triggered) - triggered clips blink
         """
         try:
             if not clip_slot.has_clip:
                 # Empty slot - dim color based on track
-                return self._get_dim_track_color(track)
+                return self._get_dim_track_color(track), False
 
             clip = clip_slot.clip
 
             # Check playing state
             if clip.is_playing:
-                return 'green'  # Playing
+                return 'green', False  # Playing
             elif clip.is_triggered:
-                return 'yellow'  # Triggered/queued
+                return 'yellow', True  # Triggered/queued
             elif clip.is_recording:
-                return 'red'  # Recording
+                return 'red', False  # Recording
             else:
                 # Stopped clip - show clip color
-                return self._map_ableton_color_to_linnstrument(clip.color)
+                return self._map_ableton_color_to_linnstrument(clip.color), False
 
         except Exception as e:
             self.log_message(f"Error getting clip slot color: {e}")
-            return 'off'
+            return 'off', False
 
     def _get_dim_track_color(self, track):
         """Get a dimmed version of track color for empty slots"""
@@ -160,31 +202,11 @@ class SessionMode(BaseMode):
             ableton_color: RGB integer
 
         Returns:
-            Color name string
+            Color name string or number
         """
         if ableton_color is None:
             return 'white'
-
-        # Extract RGB
-        r = (ableton_color >> 16) & 0xFF
-        g = (ableton_color >> 8) & 0xFF
-        b = ableton_color & 0xFF
-
-        # Map to closest LinnStrument color
-        if r > g and r > b:
-            return 'red' if r > 200 else 'orange'
-        elif g > r and g > b:
-            return 'green' if g > 200 else 'lime'
-        elif b > r and b > g:
-            return 'blue' if b > 200 else 'cyan'
-        elif r > 150 and g > 150 and b < 100:
-            return 'yellow'
-        elif r > 150 and b > 150:
-            return 'magenta'
-        elif g > 150 and b > 150:
-            return 'cyan'
-        else:
-            return 'white'
+        return quantize(ableton_color)
 
     def handle_note(self, note, velocity, is_note_on):
         """
@@ -209,24 +231,12 @@ class SessionMode(BaseMode):
 
             column, row = positions[0]  # Take first position
 
-            # Convert to session coordinates (invert row)
-            grid_row = (SESSION_ROWS - 1) - row
-            track_idx = self._session_offset_x + column
-            scene_idx = self._session_offset_y + grid_row
-
-            # Get clip slot
-            tracks = list(self.song.tracks)
-            scenes = list(self.song.scenes)
-
-            if track_idx >= len(tracks) or scene_idx >= len(scenes):
+            # Convert to session coordinates (invert row), from the slots in view
+            track_idx, scene_idx = self._cell_slot(column, row)
+            clip_slot = self._session_model.slot(track_idx, scene_idx)
+            if clip_slot is None:
                 return True
 
-            track = tracks[track_idx]
-            if scene_idx >= len(track.clip_slots):
-                return True
-
-            clip_slot = track.clip_slots[scene_idx]
-
             # Launch clip or stop
             self._launch_clip_slot(clip_slot)
 
@@ -268,25 +278,15 @@ class SessionMode(BaseMode):
             tracks_delta: Horizontal scroll amount
             scenes_delta: Vertical scroll amount
         """
-        tracks = list(self.song.tracks)
-        scenes = list(self.song.scenes)
-
-        # Update offsets with clamping
-        self._session_offset_x = max(0, min(
-            self._session_offset_x + tracks_delta,
-            len(tracks) - SESSION_COLUMNS
-        ))
-
-        self._session_offset_y = max(0, min(
-            self._session_offset_y + scenes_delta,
-            len(scenes) - SESSION_ROWS
-        ))
-
-        self.log_message(f"Session view: tracks {self._session_offset_x}, scenes {self._session_offset_y}")
-        self._add_clip_slot_listeners()
+        # Clamped to the set; nothing to redraw if the window didn't move
+        if not self._window.scroll(tracks_delta, scenes_delta):
+            return
+
+        self.log_message(f"Session view: tracks {self._window.track_offset}, scenes {self._window.scene_offset}")
+        self._session_model.watch()
         self.update_leds()
 
     def update(self):
         """Per-frame update for session mode"""
+        super().update()
         # Could update playing clip animations here
-        pass
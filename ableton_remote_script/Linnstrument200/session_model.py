@@ -0,0 +1,278 @@
+"""
+Session model for Linnstrument
+Holds the tracks, scenes and clip slots of the visible session window
+(one set of listeners per slot) and reports which single slot changed
+"""
+
+
+class SessionWindow:
+    """
+    The visible part of the session: offsets plus references to the tracks
+    and scenes in view
+
+    song.tracks and song.scenes are read only when the window moves along
+    them or the lists change (refresh()); pad presses look tracks and scenes
+    up here in O(1), however large the set.
+    """
+
+    def __init__(self, song, columns, rows, scene_span=None):
+        """
+        Initialize window
+
+        Args:
+            song: Live.Song.Song
+            columns: Visible tracks
+            rows: Visible scenes (clip rows)
+            scene_span: Scenes to hold references to (default: rows; more if
+                        e.g. a scene launch row shows further scenes)
+        """
+        self.song = song
+        self.columns = columns
+        self.rows = rows
+        self.scene_span = max(rows, scene_span or rows)
+
+        # First visible track and scene
+        self.track_offset = 0
+        self.scene_offset = 0
+
+        # Set sizes at the last refresh
+        self.track_count = 0
+        self.scene_count = 0
+
+        # Tracks and scenes in view, in window order
+        self.tracks = []
+        self.scenes = []
+
+    def refresh(self, tracks=True, scenes=True):
+        """
+        Re-read the track and/or scene lists (window moved or the lists changed)
+
+        Args:
+            tracks: Re-read song.tracks
+            scenes: Re-read song.scenes
+        """
+        # Keep the window inside the set (tracks or scenes may have been deleted)
+        if tracks:
+            song_tracks = self.song.tracks
+            self.track_count = len(song_tracks)
+            self.track_offset = self._clamp(self.track_offset, self.track_count, self.columns)
+            self.tracks = list(song_tracks[self.track_offset:self.track_offset + self.columns])
+        if scenes:
+            song_scenes = self.song.scenes
+            self.scene_count = len(song_scenes)
+            self.scene_offset = self._clamp(self.scene_offset, self.scene_count, self.rows)
+            self.scenes = list(song_scenes[self.scene_offset:self.scene_offset + self.scene_span])
+
+    def scroll(self, tracks_delta, scenes_delta):
+        """
+        Move the window (clamped to the set) and re-read the list it moved along
+
+        Returns:
+            True if the window moved
+        """
+        track_offset = self._clamp(self.track_offset + tracks_delta, self.track_count, self.columns)
+        scene_offset = self._clamp(self.scene_offset + scenes_delta, self.scene_count, self.rows)
+        if track_offset == self.track_offset and scene_offset == self.scene_offset:
+            return False
+
+        moved_tracks = track_offset != self.track_offset
+        moved_scenes = scene_offset != self.scene_offset
+        self.track_offset = track_offset
+        self.scene_offset = scene_offset
+        self.refresh(tracks=moved_tracks, scenes=moved_scenes)
+        return True
+
+    def track(self, track_idx):
+        """Get a track in view by set index (None if it isn't visible)"""
+        column = track_idx - self.track_offset
+        if 0 <= column < len(self.tracks):
+            return self.tracks[column]
+        return None
+
+    def scene(self, scene_idx):
+        """Get a scene in view by set index (None if it isn't held)"""
+        row = scene_idx - self.scene_offset
+        if 0 <= row < len(self.scenes):
+            return self.scenes[row]
+        return None
+
+    @staticmethod
+    def _clamp(offset, count, size):
+        """Clamp an offset so the window stays inside count items"""
+        return max(0, min(offset, count - size))
+
+
+class SlotWatcher:
+    """
+    Listeners for one clip slot and the clip in it
+
+    The slot's has_clip listener moves the clip listeners (playing_status,
+    color) to whatever clip the slot holds. Every change is reported as the
+    slot's (track index, scene index).
+
+    The owner can keep the slot's display state in `state`; it is reset to
+    None whenever the slot or its clip changes.
+    """
+
+    __slots__ = ('clip_slot', 'clip', 'key', 'on_change', 'state')
+
+    def __init__(self, clip_slot, key, on_change):
+        """
+        Start listening to a slot
+
+        Args:
+            clip_slot: Live.ClipSlot.ClipSlot
+            key: (track index, scene index) reported on change
+            on_change: Function called with (track index, scene index)
+        """
+        self.clip_slot = clip_slot
+        self.clip = None
+        self.key = key
+        self.on_change = on_change
+        self.state = None
+
+        clip_slot.add_has_clip_listener(self._on_has_clip_changed)
+        self._watch_clip()
+
+    def disconnect(self):
+        """Remove the slot's and clip's listeners"""
+        self._unwatch_clip()
+        try:
+            self.clip_slot.remove_has_clip_listener(self._on_has_clip_changed)
+        except Exception:
+            pass  # Slot was deleted
+
+    def _watch_clip(self):
+        """Listen to the slot's current clip (if any)"""
+        clip = self.clip_slot.clip if self.clip_slot.has_clip else None
+        if clip == self.clip:
+            return
+        self._unwatch_clip()
+        if clip is not None:
+            clip.add_playing_status_listener(self._on_clip_changed)
+            clip.add_color_listener(self._on_clip_changed)
+            self.clip = clip
+
+    def _unwatch_clip(self):
+        """Stop listening to the previous clip"""
+        if self.clip is None:
+            return
+        try:
+            self.clip.remove_playing_status_listener(self._on_clip_changed)
+            self.clip.remove_color_listener(self._on_clip_changed)
+        except Exception:
+            pass  # Clip was deleted
+        self.clip = None
+
+    def _on_has_clip_changed(self):
+        """Clip added or deleted: follow the new clip and report the slot"""
+        self._watch_clip()
+        self.state = None
+        self.on_change(*self.key)
+
+    def _on_clip_changed(self):
+        """Clip launched, stopped or recolored"""
+        self.state = None
+        self.on_change(*self.key)
+
+
+class SessionModel:
+    """
+    The clip slots of a SessionWindow
+
+    watch() makes the listened-to slots exactly the visible ones: slots that
+    stay visible keep their listeners, slots scrolled out lose them and
+    slots scrolled in get them, so the listener count never grows with
+    scrolling. A clip being launched, stopped, recolored, added or deleted
+    calls on_slot_changed for that one slot.
+
+    Each visible track's clip_slots are read when it enters the window, so a
+    scroll only costs the tracks and slots it brings into view.
+    """
+
+    def __init__(self, window, on_slot_changed):
+        """
+        Initialize model
+
+        Args:
+            window: SessionWindow whose slots are watched
+            on_slot_changed: Function called with (track index, scene index)
+                             when a visible slot or its clip changes
+        """
+        self.window = window
+        self.on_slot_changed = on_slot_changed
+
+        # (track index, scene index) -> SlotWatcher for each visible slot
+        self._watchers = {}
+
+        # Track -> its clip slots, for each visible track
+        self._clip_slots = {}
+
+    @property
+    def slots(self):
+        """(track index, scene index) -> clip slot, for every visible slot"""
+        return {key: watcher.clip_slot for key, watcher in self._watchers.items()}
+
+    @property
+    def listener_count(self):
+        """Listeners currently registered (one per slot plus two per clip)"""
+        return sum(1 + 2 * (watcher.clip is not None) for watcher in self._watchers.values())
+
+    def slot(self, track_idx, scene_idx):
+        """Get a visible clip slot (None if it isn't in the window)"""
+        watcher = self._watchers.get((track_idx, scene_idx))
+        return watcher.clip_slot if watcher is not None else None
+
+    def state(self, track_idx, scene_idx):
+        """Display state kept for a visible slot (None if unset, or the slot changed since)"""
+        watcher = self._watchers.get((track_idx, scene_idx))
+        return watcher.state if watcher is not None else None
+
+    def set_state(self, track_idx, scene_idx, state):
+        """Keep a display state for a visible slot until it changes"""
+        watcher = self._watchers.get((track_idx, scene_idx))
+        if watcher is not None:
+            watcher.state = state
+
+    def watch(self, reread=False):
+        """
+        Listen to exactly the slots in the window (call after it moves or refreshes)
+
+        Args:
+            reread: Re-read every visible track's clip slots (the scenes
+                    changed); otherwise only tracks entering the window are read
+        """
+        window = self.window
+        scene_end = window.scene_offset + window.rows
+
+        visible = {}
+        track_slots = {}
+        for column, track in enumerate(window.tracks):
+            track_idx = window.track_offset + column
+            clip_slots = None if reread else self._clip_slots.get(track)
+            if clip_slots is None:
+                clip_slots = track.clip_slots
+            track_slots[track] = clip_slots
+            for scene_idx in range(window.scene_offset, min(scene_end, len(clip_slots))):
+                visible[(track_idx, scene_idx)] = clip_slots[scene_idx]
+        self._clip_slots = track_slots
+
+        watchers = self._watchers
+        for key in [key for key in watchers if key not in visible]:
+            watchers.pop(key).disconnect()
+
+        for key, clip_slot in visible.items():
+            watcher = watchers.get(key)
+            if watcher is not None and watcher.clip_slot == clip_slot:
+                continue
+            if watcher is not None:
+                # A different slot at this index (tracks were moved or deleted)
+                watcher.disconnect()
+            watchers[key] = SlotWatcher(clip_slot, key, self.on_slot_changed)
+
+    def clear(self):
+        """Remove every listener (e.g. on disconnect)"""
+        for watcher in self._watchers.values():
+            watcher.disconnect()
+        self._watchers.clear()
+        self._clip_slots.clear()
@@ -0,0 +1,271 @@
+"""
+Asyncio interface for Linnstrument
+Lets one event loop drive input processing, LED rendering and timed
+effects for one or more Linnstruments without extra threads
+"""
+
+import asyncio
+
+import mido
+
+from led_transport import FrameReport
+from linnstrument import Linnstrument
+
+
+class AsyncLinnstrument:
+    """
+    Asyncio facade around a Linnstrument connection
+
+    - Incoming MIDI: ``async for msg in linn`` (requires an input port)
+    - LED frames: ``await linn.commit_frame(frame)`` sends the diff in chunks,
+      yielding to the event loop between chunks
+    - Timed effects: ``await linn.flash(...)``/``linn.schedule(...)`` use loop timers
+    """
+
+    def __init__(self, linnstrument=None, input_port_name=None, open_input=True,
+                 chunk_size=32, **kwargs):
+        """
+        Initialize async Linnstrument
+
+        Args:
+            linnstrument: Existing Linnstrument instance (None to create one from kwargs)
+            input_port_name: MIDI input port name (None for auto-detect)
+            open_input: If False, don't open an input port (LED output only)
+            chunk_size: Cells sent per chunk before yielding to the event loop
+            **kwargs: Passed to Linnstrument() when linnstrument is None
+        """
+        self.linnstrument = linnstrument if linnstrument is not None else Linnstrument(**kwargs)
+        self.chunk_size = chunk_size
+
+        self._input_port_name = input_port_name
+        self._open_input = open_input
+        self._inport = None
+        self._queue = None
+        self._loop = None
+        self._commit_lock = None
+        self._timers = set()
+
+        # Tasks started by schedule(); the loop only keeps weak references
+        self._tasks = set()
+
+        # Last frame committed (what timed effects restore to)
+        self.frame = self.linnstrument.new_frame('off')
+
+    async def open(self):
+        """Open the input port and bind to the running event loop"""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._commit_lock = asyncio.Lock()
+
+        if self._open_input:
+            port_name = self._input_port_name or self._find_input_port()
+            if port_name is None:
+                raise RuntimeError("No Linnstrument MIDI input found. Available ports: " +
+                                   ", ".join(mido.get_input_names()))
+            # The backend calls this from its own thread; hand messages to the loop
+            self._inport = mido.open_input(port_name, callback=self._on_message)
+
+        return self
+
+    async def close(self):
+        """Cancel pending effects, close ports and end message iteration"""
+        self.cancel_effects()
+
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            # Let the tasks run their cancellation before the port goes away
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._inport is not None:
+            self._inport.close()
+            self._inport = None
+
+        if self._queue is not None:
+            self._queue.put_nowait(None)
+
+        self.linnstrument.close()
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _check_open(self):
+        """Raise if open() hasn't bound the instance to an event loop yet"""
+        if self._loop is None:
+            raise RuntimeError("AsyncLinnstrument is not open (call open() or use 'async with')")
+
+    @staticmethod
+    def _find_input_port():
+        """Auto-detect Linnstrument MIDI input port"""
+        for port in mido.get_input_names():
+            if 'linnstrument' in port.lower():
+                return port
+        return None
+
+    def _on_message(self, msg):
+        """Input callback (backend thread)"""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, msg)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        msg = await self.receive()
+        if msg is None:
+            raise StopAsyncIteration
+        return msg
+
+    async def receive(self):
+        """
+        Wait for the next incoming MIDI message
+
+        Returns:
+            mido.Message, or None once the connection is closed
+        """
+        self._check_open()
+        return await self._queue.get()
+
+    async def commit_frame(self, frame, force=False):
+        """
+        Send a frame, writing only cells that differ from what the hardware shows
+
+        Commits are serialized, and the diff is sent in chunks of chunk_size
+        cells so input handling and other devices get a turn in between.
+
+        Args:
+            frame: Frame from Linnstrument.new_frame()/render_*()
+            force: If True, resend every cell
+
+        Returns:
+            FrameReport for the whole frame
+
+        Raises:
+            RuntimeError: If the instance isn't open
+        """
+        self._check_open()
+        async with self._commit_lock:
+            self.frame = list(frame)
+            return await self._send_cells(self.linnstrument.diff_frame(frame, force=force))
+
+    async def _send_cells(self, cells):
+        """Send cells through the transport in chunks, yielding between them"""
+        transport = self.linnstrument.transport
+        cells = transport.order_cells(cells)
+        report = FrameReport()
+
+        for start in range(0, len(cells), self.chunk_size):
+            if start:
+                await asyncio.sleep(0)
+            chunk = transport.write_batch(cells[start:start + self.chunk_size], ordered=False)
+            report.cells += chunk.cells
+            report.messages += chunk.messages
+
+        transport.last_report = report
+        return report
+
+    async def light_scale(self, scale_notes, root_color='red', scale_color='blue'):
+        """Async version of Linnstrument.light_scale"""
+        return await self.commit_frame(
+            self.linnstrument.render_scale(scale_notes, root_color, scale_color))
+
+    async def light_scale_with_degrees(self, scale_notes, color_map=None):
+        """Async version of Linnstrument.light_scale_with_degrees"""
+        return await self.commit_frame(
+            self.linnstrument.render_scale_with_degrees(scale_notes, color_map))
+
+    def schedule(self, delay, callback, *args):
+        """
+        Run a callback after a delay without blocking the loop
+
+        Coroutine functions are started as tasks when the timer fires; the
+        tasks are kept until they finish, their errors are passed to the
+        loop's exception handler, and close() cancels any still running.
+
+        Args:
+            delay: Seconds from now
+            callback: Function or coroutine function
+            *args: Arguments for the callback
+
+        Returns:
+            asyncio.TimerHandle (cancel() to abort)
+
+        Raises:
+            RuntimeError: If the instance isn't open
+        """
+        self._check_open()
+
+        def fire():
+            self._timers.discard(handle)
+            if asyncio.iscoroutinefunction(callback):
+                task = self._loop.create_task(callback(*args))
+                self._tasks.add(task)
+                task.add_done_callback(self._task_done)
+            else:
+                callback(*args)
+
+        handle = self._loop.call_later(delay, fire)
+        self._timers.add(handle)
+        return handle
+
+    def _task_done(self, task):
+        """Forget a finished scheduled task and report its error, if any"""
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._loop.call_exception_handler({
+                'message': 'Scheduled Linnstrument effect failed',
+                'exception': error,
+                'task': task,
+            })
+
+    def schedule_frame(self, delay, frame):
+        """Commit a frame after a delay"""
+        return self.schedule(delay, self.commit_frame, frame)
+
+    async def flash(self, column, row, color, duration=0.15):
+        """
+        Light a cell for a short time, then restore it to the committed frame
+
+        The write and the restore each wait for a commit in progress, so they
+        never land in the middle of a chunked diff and the restore uses the
+        frame that was actually sent.
+
+        Args:
+            column, row: Cell position
+            color: Color number or name
+            duration: Seconds before the cell is restored
+
+        Returns:
+            asyncio.TimerHandle for the restore
+
+        Raises:
+            ValueError: If the cell is outside the grid
+            RuntimeError: If the instance isn't open
+        """
+        linnstrument = self.linnstrument
+        if not (0 <= column < linnstrument.columns and 0 <= row < linnstrument.rows):
+            raise ValueError(f"Cell ({column}, {row}) is outside the "
+                             f"{linnstrument.columns}x{linnstrument.rows} grid")
+        self._check_open()
+        async with self._commit_lock:
+            linnstrument.set_cell_color(column, row, color)
+
+        return self.schedule(duration, self._restore_cell, column, row)
+
+    async def _restore_cell(self, column, row):
+        """Set a cell back to its color in the committed frame"""
+        linnstrument = self.linnstrument
+        async with self._commit_lock:
+            linnstrument.set_cell_color(column, row, self.frame[row * linnstrument.columns + column])
+
+    def cancel_effects(self):
+        """Cancel all scheduled effects that haven't fired yet"""
+        for handle in self._timers:
+            handle.cancel()
+        self._timers.clear()
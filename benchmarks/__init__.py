@@ -0,0 +1,3 @@
+"""
+Offline benchmarks for the Linnstrument tools (see run_benchmarks.py)
+"""
@@ -0,0 +1,57 @@
+"""
+Stand-in mido backend for benchmarks
+Ports accept messages and count them instead of talking to hardware
+
+Select with mido.set_backend('benchmarks.fake_mido')
+"""
+
+import mido.ports
+
+# Port names reported by get_devices()
+PORT_NAMES = ['LinnStrument MIDI']
+
+
+class Counter:
+    """Message/byte counter shared by every fake output port"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.messages = 0
+        self.bytes = 0
+
+
+counter = Counter()
+
+
+class _RawOut:
+    """Mimics rtmidi.MidiOut so Linnstrument's raw-bytes fast path is exercised"""
+
+    def send_message(self, message):
+        counter.messages += 1
+        counter.bytes += len(message)
+
+
+def get_devices(**kwargs):
+    """List fake devices (each is both an input and an output)"""
+    return [{'name': name, 'is_input': True, 'is_output': True} for name in PORT_NAMES]
+
+
+class Output(mido.ports.BaseOutput):
+    """Output port that counts messages"""
+
+    def _open(self, raw=True, **kwargs):
+        if raw:
+            self._rt = _RawOut()
+
+    def _send(self, msg):
+        counter.messages += 1
+        counter.bytes += len(msg.bytes())
+
+
+class Input(mido.ports.BaseInput):
+    """Input port that never receives anything"""
+
+    def _receive(self, block=True):
+        return None
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for the Linnstrument tools
+
+Runs the standalone Linnstrument class and the Remote Script LEDManager and
+modes against a fake mido backend and the mock Live API (mock_live/), and
+reports MIDI messages, bytes, Live API calls, Python time and allocations for
+each scenario on the generic, LinnStrument 128 and 200 Remote Scripts.
+
+Usage:
+    python benchmarks/run_benchmarks.py                     # Run and compare to baselines
+    python benchmarks/run_benchmarks.py --update-baselines  # Store current results
+    python benchmarks/run_benchmarks.py -k session          # Only matching scenarios
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, 'ableton_remote_script'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'mock_live'))
+
+import mido
+
+import Live
+from benchmarks import fake_mido
+from remote_script_harness import MockCInstance, make_song
+
+mido.set_backend('benchmarks.fake_mido', load=True)
+
+from linnstrument import Linnstrument, LINNSTRUMENT_COLUMNS
+from scales import get_scale_notes
+
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baselines.json')
+
+# Remote Script package and standalone column count per geometry
+GEOMETRIES = {
+    'generic': {'package': 'Linnstrument', 'columns': 16},
+    '128': {'package': 'Linnstrument128', 'columns': 16},
+    '200': {'package': 'Linnstrument200', 'columns': LINNSTRUMENT_COLUMNS},
+}
+
+# Tracks in the session scroll scenario
+SESSION_TRACKS = 200
+
+# Instrument tracks in the track navigation scenario
+NAVIGATION_TRACKS = 150
+
+# Set size in the session pad press scenario
+LARGE_SET_TRACKS = 300
+LARGE_SET_SCENES = 400
+
+# Relative slowdown (time and peak memory) tolerated before flagging a regression
+DEFAULT_TOLERANCE = 0.5
+
+# Differences below these are noise, never a regression
+MIN_TIME_DELTA_MS = 0.1
+MIN_PEAK_DELTA_KIB = 16
+
+
+def load_remote(geometry):
+    """Import a Remote Script package's modules for a geometry"""
+    package = GEOMETRIES[geometry]['package']
+    return {
+        'config': importlib.import_module(f'{package}.config'),
+        'ableton': importlib.import_module(f'{package}.linnstrument_ableton'),
+        'led_manager': importlib.import_module(f'{package}.led_manager'),
+        'modes': importlib.import_module(f'{package}.modes'),
+    }
+
+
+def build_remote(geometry, song):
+    """
+    Build the Remote Script objects the modes need
+
+    Returns:
+        (remote modules, c_instance, linnstrument, led_manager)
+    """
+    remote = load_remote(geometry)
+    config = remote['config']
+    c_instance = MockCInstance(song)
+    linnstrument = remote['ableton'].LinnstrumentAbletonMIDI(
+        c_instance,
+        row_offset=config.LINNSTRUMENT_ROW_OFFSET,
+        column_offset=config.LINNSTRUMENT_COLUMN_OFFSET,
+        base_note=config.LINNSTRUMENT_BASE_NOTE
+    )
+    led_manager = remote['led_manager'].LEDManager(linnstrument, c_instance)
+    return remote, c_instance, linnstrument, led_manager
+
+
+def host_set(obj, name, value):
+    """
+    Change a Live property the way Live itself would
+
+    The change notifies the script's listeners, but isn't counted as an API
+    call: only the calls the script makes in response are.
+    """
+    obj._set(name, value)
+
+
+def make_mode(remote, name, c_instance, linnstrument, led_manager, song):
+    """Construct a mode class by name"""
+    return getattr(remote['modes'], name)(c_instance, linnstrument, led_manager, song)
+
+
+def drain(linnstrument):
+    """Flush queued LED writes tick by tick, as update_display would"""
+    while linnstrument.pending_leds:
+        linnstrument.flush_leds()
+
+
+def drained(linnstrument, run):
+    """Wrap a scenario's run so its queued LED writes are sent (and measured)"""
+    def run_and_drain():
+        run()
+        drain(linnstrument)
+    return run_and_drain
+
+
+# Scenarios: each takes a geometry name, does its setup and returns
+# (run, counter), where run() performs the measured work and counter has
+# messages/bytes/reset() for the MIDI it sends.
+
+def standalone_scale_change(geometry):
+    """Linnstrument: C major -> F# dorian"""
+    linnstrument = Linnstrument(port_name=fake_mido.PORT_NAMES[0],
+                                columns=GEOMETRIES[geometry]['columns'], base_note=36)
+    linnstrument.light_scale(get_scale_notes(0, 'major'))
+    target = get_scale_notes(6, 'dorian')
+    return (lambda: linnstrument.light_scale(target)), fake_mido.counter
+
+
+def led_manager_refresh(geometry):
+    """LEDManager: resend the whole cached grid"""
+    song = make_song()
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    keyboard = make_mode(remote, 'KeyboardMode', c_instance, linnstrument, led_manager, song)
+    keyboard.enter()
+    drain(linnstrument)
+    return drained(linnstrument, led_manager.refresh_all), c_instance
+
+
+def keyboard_scale_change(geometry):
+    """KeyboardMode: C major -> F# dorian via Live's root/scale notifications"""
+    song = make_song()
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    keyboard = make_mode(remote, 'KeyboardMode', c_instance, linnstrument, led_manager, song)
+    keyboard.enter()
+    drain(linnstrument)
+
+    def run():
+        host_set(song, 'root_note', 6)
+        host_set(song, 'scale_name', 'Dorian')
+        # One display tick: both notifications are handled in one redraw
+        keyboard.update()
+
+    return drained(linnstrument, run), c_instance
+
+
+def mode_switch(geometry):
+    """KeyboardMode -> DrumMode -> KeyboardMode, following the selected track"""
+    song = make_song()
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    keyboard = make_mode(remote, 'KeyboardMode', c_instance, linnstrument, led_manager, song)
+    drum = make_mode(remote, 'DrumMode', c_instance, linnstrument, led_manager, song)
+    keyboard.enter()
+    keys_track, drum_track = song.tracks[0], song.tracks[-1]
+
+    # Modes are attached up front (their framebuffers are kept current) and
+    # the drum rack has been seen before, so the measured switch is just the
+    # diff between the two frames
+    drum.attach()
+    for track in (drum_track, keys_track):
+        host_set(song.view, 'selected_track', track)
+        drum.update()
+    drain(linnstrument)
+
+    def run():
+        keyboard.exit()
+        host_set(song.view, 'selected_track', drum_track)
+        drum.enter()
+        drum.exit()
+        host_set(song.view, 'selected_track', keys_track)
+        keyboard.enter()
+
+    return drained(linnstrument, run), c_instance
+
+
+def drum_pad_select(geometry):
+    """DrumMode: select pad 5 from the grid"""
+    song = make_song()
+    host_set(song.view, 'selected_track', song.tracks[-1])
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    drum = make_mode(remote, 'DrumMode', c_instance, linnstrument, led_manager, song)
+    drum.enter()
+    drain(linnstrument)
+    note = linnstrument.get_note_at_position(1, 1)
+    return drained(linnstrument, lambda: drum.handle_note(note, 100, True)), c_instance
+
+
+def drum_redraw(geometry):
+    """DrumMode: re-render the pad grid 10 times (e.g. track color or rack changes)"""
+    song = make_song()
+    host_set(song.view, 'selected_track', song.tracks[-1])
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    drum = make_mode(remote, 'DrumMode', c_instance, linnstrument, led_manager, song)
+    drum.enter()
+    drain(linnstrument)
+
+    def run():
+        for _ in range(10):
+            drum.update_leds()
+
+    return drained(linnstrument, run), c_instance
+
+
+def sequencer_playback(geometry):
+    """DrumMode: four bars of playback of the drum clip, song time notified every 1/64 beat"""
+    song = make_song(track_count=0, clip_every=1)
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    drum = make_mode(remote, 'DrumMode', c_instance, linnstrument, led_manager, song)
+    drum.enter()
+    song.tracks[-1].clip_slots[0]._set_playing(True)
+    host_set(song, 'is_playing', True)
+    drain(linnstrument)
+
+    def run():
+        for tick in range(1, 16 * 64 + 1):
+            host_set(song, 'current_song_time', tick / 64)
+
+    return drained(linnstrument, run), c_instance
+
+
+def track_navigation(geometry):
+    """DrumMode: arrow through a 150-track set and back, one display tick per step"""
+    song = make_song(track_count=NAVIGATION_TRACKS)
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    drum = make_mode(remote, 'DrumMode', c_instance, linnstrument, led_manager, song)
+    drum.enter()
+    tracks = list(song.tracks)
+
+    def walk():
+        for track in tracks + tracks[::-1]:
+            host_set(song.view, 'selected_track', track)
+            drum.update()
+
+    # Every track has been visited once before the measured walk
+    walk()
+    drain(linnstrument)
+    return drained(linnstrument, walk), c_instance
+
+
+def session_scroll(geometry):
+    """SessionMode: scroll one track at a time across a 200-track set"""
+    song = make_song(track_count=SESSION_TRACKS, drum_track=False)
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    session = make_mode(remote, 'SessionMode', c_instance, linnstrument, led_manager, song)
+    session.enter()
+    drain(linnstrument)
+    steps = SESSION_TRACKS - remote['config'].SESSION_COLUMNS
+
+    def run():
+        for _ in range(steps):
+            session.navigate_session(1, 0)
+
+    return drained(linnstrument, run), c_instance
+
+
+def session_clip_launch(geometry):
+    """SessionMode: launch and stop the visible clips of one scene"""
+    song = make_song(track_count=SESSION_TRACKS, drum_track=False, clip_every=1)
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    session = make_mode(remote, 'SessionMode', c_instance, linnstrument, led_manager, song)
+    session.enter()
+    drain(linnstrument)
+    clip_slots = [track.clip_slots[0] for track in song.tracks[:remote['config'].SESSION_COLUMNS]]
+
+    def run():
+        # Launched from Live's own UI, so only the script's reaction is counted
+        for clip_slot in clip_slots:
+            clip_slot._set_playing(True)
+        for clip_slot in clip_slots:
+            clip_slot._set_playing(False)
+
+    return drained(linnstrument, run), c_instance
+
+
+def session_pad_press(geometry):
+    """SessionMode: press every clip pad once in a 300-track, 400-scene set"""
+    song = make_song(track_count=LARGE_SET_TRACKS, scene_count=LARGE_SET_SCENES, drum_track=False)
+    remote, c_instance, linnstrument, led_manager = build_remote(geometry, song)
+    session = make_mode(remote, 'SessionMode', c_instance, linnstrument, led_manager, song)
+    session.enter()
+    drain(linnstrument)
+
+    config = remote['config']
+    notes = [linnstrument.get_note_at_position(column, row)
+             for column in range(config.SESSION_COLUMNS) for row in range(1, 7)]
+
+    def run():
+        for note in notes:
+            session.handle_note(note, 100, True)
+
+    return drained(linnstrument, run), c_instance
+
+
+SCENARIOS = {
+    'standalone_scale_change': standalone_scale_change,
+    'led_manager_refresh': led_manager_refresh,
+    'keyboard_scale_change': keyboard_scale_change,
+    'mode_switch': mode_switch,
+    'drum_pad_select': drum_pad_select,
+    'drum_redraw': drum_redraw,
+    'sequencer_playback': sequencer_playback,
+    'track_navigation': track_navigation,
+    'session_scroll': session_scroll,
+    'session_clip_launch': session_clip_launch,
+    'session_pad_press': session_pad_press,
+}
+
+
+def measure(scenario, geometry, repeat):
+    """
+    Run one scenario
+
+    Every repetition gets a fresh setup. Time is the best of `repeat` runs;
+    allocations are measured in a separate run so tracing doesn't skew time.
+    Anything the code under test prints is discarded.
+
+    Returns:
+        Dict of messages, bytes, api_calls, time_ms, peak_kib
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return _measure(scenario, geometry, repeat)
+
+
+def _measure(scenario, geometry, repeat):
+    best = None
+    for _ in range(repeat):
+        run, counter = scenario(geometry)
+        counter.reset()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    run, counter = scenario(geometry)
+    counter.reset()
+    Live.stats.reset()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'messages': counter.messages,
+        'bytes': counter.bytes,
+        'api_calls': Live.stats.total,
+        'time_ms': round(best * 1000, 3),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def compare(result, baseline, tolerance):
+    """
+    Compare a result to its baseline
+
+    MIDI and API call counts are deterministic, so any increase is a regression; time and
+    peak memory are flagged when they exceed the baseline by more than tolerance.
+
+    Returns:
+        List of regression descriptions (empty if none)
+    """
+    problems = []
+    for key in ('messages', 'bytes', 'api_calls'):
+        if key in baseline and result[key] > baseline[key]:
+            problems.append(f"{key} {baseline[key]} -> {result[key]}")
+    if (result['time_ms'] > baseline['time_ms'] * (1 + tolerance) and
+            result['time_ms'] - baseline['time_ms'] > MIN_TIME_DELTA_MS):
+        problems.append(f"time_ms {baseline['time_ms']} -> {result['time_ms']}")
+    if (result['peak_kib'] > baseline['peak_kib'] * (1 + tolerance) and
+            result['peak_kib'] - baseline['peak_kib'] > MIN_PEAK_DELTA_KIB):
+        problems.append(f"peak_kib {baseline['peak_kib']} -> {result['peak_kib']}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run offline Linnstrument benchmarks')
+    parser.add_argument('-k', '--filter', default='',
+                        help='Only run scenarios whose name contains this string')
+    parser.add_argument('-g', '--geometry', choices=sorted(GEOMETRIES), action='append',
+                        help='Geometry to run (default: all)')
+    parser.add_argument('-n', '--repeat', type=int, default=5,
+                        help='Timed runs per scenario (default: 5)')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Allowed relative increase in time/memory (default: 0.5)')
+    parser.add_argument('--update-baselines', action='store_true',
+                        help='Write results to baselines.json instead of comparing')
+    args = parser.parse_args()
+
+    geometries = args.geometry or sorted(GEOMETRIES)
+
+    baselines = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE) as f:
+            baselines = json.load(f)
+
+    print(f"{'scenario':<28} {'geom':>7} {'msgs':>7} {'bytes':>8} {'calls':>7} {'ms':>9} {'peak KiB':>9}  status")
+    print('-' * 91)
+
+    results = {}
+    regressions = 0
+    for name, scenario in SCENARIOS.items():
+        if args.filter not in name:
+            continue
+        for geometry in geometries:
+            key = f"{name}@{geometry}"
+            result = measure(scenario, geometry, args.repeat)
+            results[key] = result
+
+            if args.update_baselines:
+                status = 'stored'
+            elif key not in baselines:
+                status = 'new'
+            else:
+                problems = compare(result, baselines[key], args.tolerance)
+                status = 'REGRESSION: ' + ', '.join(problems) if problems else 'ok'
+                regressions += bool(problems)
+
+            print(f"{name:<28} {geometry:>7} {result['messages']:>7} {result['bytes']:>8} "
+                  f"{result['api_calls']:>7} "
+                  f"{result['time_ms']:>9.3f} {result['peak_kib']:>9.1f}  {status}")
+
+    if args.update_baselines:
+        baselines.update(results)
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"\nBaselines written to {BASELINE_FILE}")
+        return 0
+
+    if regressions:
+        print(f"\n{regressions} regression(s) against {BASELINE_FILE}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
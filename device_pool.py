@@ -0,0 +1,170 @@
+"""
+Multi-device pool for driving several Linnstruments from one process
+Each device keeps its own geometry; scale changes and frames fan out concurrently
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import mido
+
+from linnstrument import Linnstrument, LINNSTRUMENT_COLUMNS
+
+# Playable columns per model
+LINNSTRUMENT_128_COLUMNS = 16
+LINNSTRUMENT_200_COLUMNS = LINNSTRUMENT_COLUMNS
+
+# Model number in a port name -> playable columns
+MODEL_COLUMNS = {'128': LINNSTRUMENT_128_COLUMNS, '200': LINNSTRUMENT_200_COLUMNS}
+
+_MODEL_PATTERN = re.compile(r'(?<!\d)(128|200)(?!\d)')
+
+
+def find_linnstrument_ports():
+    """Get every MIDI output port that looks like a Linnstrument"""
+    return [port for port in mido.get_output_names() if 'linnstrument' in port.lower()]
+
+
+def columns_from_port_name(port_name):
+    """
+    Guess a device's playable columns from its port name
+
+    Works for ports named after the model (e.g. a renamed "LinnStrument 128"
+    or an OS alias); the stock USB name doesn't say which model is attached.
+
+    Returns:
+        Column count, or None if the name doesn't mention a model
+    """
+    match = _MODEL_PATTERN.search(port_name)
+    return MODEL_COLUMNS[match.group(1)] if match else None
+
+
+class DevicePool:
+    """
+    Pool of Linnstrument connections, one per output port
+
+    Each device's geometry comes from ``columns`` (exact port name -> column
+    count) or, for unlisted ports, from a model number in the port name.
+    The stock port name doesn't say which model is attached, so a port that
+    is in neither is an error rather than a guess.
+    """
+
+    def __init__(self, port_names=None, columns=None, **kwargs):
+        """
+        Open every Linnstrument in the pool
+
+        Args:
+            port_names: Output port names (None to enumerate all Linnstrument ports)
+            columns: Dict mapping port name to playable column count (16 or 26);
+                     required for ports whose name doesn't include 128 or 200
+            **kwargs: Passed to each Linnstrument() (channel, row_offset, base_note, ...)
+
+        Raises:
+            ValueError: If a port's model can't be told from columns or its name
+        """
+        if port_names is None:
+            port_names = find_linnstrument_ports()
+
+        if not port_names:
+            raise RuntimeError("No Linnstrument MIDI ports found. Available ports: " +
+                               ", ".join(mido.get_output_names()))
+
+        columns = columns or {}
+        port_columns = {port_name: columns.get(port_name) or columns_from_port_name(port_name)
+                        for port_name in port_names}
+        unknown = [port_name for port_name, count in port_columns.items() if count is None]
+        if unknown:
+            raise ValueError("Can't tell which Linnstrument model is on " +
+                             ", ".join(repr(port_name) for port_name in unknown) +
+                             f"; pass columns={{port name: {LINNSTRUMENT_128_COLUMNS} "
+                             f"or {LINNSTRUMENT_200_COLUMNS}}}")
+
+        self.devices = {}
+
+        try:
+            for port_name in port_names:
+                self.devices[port_name] = Linnstrument(
+                    port_name=port_name,
+                    columns=port_columns[port_name],
+                    **kwargs
+                )
+        except Exception:
+            self.close()
+            raise
+
+        # One worker per device so every device's MIDI goes out at the same time
+        self._executor = ThreadPoolExecutor(max_workers=len(self.devices),
+                                            thread_name_prefix='DevicePool')
+
+    def close(self):
+        """Close every device"""
+        executor = getattr(self, '_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+            self._executor = None
+
+        for linnstrument in self.devices.values():
+            linnstrument.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return len(self.devices)
+
+    def geometry(self, port_name):
+        """
+        Get one device's layout
+
+        Returns:
+            GridGeometry (columns, rows and note/position lookups)
+        """
+        return self.devices[port_name].geometry
+
+    @property
+    def geometries(self):
+        """Dict mapping port name to that device's GridGeometry"""
+        return {name: linnstrument.geometry for name, linnstrument in self.devices.items()}
+
+    def map(self, func):
+        """
+        Call func(linnstrument) on every device concurrently
+
+        Args:
+            func: Callable taking a Linnstrument
+
+        Returns:
+            Dict mapping port name to func's result
+        """
+        futures = {name: self._executor.submit(func, linnstrument)
+                   for name, linnstrument in self.devices.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def commit_frames(self, render):
+        """
+        Render a frame for each device's geometry and commit them all concurrently
+
+        Args:
+            render: Callable taking a Linnstrument and returning a frame for it
+
+        Returns:
+            Dict mapping port name to FrameReport
+        """
+        return self.map(lambda linnstrument: linnstrument.commit_frame(render(linnstrument)))
+
+    def light_scale(self, scale_notes, root_color='red', scale_color='blue'):
+        """Light a scale on every device (see Linnstrument.light_scale)"""
+        return self.map(lambda linnstrument: linnstrument.light_scale(
+            scale_notes, root_color, scale_color))
+
+    def light_scale_with_degrees(self, scale_notes, color_map=None):
+        """Light a scale by degree on every device (see Linnstrument.light_scale_with_degrees)"""
+        return self.map(lambda linnstrument: linnstrument.light_scale_with_degrees(
+            scale_notes, color_map))
+
+    def clear_all_lights(self):
+        """Turn off all LEDs on every device"""
+        return self.map(lambda linnstrument: linnstrument.clear_all_lights())
@@ -21,6 +21,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from scales import get_scale_notes, get_available_scales, SCALES
 from linnstrument import Linnstrument
+from led_worker import LEDOutputWorker
 
 class ScaleDetector:
     """Detects the scale being played based on MIDI note input"""
@@ -116,6 +117,10 @@ class MIDIEffectPlugin:
         print("Connecting to Linnstrument for light control...")
         self.linnstrument = Linnstrument(port_name=linnstrument_port_name)
 
+        # LED frames are rendered here and sent from a dedicated worker thread,
+        # so passthrough MIDI is never stuck behind a redraw
+        self.led_worker = LEDOutputWorker(self.linnstrument)
+
         # Scale detection
         self.scale_detector = ScaleDetector()
         self.current_lit_scale = None
@@ -161,14 +166,18 @@ class MIDIEffectPlugin:
         # Only update if scale changed
         if scale_id != self.current_lit_scale:
             print(f"Updating Linnstrument lights...")
-            self.linnstrument.light_scale_with_degrees(scale_notes)
+            # Render off-line and hand the frame to the LED worker; a newer
+            # frame replaces this one if it hasn't been sent yet
+            frame = self.linnstrument.render_scale_with_degrees(scale_notes)
+            self.led_worker.submit(frame)
             self.current_lit_scale = scale_id
 
     def run(self):
         """Main loop: process MIDI and update lights"""
         self.running = True
 
-        # Start light update thread
+        # Start LED output worker and light update thread
+        self.led_worker.start()
         update_thread = threading.Thread(target=self._light_update_loop, daemon=True)
         update_thread.start()
 
@@ -189,7 +198,7 @@ class MIDIEffectPlugin:
             self.stop()
 
     def _light_update_loop(self):
-        """Background thread for updating lights"""
+        """Background thread for scale detection (frames are sent by led_worker)"""
         while self.running:
             self.update_lights()
             time.sleep(self.update_interval)
@@ -197,9 +206,10 @@ class MIDIEffectPlugin:
     def stop(self):
         """Stop the plugin and cleanup"""
         self.running = False
+        # The worker closes the Linnstrument once any in-flight frame is sent
+        self.led_worker.stop(close=True)
         self.midi_in.close()
         self.midi_out.close()
-        self.linnstrument.close()
         print("Plugin stopped.")
 
     @staticmethod
@@ -0,0 +1,242 @@
+"""
+Background LED output workers for the standalone Linnstrument tools
+Commit frames and play LED animations on dedicated threads so MIDI
+processing never waits on a redraw
+"""
+
+import threading
+from collections import deque
+
+from led_animation import AnimationTimeline
+
+
+class LEDOutputWorker:
+    """
+    Dedicated thread that commits frames to a Linnstrument
+
+    Frames are queued in a bounded buffer; when it is full, a newly submitted
+    frame pushes out the oldest unsent one. With the default size of 1 only
+    the latest frame is ever waiting, so rapid scale changes never build a backlog.
+    """
+
+    def __init__(self, linnstrument, max_pending=1, name='LEDOutputWorker'):
+        """
+        Initialize worker
+
+        Args:
+            linnstrument: Linnstrument instance (owns the LED port)
+            max_pending: Maximum number of frames waiting to be sent
+            name: Thread name
+        """
+        self.linnstrument = linnstrument
+        self._pending = deque(maxlen=max_pending)
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = None
+        self._name = name
+
+        # Set by the worker (under the condition) once it leaves its loop
+        self._finished = False
+        # Set by stop() when the worker must close the port on its way out
+        self._close_on_exit = False
+
+        # Counters
+        self.frames_submitted = 0
+        self.frames_superseded = 0
+        self.frames_committed = 0
+
+    def start(self):
+        """Start the worker thread"""
+        if self._running:
+            return
+        self._running = True
+        self._finished = False
+        self._close_on_exit = False
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def submit(self, frame):
+        """
+        Queue a frame for sending (never blocks on MIDI output)
+
+        Args:
+            frame: Frame from Linnstrument.new_frame()/render_*()
+        """
+        with self._condition:
+            if len(self._pending) == self._pending.maxlen:
+                self.frames_superseded += 1
+            self._pending.append(frame)
+            self.frames_submitted += 1
+            self._condition.notify()
+
+    def stop(self, timeout=1.0, close=False):
+        """
+        Stop the worker thread, dropping frames that were not sent yet
+
+        Args:
+            timeout: Seconds to wait for an in-progress commit to finish
+            close: Also close the Linnstrument. If the commit is still running
+                   when the timeout expires, the worker closes it once the
+                   commit returns, so the port is never closed under it.
+
+        Returns:
+            True if the worker thread has finished
+        """
+        with self._condition:
+            self._running = False
+            self._pending.clear()
+            self._condition.notify()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        with self._condition:
+            finished = self._thread is None or self._finished
+            if close and not finished:
+                self._close_on_exit = True
+        if finished:
+            self._thread = None
+            if close:
+                self.linnstrument.close()
+        return finished
+
+    def _run(self):
+        """Worker loop: wait for a frame, commit it, repeat"""
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._running:
+                    self._finished = True
+                    close = self._close_on_exit
+                    break
+                frame = self._pending.popleft()
+
+            # Commit outside the lock so submit() never waits on MIDI output
+            try:
+                self.linnstrument.commit_frame(frame)
+                self.frames_committed += 1
+            except Exception as e:
+                print(f"LED output error: {e}")
+
+        # stop() timed out during the last commit and left the port to us
+        if close:
+            self.linnstrument.close()
+
+
+class AnimationTimer:
+    """
+    Timer thread that plays LED animations over a base frame
+
+    The timer owns LED output: give it the frame to show with set_frame()
+    and start effects with play(). Every animation frame (at most
+    timeline.fps per second) it draws the animated cells over the base frame
+    and commits the result, so only cells that changed are sent.
+    """
+
+    def __init__(self, linnstrument, timeline=None, name='AnimationTimer'):
+        """
+        Initialize timer
+
+        Args:
+            linnstrument: Linnstrument instance (owns the LED port)
+            timeline: AnimationTimeline to play (None for one with default fps/budget)
+            name: Thread name
+        """
+        self.linnstrument = linnstrument
+        self.timeline = timeline if timeline is not None else AnimationTimeline()
+        self._frame = linnstrument.new_frame('off')
+        self._frame_changed = False
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = None
+        self._name = name
+
+        # Counters
+        self.frames_committed = 0
+
+    def start(self):
+        """Start the timer thread"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """
+        Stop the timer thread (animated cells are left as they are)
+
+        Args:
+            timeout: Seconds to wait for an in-progress commit to finish
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def set_frame(self, frame):
+        """
+        Set the base frame animations are drawn over (sent on the next timer frame)
+
+        Args:
+            frame: Frame from Linnstrument.new_frame()/render_*()
+        """
+        with self._condition:
+            self._frame = list(frame)
+            self._frame_changed = True
+            self._condition.notify()
+
+    def play(self, animation, key=None):
+        """Start an animation (see AnimationTimeline.play)"""
+        with self._condition:
+            key = self.timeline.play(animation, key)
+            self._condition.notify()
+        return key
+
+    def stop_animation(self, key):
+        """Stop an animation (its cells are restored on the next timer frame)"""
+        with self._condition:
+            self.timeline.stop(key)
+
+    def _compose(self):
+        """Base frame with the timeline's cells drawn over it"""
+        frame = list(self._frame)
+        columns, rows = self.linnstrument.columns, self.linnstrument.rows
+        color_value = self.linnstrument._color_value
+        for (column, row), color in self.timeline.shown.items():
+            if 0 <= column < columns and 0 <= row < rows:
+                frame[row * columns + column] = color_value(color)
+        return frame
+
+    def _run(self):
+        """Timer loop: wait for the next frame, advance the timeline, commit if anything changed"""
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                if not (self.timeline.active or self._frame_changed):
+                    # Idle until there is something to draw
+                    self._condition.wait()
+                    continue
+                delay = self.timeline.next_frame_in()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    if not self._running:
+                        return
+
+                changes = self.timeline.advance()
+                if not (changes or self._frame_changed):
+                    continue
+                self._frame_changed = False
+                frame = self._compose()
+
+            # Commit outside the lock so set_frame()/play() never wait on MIDI output
+            try:
+                self.linnstrument.commit_frame(frame)
+                self.frames_committed += 1
+            except Exception as e:
+                print(f"LED animation error: {e}")
@@ -4,7 +4,9 @@ Handles MIDI communication with Linnstrument for LED control
 """
 
 import mido
-import time
+
+from grid_geometry import get_geometry
+from led_transport import LEDTransport
 
 # Linnstrument uses a 26-column x 8-row grid
 LINNSTRUMENT_COLUMNS = 26
@@ -30,13 +32,22 @@ COLORS = {
     'pink': 11,
 }
 
+def _encode_raw(status, control, value):
+    """Encode a CC as raw bytes (rtmidi fast path)"""
+    return bytes((status, control, value))
+
+def _encode_message(status, control, value):
+    """Encode a CC as a mido.Message (fallback for backends without raw output)"""
+    return mido.Message('control_change', channel=status & 0x0F, control=control, value=value)
+
 class Linnstrument:
     """
     Interface for controlling Linnstrument LEDs via MIDI
     """
 
     def __init__(self, port_name=None, channel=0, row_offset=DEFAULT_ROW_OFFSET,
-                 column_offset=DEFAULT_COLUMN_OFFSET, base_note=0):
+                 column_offset=DEFAULT_COLUMN_OFFSET, base_note=0,
+                 columns=LINNSTRUMENT_COLUMNS, rows=LINNSTRUMENT_ROWS, raw_midi=True):
         """
         Initialize Linnstrument controller
 
@@ -46,12 +57,23 @@ class Linnstrument:
             row_offset: Semitones between rows (default 5)
             column_offset: Semitones between columns (default 1)
             base_note: MIDI note number at position (0, 0)
+            columns: Number of playable columns (26 for LS200, 16 for LS128)
+            rows: Number of rows
+            raw_midi: Send pre-built raw bytes straight to the backend when it
+                      supports it (falls back to pre-built mido.Message objects)
         """
         self.channel = channel
+        self.columns = columns
+        self.rows = rows
+        self._geometry = None
         self.row_offset = row_offset
         self.column_offset = column_offset
         self.base_note = base_note
 
+        # Shadow framebuffer: what the hardware currently shows, indexed
+        # row * columns + column (None = unknown, e.g. right after connecting)
+        self._framebuffer = [None] * (columns * rows)
+
         # Find and open MIDI port
         if port_name is None:
             port_name = self._find_linnstrument_port()
@@ -63,6 +85,17 @@ class Linnstrument:
         self.port = mido.open_output(port_name)
         print(f"Connected to Linnstrument on port: {port_name}")
 
+        # Cell writes go through the transport so repeated coordinates are skipped.
+        # Its messages are built once up front: raw 3-byte CCs pushed straight to
+        # the backend when possible, otherwise mido.Message objects for port.send
+        raw_send = self._find_raw_sender(self.port) if raw_midi else None
+        if raw_send is not None:
+            self.transport = LEDTransport(self._locked_raw_sender(self.port, raw_send),
+                                          channel=channel, encode=_encode_raw,
+                                          send_many=self._raw_sender_many(self.port, raw_send))
+        else:
+            self.transport = LEDTransport(self.port.send, channel=channel, encode=_encode_message)
+
     def _find_linnstrument_port(self):
         """Auto-detect Linnstrument MIDI port"""
         ports = mido.get_output_names()
@@ -82,6 +115,42 @@ class Linnstrument:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    # Changing the layout drops the geometry index so the next lookup rebuilds it
+    @property
+    def row_offset(self):
+        return self._row_offset
+
+    @row_offset.setter
+    def row_offset(self, value):
+        self._row_offset = value
+        self._geometry = None
+
+    @property
+    def column_offset(self):
+        return self._column_offset
+
+    @column_offset.setter
+    def column_offset(self, value):
+        self._column_offset = value
+        self._geometry = None
+
+    @property
+    def base_note(self):
+        return self._base_note
+
+    @base_note.setter
+    def base_note(self, value):
+        self._base_note = value
+        self._geometry = None
+
+    @property
+    def geometry(self):
+        """GridGeometry index for the current layout"""
+        if self._geometry is None:
+            self._geometry = get_geometry(self._base_note, self._row_offset,
+                                          self._column_offset, self.columns, self.rows)
+        return self._geometry
+
     def get_note_at_position(self, column, row):
         """
         Calculate MIDI note number at a given grid position
@@ -93,7 +162,7 @@ class Linnstrument:
         Returns:
             MIDI note number
         """
-        return self.base_note + (column * self.column_offset) + (row * self.row_offset)
+        return self.geometry.note_at(column, row)
 
     def get_position_for_note(self, note):
         """
@@ -103,16 +172,63 @@ class Linnstrument:
             note: MIDI note number
 
         Returns:
-            List of (column, row) tuples
+            Tuple of (column, row) tuples
         """
-        positions = []
+        return self.geometry.positions_for_note(note)
 
-        for row in range(LINNSTRUMENT_ROWS):
-            for column in range(LINNSTRUMENT_COLUMNS):
-                if self.get_note_at_position(column, row) == note:
-                    positions.append((column, row))
+    @staticmethod
+    def _color_value(color):
+        """Resolve a color name or number to a color number"""
+        if isinstance(color, str):
+            return COLORS.get(color.lower(), 0)
+        return color
 
-        return positions
+    @staticmethod
+    def _find_raw_sender(port):
+        """
+        Get a function that sends raw MIDI bytes on a mido port, if the backend has one
+
+        This relies on two mido internals: the rtmidi backend exposes its
+        rtmidi.MidiOut as port._rt, and every port has the lock port._lock
+        that send() and close() hold. The raw sender is only used with both
+        (see _locked_raw_sender); other backends only accept mido.Message
+        objects.
+        """
+        if getattr(port, '_lock', None) is None:
+            return None
+        rt = getattr(port, '_rt', None)
+        send_message = getattr(rt, 'send_message', None)
+        return send_message if callable(send_message) else None
+
+    @staticmethod
+    def _locked_raw_sender(port, raw_send):
+        """
+        Wrap a raw sender in the port's lock, like port.send()
+
+        LED workers send from their own threads, so raw writes must not
+        interleave with other senders or run after close().
+        """
+        lock = port._lock
+
+        def send(message):
+            with lock:
+                if port.closed:
+                    raise ValueError('send() called on closed port')
+                raw_send(message)
+        return send
+
+    @staticmethod
+    def _raw_sender_many(port, raw_send):
+        """Wrap a raw sender so a whole batch of pre-built messages goes out in one loop under the port's lock"""
+        lock = port._lock
+
+        def send_many(messages):
+            with lock:
+                if port.closed:
+                    raise ValueError('send() called on closed port')
+                for message in messages:
+                    raw_send(message)
+        return send_many
 
     def set_cell_color(self, column, row, color):
         """
@@ -123,23 +239,79 @@ class Linnstrument:
             row: Row number (0-7)
             color: Color number (0-11) or color name string
         """
-        if isinstance(color, str):
-            color = COLORS.get(color.lower(), 0)
+        color = self._color_value(color)
+
+        # Linnstrument uses CC20 for column, CC21 for row, CC22 for color;
+        # the transport skips CC20/CC21 when the device already has that value
+        self.transport.write_cell(column, row, color)
+
+        if 0 <= column < self.columns and 0 <= row < self.rows:
+            self._framebuffer[row * self.columns + column] = color
+
+    def new_frame(self, color='off'):
+        """
+        Create an off-line frame filled with a single color
+
+        Frames are lists of color numbers indexed row * columns + column.
+        Nothing is sent until the frame is passed to commit_frame().
+        """
+        return [self._color_value(color)] * (self.columns * self.rows)
+
+    def set_frame_note(self, frame, note, color):
+        """Set every cell that plays a note to a color in an off-line frame"""
+        color = self._color_value(color)
+        columns = self.columns
+        for column, row in self.get_position_for_note(note):
+            frame[row * columns + column] = color
+
+    def diff_frame(self, frame, force=False):
+        """
+        Compare a frame with the shadow framebuffer and mark the changes as shown
+
+        The caller is responsible for sending the returned cells (commit_frame
+        does this in one batch).
+
+        Args:
+            frame: Frame from new_frame()/render_*()
+            force: If True, return every cell regardless of the shadow state
+
+        Returns:
+            List of (column, row, color) tuples that differ
+        """
+        columns = self.columns
+        shown = self._framebuffer
+        changed = []
+
+        for index, color in enumerate(frame):
+            if force or shown[index] != color:
+                changed.append((index % columns, index // columns, color))
+                shown[index] = color
+
+        return changed
+
+    def commit_frame(self, frame, force=False):
+        """
+        Send a frame to the hardware, writing only cells that differ from the shadow framebuffer
+
+        Changed cells are sent as one ordered batch through the LED transport.
+
+        Args:
+            frame: Frame from new_frame()/render_*()
+            force: If True, resend every cell regardless of the shadow state
+
+        Returns:
+            FrameReport with the cell and message counts for this frame
+        """
+        return self.transport.write_batch(self.diff_frame(frame, force=force))
 
-        # Linnstrument uses CC20 for column, CC21 for row, CC22 for color
-        self.port.send(mido.Message('control_change', channel=self.channel,
-                                    control=20, value=column))
-        self.port.send(mido.Message('control_change', channel=self.channel,
-                                    control=21, value=row))
-        self.port.send(mido.Message('control_change', channel=self.channel,
-                                    control=22, value=color))
+    def invalidate_framebuffer(self):
+        """Forget the shadow state so the next commit resends every cell"""
+        self._framebuffer = [None] * (self.columns * self.rows)
+        self.transport.invalidate()
 
     def clear_all_lights(self):
         """Turn off all LEDs"""
-        for row in range(LINNSTRUMENT_ROWS):
-            for column in range(LINNSTRUMENT_COLUMNS):
-                self.set_cell_color(column, row, 'off')
-        time.sleep(0.1)  # Brief pause to ensure all messages are processed
+        return self.commit_frame(self.new_frame('off'))
 
     def light_note(self, note, color):
         """
@@ -153,38 +325,49 @@ class Linnstrument:
         for column, row in positions:
             self.set_cell_color(column, row, color)
 
-    def light_scale(self, scale_notes, root_color='red', scale_color='blue'):
+    def render_scale(self, scale_notes, root_color='red', scale_color='blue'):
         """
-        Light up all notes in a scale
+        Render a scale into an off-line frame (see light_scale)
 
-        Args:
-            scale_notes: List of MIDI note numbers in the scale
-            root_color: Color for root notes
-            scale_color: Color for other scale notes
+        Returns:
+            Frame with every other cell off
         """
-        # Clear all lights first
-        self.clear_all_lights()
+        frame = self.new_frame('off')
 
         # Get root note (first note in scale)
         root_note = scale_notes[0] % 12 if scale_notes else None
 
-        # Light up each note in the scale
         for note in scale_notes:
             # Use root color for root notes, scale color for others
             is_root = (note % 12) == root_note
             color = root_color if is_root else scale_color
-            self.light_note(note, color)
+            self.set_frame_note(frame, note, color)
 
-        time.sleep(0.05)  # Brief pause
+        return frame
 
-    def light_scale_with_degrees(self, scale_notes, color_map=None):
+    def light_scale(self, scale_notes, root_color='red', scale_color='blue'):
         """
-        Light up scale with different colors for different scale degrees
+        Light up all notes in a scale
+
+        Only cells whose color changes are sent, so switching scales doesn't
+        blank the grid first.
 
         Args:
             scale_notes: List of MIDI note numbers in the scale
-            color_map: Dict mapping scale degree (0-based) to color
-                      Default: {0: 'red', 2: 'yellow', 4: 'green'} (I, III, V)
+            root_color: Color for root notes
+            scale_color: Color for other scale notes
+
+        Returns:
+            FrameReport for the cells sent
+        """
+        return self.commit_frame(self.render_scale(scale_notes, root_color, scale_color))
+
+    def render_scale_with_degrees(self, scale_notes, color_map=None):
+        """
+        Render a scale with per-degree colors into an off-line frame (see light_scale_with_degrees)
+
+        Returns:
+            Frame with every other cell off
         """
         if color_map is None:
             color_map = {
@@ -193,19 +376,11 @@ class Linnstrument:
                 4: 'green',    # Fifth
             }
 
-        self.clear_all_lights()
-
-        # Group notes by their pitch class (0-11)
-        pitch_classes = {}
-        for note in scale_notes:
-            pc = note % 12
-            if pc not in pitch_classes:
-                pitch_classes[pc] = []
-            pitch_classes[pc].append(note)
+        frame = self.new_frame('off')
 
         # Determine scale degrees
         if not scale_notes:
-            return
+            return frame
 
         root_pc = scale_notes[0] % 12
         scale_pcs = sorted(set(note % 12 for note in scale_notes))
@@ -222,9 +397,23 @@ class Linnstrument:
 
             # Get color for this degree
             color = color_map.get(degree, 'blue')  # Default to blue
-            self.light_note(note, color)
+            self.set_frame_note(frame, note, color)
 
-        time.sleep(0.05)
+        return frame
+
+    def light_scale_with_degrees(self, scale_notes, color_map=None):
+        """
+        Light up scale with different colors for different scale degrees
+
+        Args:
+            scale_notes: List of MIDI note numbers in the scale
+            color_map: Dict mapping scale degree (0-based) to color
+                      Default: {0: 'red', 2: 'yellow', 4: 'green'} (I, III, V)
+
+        Returns:
+            FrameReport for the cells sent
+        """
+        return self.commit_frame(self.render_scale_with_degrees(scale_notes, color_map))
 
     @staticmethod
     def list_available_ports():
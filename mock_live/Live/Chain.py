@@ -0,0 +1,16 @@
+"""
+Mock Live.Chain
+"""
+
+from ._api import LiveObject, live_property
+
+
+class Chain(LiveObject):
+    """A rack chain (a loaded drum pad has one)"""
+
+    name = live_property('')
+    color = live_property(0)
+    devices = live_property(())
+
+    def __init__(self, name='', devices=()):
+        super().__init__(name=name, devices=list(devices))
@@ -0,0 +1,114 @@
+"""
+Mock Live.Clip
+"""
+
+from ._api import LiveObject, live_property, stats
+
+
+class Clip(LiveObject):
+    """
+    A clip; MIDI clips hold notes as (pitch, time, duration, velocity, mute) tuples
+
+    The clip loops from loop_start to loop_end (length follows them). While
+    it plays, the song advances playing_position through the loop.
+    """
+
+    _events = ('playing_status', 'notes')
+
+    name = live_property('')
+    color = live_property(0)
+    length = live_property(4.0, observable=False, readonly=True)
+    looping = live_property(True)
+    loop_start = live_property(0.0)
+    loop_end = live_property(4.0)
+    playing_position = live_property(0.0, readonly=True)
+    is_midi_clip = live_property(True, observable=False, readonly=True)
+    is_audio_clip = live_property(False, observable=False, readonly=True)
+    is_playing = live_property(False, observable=False)
+    is_triggered = live_property(False, observable=False, readonly=True)
+    is_recording = live_property(False, observable=False, readonly=True)
+
+    def __init__(self, length=4.0, color=0xFF3636, name='', notes=()):
+        super().__init__(length=length, loop_end=length, color=color, name=name)
+        self._notes = [tuple(note) for note in notes]
+        self._selected = []
+
+    def _set(self, name, value):
+        super()._set(name, value)
+        if name in ('loop_start', 'loop_end'):
+            values = self.__dict__
+            values['length'] = values.get('loop_end', 4.0) - values.get('loop_start', 0.0)
+
+    def _set_playing(self, playing):
+        if self.__dict__.get('is_playing', False) != playing:
+            self.__dict__['is_playing'] = playing
+            self._set('playing_position', self.__dict__.get('loop_start', 0.0))
+            self.notify('playing_status')
+
+    def _advance(self, beats):
+        """Move the playing position on by song time, wrapping inside the loop"""
+        start = self.__dict__.get('loop_start', 0.0)
+        length = self.__dict__['length']
+        position = self.__dict__.get('playing_position', start) + beats
+        if length > 0 and position >= start + length:
+            position = start + (position - start) % length
+        self._set('playing_position', position)
+
+    def fire(self):
+        stats.record('Clip.fire')
+        self._set_playing(True)
+
+    def stop(self):
+        stats.record('Clip.stop')
+        self._set_playing(False)
+
+    @staticmethod
+    def _in_range(note, from_time, from_pitch, time_span, pitch_span):
+        pitch, time = note[0], note[1]
+        return (from_pitch <= pitch < from_pitch + pitch_span and
+                from_time <= time < from_time + time_span)
+
+    def get_notes(self, from_time, from_pitch, time_span, pitch_span):
+        """Notes starting in the time range with pitch in the pitch range"""
+        stats.record('Clip.get_notes')
+        return tuple(note for note in self._notes
+                     if self._in_range(note, from_time, from_pitch, time_span, pitch_span))
+
+    def set_notes(self, notes):
+        """Add notes (Live's legacy API: adds, never replaces)"""
+        stats.record('Clip.set_notes')
+        self._notes.extend(tuple(note) for note in notes)
+        self.notify('notes')
+
+    def remove_notes(self, from_time, from_pitch, time_span, pitch_span):
+        stats.record('Clip.remove_notes')
+        before = len(self._notes)
+        self._notes = [note for note in self._notes
+                       if not self._in_range(note, from_time, from_pitch, time_span, pitch_span)]
+        if len(self._notes) != before:
+            self.notify('notes')
+
+    def remove_notes_extended(self, from_pitch, pitch_span, from_time, time_span):
+        """Live 11 argument order for remove_notes"""
+        self.remove_notes(from_time, from_pitch, time_span, pitch_span)
+
+    def select_all_notes(self):
+        stats.record('Clip.select_all_notes')
+        self._selected = list(self._notes)
+
+    def deselect_all_notes(self):
+        stats.record('Clip.deselect_all_notes')
+        self._selected = []
+
+    def get_selected_notes(self):
+        stats.record('Clip.get_selected_notes')
+        return tuple(self._selected)
+
+    def replace_selected_notes(self, notes):
+        """Replace the selected notes with new ones"""
+        stats.record('Clip.replace_selected_notes')
+        selected = set(self._selected)
+        self._notes = [note for note in self._notes if note not in selected]
+        self._notes.extend(tuple(note) for note in notes)
+        self._selected = []
+        self.notify('notes')
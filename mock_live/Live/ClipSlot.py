@@ -0,0 +1,53 @@
+"""
+Mock Live.ClipSlot
+"""
+
+from ._api import LiveObject, live_property, stats
+from .Clip import Clip
+
+
+class ClipSlot(LiveObject):
+    """A clip slot in a track's session column"""
+
+    _events = ('playing_status',)
+
+    clip = live_property(None, observable=False, readonly=True)
+    has_clip = live_property(False, readonly=True)
+    is_playing = live_property(False, observable=False, readonly=True)
+    is_triggered = live_property(False, observable=False, readonly=True)
+    has_stop_button = live_property(True)
+
+    def __init__(self, clip=None):
+        super().__init__()
+        if clip is not None:
+            self._set_clip(clip)
+
+    def _set_clip(self, clip):
+        self.__dict__['clip'] = clip
+        self._set('has_clip', clip is not None)
+
+    def _set_playing(self, playing):
+        """Start/stop the slot from inside the mock (notifies without counting)"""
+        clip = self.__dict__.get('clip')
+        if clip is not None:
+            clip._set_playing(playing)
+        self.notify('playing_status')
+
+    def fire(self):
+        stats.record('ClipSlot.fire')
+        self._set_playing(True)
+
+    def stop(self):
+        stats.record('ClipSlot.stop')
+        self._set_playing(False)
+
+    def create_clip(self, length):
+        """Create an empty MIDI clip (raises if the slot already has one)"""
+        stats.record('ClipSlot.create_clip')
+        if self.__dict__.get('clip') is not None:
+            raise RuntimeError("Clip slot is not empty")
+        self._set_clip(Clip(length=length))
+
+    def delete_clip(self):
+        stats.record('ClipSlot.delete_clip')
+        self._set_clip(None)
@@ -0,0 +1,31 @@
+"""
+Mock Live.Device (plus the drum rack, class_name 'DrumGroupDevice')
+"""
+
+from ._api import LiveObject, live_property
+from .DrumPad import DrumPad
+
+
+class Device(LiveObject):
+    """A device on a track"""
+
+    name = live_property('')
+    class_name = live_property('', observable=False, readonly=True)
+    is_active = live_property(True)
+    parameters = live_property((), readonly=True)
+    can_have_drum_pads = live_property(False, observable=False, readonly=True)
+
+    def __init__(self, name='Device', class_name='OriginalSimpler'):
+        super().__init__(name=name, class_name=class_name)
+
+
+class DrumGroupDevice(Device):
+    """A drum rack: 128 drum pads indexed by MIDI note"""
+
+    drum_pads = live_property((), readonly=True)
+    can_have_drum_pads = live_property(True, observable=False, readonly=True)
+
+    def __init__(self, name='Drum Rack', loaded_notes=range(36, 52)):
+        super().__init__(name=name, class_name='DrumGroupDevice')
+        loaded = set(loaded_notes)
+        self.__dict__['drum_pads'] = [DrumPad(note, note in loaded) for note in range(128)]
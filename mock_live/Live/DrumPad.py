@@ -0,0 +1,27 @@
+"""
+Mock Live.DrumPad
+"""
+
+from ._api import LiveObject, live_property
+from .Chain import Chain
+
+
+class DrumPad(LiveObject):
+    """One of a drum rack's 128 pads; loaded pads have chains"""
+
+    note = live_property(0, observable=False, readonly=True)
+    name = live_property('')
+    chains = live_property((), readonly=True)
+    mute = live_property(False)
+    solo = live_property(False)
+
+    def __init__(self, note, loaded=False):
+        super().__init__(note=note, chains=[Chain(f'Pad {note}')] if loaded else [])
+
+    def load(self, name=''):
+        """Drop a sample on the pad (adds a chain)"""
+        self._set('chains', [Chain(name or f'Pad {self.__dict__["note"]}')])
+
+    def clear(self):
+        """Remove the pad's chains"""
+        self._set('chains', [])
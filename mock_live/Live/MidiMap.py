@@ -0,0 +1,43 @@
+"""
+Mock Live.MidiMap: records forwarding requests made from build_midi_map
+"""
+
+# (kind, channel, number) for every forward/map call since the last clear()
+forwarded = []
+
+
+class MapMode:
+    absolute = 0
+    absolute_14_bit = 1
+    relative_signed_bit = 2
+    relative_binary_offset = 3
+    relative_two_compliment = 4
+
+
+def clear():
+    """Forget recorded forwards (called when the MIDI map is rebuilt)"""
+    del forwarded[:]
+
+
+def forward_midi_note(script_handle, midi_map_handle, channel, note):
+    forwarded.append(('note', channel, note))
+    return True
+
+
+def forward_midi_cc(script_handle, midi_map_handle, channel, cc):
+    forwarded.append(('cc', channel, cc))
+    return True
+
+
+def forward_midi_pitchbend(script_handle, midi_map_handle, channel):
+    forwarded.append(('pitchbend', channel, None))
+    return True
+
+
+def map_midi_cc(midi_map_handle, parameter, channel, cc, map_mode, avoid_takeover):
+    forwarded.append(('map_cc', channel, cc))
+    return True
+
+
+def send_feedback_for_parameter(midi_map_handle, parameter):
+    pass
@@ -0,0 +1,19 @@
+"""
+Mock Live.Scene
+"""
+
+from ._api import LiveObject, live_property, stats
+
+
+class Scene(LiveObject):
+    """A scene (row of clip slots)"""
+
+    name = live_property('')
+    color = live_property(0)
+    is_triggered = live_property(False, observable=False, readonly=True)
+
+    def __init__(self, name=''):
+        super().__init__(name=name)
+
+    def fire(self):
+        stats.record('Scene.fire')
@@ -0,0 +1,98 @@
+"""
+Mock Live.Song
+"""
+
+from ._api import LiveObject, live_property, stats
+
+
+class Song(LiveObject):
+    """The Live set"""
+
+    class View(LiveObject):
+        """Song.View: selection state"""
+
+        selected_track = live_property(None)
+        selected_scene = live_property(None)
+        detail_clip = live_property(None)
+
+        def __init__(self, song=None):
+            super().__init__()
+            self._song = song
+
+        @property
+        def highlighted_clip_slot(self):
+            """The selected track's slot in the selected scene (None for tracks without slots)"""
+            stats.record('Song.View.highlighted_clip_slot')
+            track = self.__dict__.get('selected_track')
+            scenes = self._song.__dict__['scenes'] if self._song is not None else []
+            clip_slots = track.__dict__.get('clip_slots', []) if track is not None else []
+            if not scenes or not clip_slots:
+                return None
+            scene = self.__dict__.get('selected_scene')
+            index = scenes.index(scene) if scene in scenes else 0
+            return clip_slots[index] if index < len(clip_slots) else None
+
+    root_note = live_property(0)
+    scale_name = live_property('Major')
+    scale_mode = live_property(True)
+    is_playing = live_property(False)
+    current_song_time = live_property(0.0)
+    tempo = live_property(120.0)
+    signature_numerator = live_property(4)
+    signature_denominator = live_property(4)
+    tracks = live_property((), readonly=True)
+    return_tracks = live_property((), readonly=True)
+    scenes = live_property((), readonly=True)
+    view = live_property(None, observable=False, readonly=True)
+
+    def __init__(self, tracks=(), scenes=()):
+        super().__init__(tracks=list(tracks), scenes=list(scenes), return_tracks=[])
+        self.__dict__['view'] = Song.View(self)
+        self._data = {}
+
+    def _set(self, name, value):
+        """Moving song time also moves the playing clips (before anyone is notified)"""
+        if name == 'current_song_time':
+            old = self.__dict__.get('current_song_time', 0.0)
+            if value > old:
+                for track in self.__dict__['tracks']:
+                    for slot in track.__dict__['clip_slots']:
+                        clip = slot.__dict__.get('clip')
+                        if clip is not None and clip.__dict__.get('is_playing', False):
+                            clip._advance(value - old)
+        super()._set(name, value)
+
+    def set_tracks(self, tracks):
+        """Replace the track list (as if tracks were added or deleted)"""
+        self._set('tracks', list(tracks))
+
+    def set_scenes(self, scenes):
+        """Replace the scene list"""
+        self._set('scenes', list(scenes))
+
+    def start_playing(self):
+        stats.record('Song.start_playing')
+        self._set('is_playing', True)
+
+    def stop_playing(self):
+        stats.record('Song.stop_playing')
+        self._set('is_playing', False)
+
+    def continue_playing(self):
+        stats.record('Song.continue_playing')
+        self._set('is_playing', True)
+
+    def stop_all_clips(self):
+        stats.record('Song.stop_all_clips')
+        for track in self.__dict__['tracks']:
+            track.stop_all_clips()
+
+    def get_data(self, key, default_value):
+        """Read a value stored with the set"""
+        stats.record('Song.get_data')
+        return self._data.get(key, default_value)
+
+    def set_data(self, key, value):
+        """Store a value with the set"""
+        stats.record('Song.set_data')
+        self._data[key] = value
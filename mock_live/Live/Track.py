@@ -0,0 +1,36 @@
+"""
+Mock Live.Track
+"""
+
+from ._api import LiveObject, live_property, stats
+from .ClipSlot import ClipSlot
+
+
+class Track(LiveObject):
+    """A track with its devices and session clip slots"""
+
+    name = live_property('')
+    color = live_property(0)
+    mute = live_property(False)
+    solo = live_property(False)
+    arm = live_property(False)
+    has_midi_input = live_property(True, observable=False, readonly=True)
+    devices = live_property((), readonly=True)
+    clip_slots = live_property((), readonly=True)
+    playing_slot_index = live_property(-1, readonly=True)
+    fired_slot_index = live_property(-1, readonly=True)
+
+    def __init__(self, name='', color=0x3C8CFF, devices=(), clip_slots=()):
+        super().__init__(name=name, color=color, devices=list(devices),
+                         clip_slots=list(clip_slots))
+
+    def set_devices(self, devices):
+        """Replace the device chain (as if the user edited it)"""
+        self._set('devices', list(devices))
+
+    def stop_all_clips(self):
+        stats.record('Track.stop_all_clips')
+        for slot in self.__dict__['clip_slots']:
+            clip = slot.__dict__.get('clip')
+            if clip is not None:
+                clip._set_playing(False)
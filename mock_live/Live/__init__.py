@@ -0,0 +1,13 @@
+"""
+Mock of Ableton Live's Python API for running the Remote Scripts off-line
+
+Models Song, Song.View, Track, ClipSlot, Clip, Scene, Device/DrumGroupDevice,
+DrumPad and listener registration. Every property access made by a script
+is counted in ``Live.stats`` and can be given a simulated cost with
+``Live.configure(latency=...)``.
+
+Not a real Live installation: put mock_live/ on sys.path only for headless runs.
+"""
+
+from . import Chain, Clip, ClipSlot, Device, DrumPad, MidiMap, Scene, Song, Track
+from ._api import configure, stats
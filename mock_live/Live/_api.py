@@ -0,0 +1,186 @@
+"""
+Shared machinery for the mock Live objects: properties, listeners, call counting and latency
+"""
+
+import time
+from collections import Counter
+
+
+class APIStats:
+    """
+    Call counting and simulated latency for every Live API access
+
+    Every property read/write and listener add/remove made by a script counts
+    as one call, keyed 'Class.name' (e.g. 'Song.root_note',
+    'ClipSlot.add_has_clip_listener'). Each call costs `latency` seconds, or the
+    per-key value in `overrides`, to model the cost of crossing into Live.
+    """
+
+    def __init__(self):
+        self.latency = 0.0
+        self.overrides = {}
+        # Live raises RuntimeError on duplicate add / unknown remove; False tolerates both
+        self.strict_listeners = True
+        self.counts = Counter()
+
+    @property
+    def total(self):
+        """Total API calls since the last reset"""
+        return sum(self.counts.values())
+
+    def reset(self):
+        """Clear the call counts (latency settings are kept)"""
+        self.counts.clear()
+
+    def record(self, key):
+        """Count one call and spend its latency"""
+        self.counts[key] += 1
+        delay = self.overrides.get(key, self.latency)
+        if delay > 0:
+            _spin(delay)
+
+
+stats = APIStats()
+
+
+def configure(latency=None, overrides=None, strict_listeners=None):
+    """
+    Configure the simulated API cost
+
+    Args:
+        latency: Seconds added to every API call (0 to disable)
+        overrides: Dict of 'Class.name' -> seconds for specific calls
+        strict_listeners: If True, duplicate/unknown listeners raise like Live does
+    """
+    if latency is not None:
+        stats.latency = latency
+    if overrides is not None:
+        stats.overrides = dict(overrides)
+    if strict_listeners is not None:
+        stats.strict_listeners = strict_listeners
+
+
+def _spin(seconds):
+    """Wait precisely (sleep is too coarse for microsecond latencies)"""
+    if seconds >= 0.002:
+        time.sleep(seconds)
+        return
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class live_property:
+    """
+    A Live object property
+
+    Script reads and writes are counted (and cost latency); writes notify the
+    property's listeners when the value changes. Mock internals update values
+    with LiveObject._set(), which notifies without counting.
+    """
+
+    def __init__(self, default=None, observable=True, readonly=False):
+        self.default = default
+        self.observable = observable
+        self.readonly = readonly
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.key = f'{owner.__qualname__}.{name}'
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        stats.record(self.key)
+        return obj.__dict__.get(self.name, self.default)
+
+    def __set__(self, obj, value):
+        if self.readonly:
+            raise AttributeError(f"can't set attribute '{self.name}'")
+        stats.record(self.key)
+        obj._set(self.name, value)
+
+
+class LiveObject:
+    """
+    Base for mock Live objects
+
+    Provides add_<name>_listener / remove_<name>_listener / <name>_has_listener
+    for every observable property and for the names in `_events`.
+    """
+
+    # Observable names that aren't properties (e.g. 'playing_status', 'notes')
+    _events = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        observable = set()
+        for klass in reversed(cls.__mro__):
+            observable.update(klass.__dict__.get('_events', ()))
+            for name, value in klass.__dict__.items():
+                if isinstance(value, live_property) and value.observable:
+                    observable.add(name)
+        cls._observable = frozenset(observable)
+
+    def __init__(self, **values):
+        self._listeners = {}
+        self.__dict__.update(values)
+
+    def __getattr__(self, name):
+        # Only called for names not found normally: the listener methods
+        if name.startswith('add_') and name.endswith('_listener'):
+            prop, action = name[4:-9], self._add_listener
+        elif name.startswith('remove_') and name.endswith('_listener'):
+            prop, action = name[7:-9], self._remove_listener
+        elif name.endswith('_has_listener'):
+            prop, action = name[:-13], self._has_listener
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        if prop not in self._observable:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        key = f'{type(self).__qualname__}.{name}'
+
+        def method(callback):
+            stats.record(key)
+            return action(prop, callback)
+
+        return method
+
+    def _add_listener(self, prop, callback):
+        callbacks = self._listeners.setdefault(prop, [])
+        if callback in callbacks:
+            if stats.strict_listeners:
+                raise RuntimeError("Listener already connected")
+            return
+        callbacks.append(callback)
+
+    def _remove_listener(self, prop, callback):
+        callbacks = self._listeners.get(prop, [])
+        if callback not in callbacks:
+            if stats.strict_listeners:
+                raise RuntimeError("Listener not connected")
+            return
+        callbacks.remove(callback)
+
+    def _has_listener(self, prop, callback):
+        return callback in self._listeners.get(prop, [])
+
+    def _set(self, name, value):
+        """Update a property from inside the mock, notifying listeners on change"""
+        old = self.__dict__.get(name, getattr(type(self), name).default)
+        self.__dict__[name] = value
+        if old is not value and old != value:
+            self.notify(name)
+
+    def notify(self, name):
+        """Fire every listener registered for a property or event"""
+        for callback in list(self._listeners.get(name, ())):
+            callback()
+
+    def listener_count(self, name=None):
+        """Number of listeners registered (for one property, or all)"""
+        if name is not None:
+            return len(self._listeners.get(name, ()))
+        return sum(len(callbacks) for callbacks in self._listeners.values())
@@ -0,0 +1,68 @@
+"""
+Mock _Framework.ControlSurface
+"""
+
+
+class ControlSurface:
+    """
+    Base class for Remote Scripts
+
+    Live calls build_midi_map, receive_midi and update_display (about every
+    100 ms); scheduled messages run from update_display, so subclasses that
+    override it must call ControlSurface.update_display to keep them running.
+    """
+
+    def __init__(self, c_instance):
+        self._c_instance = c_instance
+        self._scheduled = []
+
+    def song(self):
+        return self._c_instance.song()
+
+    def log_message(self, *message):
+        self._c_instance.log_message(' '.join(str(part) for part in message))
+
+    def show_message(self, message):
+        self._c_instance.show_message(message)
+
+    def request_rebuild_midi_map(self):
+        self._c_instance.request_rebuild_midi_map()
+
+    def schedule_message(self, delay_in_ticks, callback, parameter=None):
+        """Call callback (with parameter, if given) after delay_in_ticks display ticks"""
+        self._scheduled.append([delay_in_ticks, callback, parameter])
+
+    def update_display(self):
+        due = [task for task in self._scheduled if task[0] <= 1]
+        for task in self._scheduled:
+            task[0] -= 1
+        self._scheduled = [task for task in self._scheduled if task[0] > 0]
+        for _, callback, parameter in due:
+            if parameter is None:
+                callback()
+            else:
+                callback(parameter)
+
+    def build_midi_map(self, midi_map_handle):
+        pass
+
+    def receive_midi(self, midi_bytes):
+        pass
+
+    def refresh_state(self):
+        pass
+
+    def connect_script_instances(self, instanciated_scripts):
+        pass
+
+    def can_lock_to_devices(self):
+        return False
+
+    def suggest_input_port(self):
+        return ''
+
+    def suggest_output_port(self):
+        return ''
+
+    def disconnect(self):
+        self._scheduled = []
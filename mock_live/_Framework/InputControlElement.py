@@ -0,0 +1,32 @@
+"""
+Mock _Framework.InputControlElement: MIDI type and status constants
+"""
+
+MIDI_NOTE_TYPE = 0
+MIDI_CC_TYPE = 1
+MIDI_PB_TYPE = 2
+MIDI_SYSEX_TYPE = 3
+MIDI_INVALID_TYPE = 4
+
+MIDI_NOTE_ON_STATUS = 144
+MIDI_NOTE_OFF_STATUS = 128
+MIDI_CC_STATUS = 176
+MIDI_PB_STATUS = 224
+
+
+class InputControlElement:
+    """Placeholder for scripts that subclass or type-check control elements"""
+
+    def __init__(self, msg_type, channel, identifier, *args, **kwargs):
+        self._msg_type = msg_type
+        self._msg_channel = channel
+        self._msg_identifier = identifier
+
+    def message_type(self):
+        return self._msg_type
+
+    def message_channel(self):
+        return self._msg_channel
+
+    def message_identifier(self):
+        return self._msg_identifier
@@ -0,0 +1,3 @@
+"""
+Mock of Live's _Framework package (only what the Remote Scripts import)
+"""
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Run an Ableton Remote Script off-line against the mock Live API
+
+Loads a script package from ableton_remote_script/, drives it through a
+scripted sequence of events (scale changes, track selection, pad presses,
+transport, display ticks) and reports the MIDI it sent, the Live API calls
+it made and where the time went.
+
+Usage:
+    python mock_live/remote_script_harness.py Linnstrument128
+    python mock_live/remote_script_harness.py Linnstrument200 --latency 0.00005 --profile
+    python mock_live/remote_script_harness.py Linnstrument --events session.json
+
+An events file is a JSON list of [action, arg, ...] entries, where action is
+a ScriptHarness method, e.g. [["set_scale", 6, "Dorian"], ["tick", 10]].
+"""
+
+import argparse
+import cProfile
+import importlib
+import io
+import json
+import os
+import pstats
+import sys
+import time
+
+MOCK_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(os.path.dirname(MOCK_DIR), 'ableton_remote_script')
+
+if MOCK_DIR not in sys.path:
+    sys.path.insert(0, MOCK_DIR)
+
+import Live
+from Live.ClipSlot import ClipSlot
+from Live.Clip import Clip
+from Live.Device import DrumGroupDevice
+from Live.Scene import Scene
+from Live.Song import Song
+from Live.Track import Track
+
+# Events run when no events file is given
+DEFAULT_EVENTS = [
+    ['set_scale', 6, 'Dorian'],
+    ['tick', 5],
+    ['select_track', -1],
+    ['tick', 5],
+    ['note', 41],
+    ['note', 46],
+    ['tick', 5],
+    ['play'],
+    ['advance', 4.0],
+    ['stop'],
+    ['select_track', 0],
+    ['set_scale', 0, 'Major'],
+    ['tick', 5],
+]
+
+
+def make_song(track_count=8, scene_count=8, drum_track=True, clip_every=3,
+              loaded_pads=range(36, 52)):
+    """
+    Build a Live set to drive a script with
+
+    Args:
+        track_count: Number of instrument tracks
+        scene_count: Number of scenes (clip slots per track)
+        drum_track: If True, append a 'Drums' track holding a drum rack
+        clip_every: Every Nth clip slot holds a clip (staggered from track to track)
+        loaded_pads: MIDI notes of the drum rack pads that have samples
+
+    Returns:
+        Live.Song.Song with the first track selected
+    """
+    def clip_slots(track_index):
+        return [ClipSlot(Clip() if (scene + track_index) % clip_every == 0 else None)
+                for scene in range(scene_count)]
+
+    tracks = [Track(f'Track {i + 1}', clip_slots=clip_slots(i)) for i in range(track_count)]
+    if drum_track:
+        tracks.append(Track('Drums', color=0xFF9933,
+                            devices=[DrumGroupDevice(loaded_notes=loaded_pads)],
+                            clip_slots=clip_slots(track_count)))
+
+    song = Song(tracks=tracks, scenes=[Scene(f'Scene {i + 1}') for i in range(scene_count)])
+    song.view._set('selected_track', tracks[0])
+    return song
+
+
+class MockCInstance:
+    """Stand-in for the c_instance Live hands to create_instance"""
+
+    def __init__(self, song, record=False, echo_log=False):
+        """
+        Args:
+            song: Live.Song.Song returned by song()
+            record: If True, keep every sent MIDI message in `sent`
+            echo_log: If True, print log_message output
+        """
+        self._song = song
+        self.record = record
+        self.echo_log = echo_log
+        self.sent = []
+        self.log = []
+        self.status = []
+        self.rebuild_requests = 0
+        self.messages = 0
+        self.bytes = 0
+
+    def reset(self):
+        """Clear the MIDI counters and recordings"""
+        self.messages = 0
+        self.bytes = 0
+        self.sent = []
+
+    def song(self):
+        return self._song
+
+    def handle(self):
+        return 1
+
+    def send_midi(self, midi_bytes):
+        self.messages += 1
+        self.bytes += len(midi_bytes)
+        if self.record:
+            self.sent.append(tuple(midi_bytes))
+
+    def log_message(self, message):
+        self.log.append(message)
+        if self.echo_log:
+            print(message)
+
+    def show_message(self, message):
+        self.status.append(message)
+
+    def request_rebuild_midi_map(self):
+        self.rebuild_requests += 1
+
+
+class ScriptHarness:
+    """
+    A loaded Remote Script plus the mock set it runs in
+
+    Each public method is one scripted event; run() plays a list of them.
+    """
+
+    def __init__(self, package, song=None, record=False, echo_log=False):
+        """
+        Load a Remote Script package and create its instance
+
+        Args:
+            package: Package name under ableton_remote_script/ (e.g. 'Linnstrument128')
+            song: Live set to use (default: make_song())
+            record: Record every MIDI message sent (see MockCInstance)
+            echo_log: Print the script's log messages
+        """
+        if SCRIPTS_DIR not in sys.path:
+            sys.path.insert(0, SCRIPTS_DIR)
+
+        self.song = song if song is not None else make_song()
+        self.c_instance = MockCInstance(self.song, record=record, echo_log=echo_log)
+        self.ticks = 0
+
+        module = importlib.import_module(package)
+        self.script = module.create_instance(self.c_instance)
+        self.rebuild_midi_map()
+
+    def rebuild_midi_map(self):
+        """Have the script rebuild its MIDI map (as Live does after loading)"""
+        Live.MidiMap.clear()
+        self.script.build_midi_map(1)
+
+    def tick(self, count=1):
+        """Call update_display count times"""
+        for _ in range(count):
+            self.script.update_display()
+            self.ticks += 1
+            if self.c_instance.rebuild_requests:
+                self.c_instance.rebuild_requests = 0
+                self.rebuild_midi_map()
+
+    def midi(self, *midi_bytes):
+        """Deliver raw MIDI to the script"""
+        self.script.receive_midi(tuple(midi_bytes))
+
+    def note(self, note, velocity=100, channel=0):
+        """Press and release a pad"""
+        self.midi(0x90 | channel, note, velocity)
+        self.midi(0x80 | channel, note, 0)
+
+    def note_on(self, note, velocity=100, channel=0):
+        self.midi(0x90 | channel, note, velocity)
+
+    def note_off(self, note, channel=0):
+        self.midi(0x80 | channel, note, 0)
+
+    def cc(self, control, value, channel=0):
+        self.midi(0xB0 | channel, control, value)
+
+    def set_scale(self, root, scale_name):
+        """Change the set's root note and scale (two notifications, like Live)"""
+        self.song._set('root_note', root)
+        self.song._set('scale_name', scale_name)
+
+    def select_track(self, index):
+        """Select a track by index (negative counts from the end)"""
+        self.song.view._set('selected_track', self.song.__dict__['tracks'][index])
+
+    def fire_clip(self, track_index, scene_index):
+        self.song.__dict__['tracks'][track_index].__dict__['clip_slots'][scene_index]._set_playing(True)
+
+    def play(self):
+        self.song._set('is_playing', True)
+
+    def stop(self):
+        self.song._set('is_playing', False)
+
+    def advance(self, beats, resolution=0.0625, ticks_per_beat=5):
+        """
+        Move the song position forward, notifying current_song_time at each step
+
+        Args:
+            beats: Beats to advance
+            resolution: Beats between current_song_time notifications
+            ticks_per_beat: update_display calls per beat
+        """
+        steps = int(round(beats / resolution))
+        tick_every = max(1, int(round(1 / (resolution * ticks_per_beat))))
+        start = self.song.__dict__.get('current_song_time', 0.0)
+        for step in range(1, steps + 1):
+            self.song._set('current_song_time', start + step * resolution)
+            if step % tick_every == 0:
+                self.tick()
+
+    def disconnect(self):
+        self.script.disconnect()
+
+    def run(self, events):
+        """
+        Play a list of events
+
+        Args:
+            events: Iterable of [action, arg, ...] where action is a method name
+        """
+        for event in events:
+            action, args = event[0], event[1:]
+            if action.startswith('_') or action in ('run', 'profile'):
+                raise ValueError(f"Not an event: {action}")
+            getattr(self, action)(*args)
+
+    def profile(self, events):
+        """
+        Play events under cProfile
+
+        Returns:
+            pstats.Stats for the run
+        """
+        profiler = cProfile.Profile()
+        profiler.runcall(self.run, events)
+        return pstats.Stats(profiler, stream=io.StringIO())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Drive a Remote Script with the mock Live API')
+    parser.add_argument('package', help='Script package under ableton_remote_script/')
+    parser.add_argument('--events', help='JSON file with a list of [action, arg, ...] events')
+    parser.add_argument('--tracks', type=int, default=8, help='Instrument tracks in the set')
+    parser.add_argument('--scenes', type=int, default=8, help='Scenes in the set')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Simulated seconds per Live API call')
+    parser.add_argument('--profile', action='store_true', help='Profile the event run')
+    parser.add_argument('--top', type=int, default=15, help='Rows of calls/profile to print')
+    parser.add_argument('--log', action='store_true', help="Print the script's log messages")
+    args = parser.parse_args()
+
+    events = DEFAULT_EVENTS
+    if args.events:
+        with open(args.events) as f:
+            events = json.load(f)
+
+    Live.configure(latency=args.latency)
+    harness = ScriptHarness(args.package, make_song(args.tracks, args.scenes), echo_log=args.log)
+
+    harness.c_instance.reset()
+    Live.stats.reset()
+
+    start = time.perf_counter()
+    if args.profile:
+        profile = harness.profile(events)
+    else:
+        harness.run(events)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.package}: {len(events)} events in {elapsed * 1000:.1f} ms")
+    print(f"  MIDI sent:      {harness.c_instance.messages} messages, {harness.c_instance.bytes} bytes")
+    print(f"  Live API calls: {Live.stats.total}")
+    for key, count in Live.stats.counts.most_common(args.top):
+        print(f"    {count:>7}  {key}")
+
+    if args.profile:
+        profile.stream = sys.stdout
+        print()
+        profile.sort_stats('cumulative').print_stats(args.top)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())